@@ -1,93 +1,495 @@
-from fastapi import APIRouter, UploadFile, File, Form
-from typing import List
+import asyncio
+import itertools
+import json
+import time
 
-from app.services.resume_parser import extract_text_from_pdf
-from app.services.llm_explainer import evaluate_candidate
-from app.services.scoring_engine import calculate_final_score
+from fastapi import (
+    APIRouter, Body, UploadFile, File, Form, HTTPException, Query
+)
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from app.config import get_settings
+from app.models.schemas import (
+    PoolBatchSearchResponse,
+    PoolIngestResponse,
+    PoolSearchResponse,
+    ScoringWeightsRequest,
+)
+from app.services.archive import ArchiveError, ResumeArchive
+from app.services.candidate_store import get_candidate_store
+from app.services.dedup import batch_deduplicator
+from app.services.job_queue import get_job_queue
+from app.services.ranking import TopKRanking
+from app.services.pipeline import (
+    UNREADABLE_EXPLANATION,
+    analyze_batch,
+    extract_resume,
+    iter_analysis,
+    rescore_results,
+)
+from app.services.result_store import get_result_store
+from app.services.scoring_engine import ScoringWeights, default_weights
 
 router = APIRouter()
 
 
+def _scoring_weights(
+    overrides: Optional[Dict],
+    base: Optional[ScoringWeights] = None
+) -> ScoringWeights:
+    try:
+        return (base or default_weights()).with_overrides(overrides)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+def _parse_weights_form(weights: Optional[str]) -> ScoringWeights:
+    """
+    `weights` form field: JSON object of ScoringWeightsRequest fields.
+    """
+    if not weights:
+        return default_weights()
+
+    try:
+        request = ScoringWeightsRequest.model_validate_json(weights)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors())
+
+    return _scoring_weights(request.model_dump(exclude_none=True))
+
+
+def _check_file_count(count: int, limit: Optional[int] = None) -> None:
+    limit = limit or get_settings().MAX_FILES_PER_REQUEST
+    if count > limit:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many files: {count} (limit {limit} per request)"
+        )
+
+
+def _collapse_duplicates() -> bool:
+    return get_settings().DEDUP_RESULTS == "collapse"
+
+
+async def _resume_sources(
+    resumes: Optional[List[UploadFile]],
+    archive: Optional[UploadFile]
+) -> Tuple[Iterable[UploadFile], int, Optional[ResumeArchive]]:
+    """
+    Uploaded resumes, followed by the entries of an optional ZIP
+    archive (opened lazily). Returns (sources, total, archive).
+    """
+
+    resumes = resumes or []
+    _check_file_count(len(resumes))
+    opened = None
+
+    if archive is not None:
+        try:
+            opened = await run_in_threadpool(ResumeArchive, archive)
+        except ArchiveError as e:
+            raise HTTPException(status_code=e.status_code, detail=str(e))
+
+    if not resumes and opened is None:
+        raise HTTPException(
+            status_code=422, detail="Upload resumes or a ZIP archive"
+        )
+
+    if opened is None:
+        return resumes, len(resumes), None
+
+    return (
+        itertools.chain(resumes, opened.uploads()),
+        len(resumes) + len(opened),
+        opened
+    )
+
+
 @router.post("/analyze")
 async def analyze_resumes(
     job_description: str = Form(...),
-    resumes: List[UploadFile] = File(...)
+    resumes: Optional[List[UploadFile]] = File(None),
+    archive: Optional[UploadFile] = File(None),
+    weights: Optional[str] = Form(None),
+    top_k: Optional[int] = Form(None, ge=1),
+    min_score: Optional[int] = Form(None, ge=0, le=100),
+    explain: bool = Form(True)
 ):
     """
     Analyze multiple resumes against a job description
     using Gemini LLM + deterministic scoring engine.
+
+    Text extraction and scoring run in worker pools,
+    so the event loop stays responsive during large batches.
+    Resumes may be PDF, DOCX, HTML or plain text (detected from
+    the file content, not the name).
+
+    Per-candidate features are stored under `result_set_id`;
+    POST /results/{result_set_id}/rescore re-scores them with
+    new weights without re-uploading.
+
+    With `top_k` and/or `min_score`, only the best candidates are
+    returned, ranked by score. Candidates that cannot make the cut
+    are scored from their features only (no explanation is built).
+    Their features are still stored, so a re-score can rank them –
+    except for candidates ruled out by JD skill overlap alone: they
+    are never segmented, so they are left out of the stored result
+    set (counted under "unstored") and a re-score never sees them.
+
+    `archive`: a ZIP of resumes, processed entry by entry (in addition
+    to or instead of `resumes`). Rejected entries are listed under
+    "archive" in the response.
+
+    Every result carries a numeric "breakdown" (score components,
+    bonus / penalty, matched skill positions). `explain=false` leaves
+    out the text explanation, which is otherwise rendered per result.
     """
 
     job_description = job_description.strip()
-    results = []
-
-    for resume in resumes:
-        candidate_name = resume.filename or "Unknown Candidate"
-
-        # ✅ FIX: pass UploadFile, not resume.file
-        resume_text = extract_text_from_pdf(resume)
-
-        # 🔒 Hard safety fallback
-        if not resume_text or not resume_text.strip():
-            results.append({
-                "candidate_name": candidate_name,
-                "final_score": 0,
-                "verdict": "Poor Match",
-                "strengths": [],
-                "gaps": [],
-                "explanation": "Resume text could not be extracted from the PDF."
-            })
-            continue
-
-        # 2️⃣ LLM Evaluation (Gemini or fallback)
-        gemini_result = evaluate_candidate(
-            job_description=job_description,
-            resume_text=resume_text
+    scoring_weights = _parse_weights_form(weights)
+    dedup = batch_deduplicator()
+    collapse = _collapse_duplicates()
+    sources, total, opened = await _resume_sources(resumes, archive)
+
+    ranking = None
+    if top_k is not None or min_score is not None:
+        ranking = TopKRanking(
+            top_k, min_score, include_duplicates=not collapse
         )
 
-        # 🔒 Normalize LLM output (VERY IMPORTANT)
-        normalized_llm = {
-            "match_score": int(
-                max(0, min(100, gemini_result.get("match_score", 0)))
-            ),
-            "strengths": (
-                gemini_result.get("strengths")
-                if isinstance(gemini_result.get("strengths"), list)
-                else []
-            ),
-            "gaps": (
-                gemini_result.get("gaps")
-                if isinstance(gemini_result.get("gaps"), list)
-                else []
-            ),
-            "summary": (
-                gemini_result.get("summary")
-                if isinstance(gemini_result.get("summary"), str)
-                else "LLM-based evaluation completed."
-            )
+    try:
+        results, features = await analyze_batch(
+            job_description, sources, scoring_weights, dedup, ranking
+        )
+    finally:
+        if opened is not None:
+            opened.close()
+
+    rows = list(zip(results, features))
+    if collapse:
+        rows = [(r, f) for r, f in rows if r.duplicate_of is None]
+
+    # pruned on skill overlap alone: no features to re-score from
+    unstored = sum(1 for r, f in rows if r.pruned and f is None)
+    stored_rows = [
+        (r.candidate_name, f) for r, f in rows
+        if not (r.pruned and f is None)
+    ]
+
+    result_set_id = await run_in_threadpool(
+        get_result_store().save,
+        job_description,
+        scoring_weights.to_dict(),
+        stored_rows
+    )
+
+    returned = ranking.ranked() if ranking else [r for r, _ in rows]
+
+    response = {
+        "total_candidates": total,
+        "result_set_id": result_set_id,
+        "results": [r.to_dict(explain) for r in returned],
+        "duplicate_groups": dedup.groups() if dedup else []
+    }
+
+    if ranking is not None:
+        response.update(
+            top_k=top_k,
+            min_score=min_score,
+            pruned=ranking.pruned,
+            unstored=unstored
+        )
+
+    if opened is not None:
+        response["archive"] = opened.summary()
+
+    return response
+
+
+@router.post("/analyze/stream")
+async def analyze_resumes_stream(
+    job_description: str = Form(...),
+    resumes: Optional[List[UploadFile]] = File(None),
+    archive: Optional[UploadFile] = File(None),
+    weights: Optional[str] = Form(None),
+    explain: bool = Form(True)
+):
+    """
+    Streaming variant of /analyze (NDJSON, one JSON object per line).
+
+    - {"type": "result", "index": i, "result": {...}} per resume,
+      emitted as soon as it is scored (completion order;
+      "index" is the upload position)
+    - {"type": "duplicate", "index": i, "candidate_name": ...,
+       "duplicate_of": ...} instead of a result for collapsed copies
+    - {"type": "summary", ...} as the final line
+      (includes the result_set_id used for re-scoring,
+      the duplicate groups and, for `archive` uploads,
+      the rejected archive entries)
+
+    `explain=false` leaves out each result's text explanation.
+    """
+
+    job_description = job_description.strip()
+    scoring_weights = _parse_weights_form(weights)
+    dedup = batch_deduplicator()
+    collapse = _collapse_duplicates()
+    sources, total, opened = await _resume_sources(resumes, archive)
+
+    async def frames() -> AsyncIterator[str]:
+        try:
+            async for frame in analysis_frames():
+                yield frame
+        finally:
+            if opened is not None:
+                opened.close()
+
+    async def analysis_frames() -> AsyncIterator[str]:
+        started = time.perf_counter()
+        processed = 0
+        unreadable = 0
+        stored: Dict[int, Tuple] = {}
+
+        async for index, result, features in iter_analysis(
+            job_description, sources, scoring_weights, dedup
+        ):
+            processed += 1
+
+            if collapse and result.duplicate_of is not None:
+                yield json.dumps({
+                    "type": "duplicate",
+                    "index": index,
+                    "candidate_name": result.candidate_name,
+                    "duplicate_of": result.duplicate_of
+                }) + "\n"
+                continue
+
+            unreadable += result.explanation == UNREADABLE_EXPLANATION
+            stored[index] = (result.candidate_name, features)
+
+            yield json.dumps({
+                "type": "result",
+                "index": index,
+                "result": result.to_dict(explain)
+            }) + "\n"
+
+        result_set_id = await run_in_threadpool(
+            get_result_store().save,
+            job_description,
+            scoring_weights.to_dict(),
+            [stored[index] for index in sorted(stored)]
+        )
+
+        summary = {
+            "type": "summary",
+            "result_set_id": result_set_id,
+            "total_candidates": total,
+            "processed": processed,
+            "unreadable": unreadable,
+            "duplicate_groups": dedup.groups() if dedup else [],
+            "elapsed_ms": int((time.perf_counter() - started) * 1000)
         }
+        if opened is not None:
+            summary["archive"] = opened.summary()
+
+        yield json.dumps(summary) + "\n"
 
-        # 3️⃣ Deterministic scoring engine (final authority)
-        final_result = calculate_final_score(
-            gemini_result=normalized_llm,
-            resume_text=resume_text,
-            job_description=job_description
+    return StreamingResponse(
+        frames(),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/results/{result_set_id}/rescore")
+async def rescore_result_set(
+    result_set_id: str,
+    weights: Optional[ScoringWeightsRequest] = Body(default=None),
+    top_k: Optional[int] = Query(None, ge=1),
+    min_score: Optional[int] = Query(None, ge=0, le=100),
+    explain: bool = Query(True)
+):
+    """
+    Re-score a stored /analyze result set with different weights or
+    thresholds. Uses the persisted per-candidate features only:
+    no upload, no PDF parsing, no skill matching.
+
+    Omitted fields keep the weights the set was scored with.
+    `top_k` / `min_score` return only the best candidates, ranked.
+    `explain=false` leaves out the text explanations.
+    """
+
+    result_set = await run_in_threadpool(
+        get_result_store().load, result_set_id
+    )
+
+    if result_set is None:
+        raise HTTPException(status_code=404, detail="Result set not found")
+
+    try:
+        stored_weights = ScoringWeights.from_dict(result_set.weights)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Stored weights of this result set are invalid: {e}"
         )
 
-        # 🔒 Final response safety
-        results.append({
-            "candidate_name": candidate_name,
-            "final_score": int(final_result.get("final_score", 0)),
-            "verdict": final_result.get("verdict", "Needs Review"),
-            "strengths": final_result.get("strengths", []),
-            "gaps": final_result.get("gaps", []),
-            "explanation": final_result.get(
-                "explanation",
-                "Candidate evaluated successfully."
-            )
-        })
+    scoring_weights = _scoring_weights(
+        weights.model_dump(exclude_none=True) if weights else None,
+        base=stored_weights
+    )
+
+    results = await run_in_threadpool(
+        rescore_results,
+        result_set.names,
+        result_set.features,
+        scoring_weights,
+        top_k,
+        min_score
+    )
 
     return {
-        "total_candidates": len(resumes),
+        "total_candidates": len(result_set.names),
+        "result_set_id": result_set_id,
+        "weights": scoring_weights.to_dict(),
+        "results": [r.to_dict(explain) for r in results]
+    }
+
+
+@router.post("/candidates", response_model=PoolIngestResponse)
+async def ingest_candidates(
+    resumes: List[UploadFile] = File(...)
+):
+    """
+    Parse resumes once and add them to the persistent candidate pool
+    (text, skills, years and embedding vector).
+    Resumes already in the pool (same PDF bytes) are skipped.
+    """
+
+    _check_file_count(len(resumes))
+
+    extracted = await asyncio.gather(
+        *(extract_resume(resume) for resume in resumes)
+    )
+
+    items = [
+        (resume.filename or "Unknown Candidate", content_hash, text)
+        for resume, (content_hash, text) in zip(resumes, extracted)
+        if content_hash and text
+    ]
+
+    store = get_candidate_store()
+    counts = await run_in_threadpool(store.add_many, items)
+
+    return {
+        "received": len(resumes),
+        "added": counts["added"],
+        "duplicates": counts["duplicates"],
+        "near_duplicates": counts["near_duplicates"],
+        "failed": len(resumes) - len(items),
+        "pool_size": len(store),
+    }
+
+
+@router.post("/candidates/search", response_model=PoolSearchResponse)
+async def search_candidates(
+    job_description: str = Form(...),
+    top_k: int = Form(20, ge=1, le=500),
+    min_skill_overlap: int = Form(1, ge=0)
+):
+    """
+    Rank the stored candidate pool against a job description.
+    No PDFs are touched: skill prefilter + vector ranking only.
+    """
+
+    store = get_candidate_store()
+    results = await run_in_threadpool(
+        store.search,
+        job_description.strip(),
+        top_k,
+        min_skill_overlap
+    )
+
+    return {
+        "pool_size": len(store),
         "results": results
-    }
\ No newline at end of file
+    }
+
+
+@router.post(
+    "/candidates/search/batch",
+    response_model=PoolBatchSearchResponse
+)
+async def search_candidates_batch(
+    job_descriptions: List[str] = Form(...),
+    top_k: int = Form(20, ge=1, le=500),
+    min_skill_overlap: int = Form(1, ge=0)
+):
+    """
+    Rank the stored candidate pool against several job descriptions
+    at once (repeat the job_descriptions field once per role).
+    """
+
+    store = get_candidate_store()
+    results = await run_in_threadpool(
+        store.search_many,
+        [jd.strip() for jd in job_descriptions],
+        top_k,
+        min_skill_overlap
+    )
+
+    return {
+        "pool_size": len(store),
+        "results": results
+    }
+
+
+@router.post("/jobs", status_code=202)
+async def submit_job(
+    job_description: str = Form(...),
+    resumes: List[UploadFile] = File(...)
+):
+    """
+    Queue a bulk screening job and return its id immediately.
+    Poll /jobs/{job_id} for progress and /jobs/{job_id}/results
+    for (partial) results.
+    """
+
+    # bulk submissions are spooled to disk: a higher limit than /analyze
+    _check_file_count(len(resumes), get_settings().MAX_FILES_PER_JOB)
+
+    job_id = await run_in_threadpool(
+        get_job_queue().submit,
+        job_description.strip(),
+        resumes
+    )
+
+    return {
+        "job_id": job_id,
+        "total_candidates": len(resumes),
+        "status_url": f"/jobs/{job_id}",
+        "results_url": f"/jobs/{job_id}/results",
+    }
+
+
+@router.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    status = await run_in_threadpool(get_job_queue().status, job_id)
+
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return status
+
+
+@router.get("/jobs/{job_id}/results")
+async def job_results(job_id: str):
+    results = await run_in_threadpool(get_job_queue().results, job_id)
+
+    if results is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return results
\ No newline at end of file
@@ -0,0 +1,116 @@
+"""
+Batch screening without HTTP.
+
+Screens every resume in the given directories / globs against one
+or more job description files and appends the rows to a CSV file or
+a Parquet dataset directory. Progress is checkpointed, so re-running
+the same command after an interruption continues where it stopped.
+
+Usage (from backend/):
+    python -m app.cli resumes/ --jd jobs/backend.txt --output results.csv
+    python -m app.cli "pool/**/*.pdf" --jd a.txt --jd b.txt \\
+        --output results.parquet --workers 8
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from pydantic import ValidationError
+
+from app.models.schemas import ScoringWeightsRequest
+from app.services.batch_runner import load_job_descriptions, run_batch
+from app.services.scoring_engine import ScoringWeights, default_weights
+
+
+def _load_weights(path: Optional[str]) -> ScoringWeights:
+    """
+    --weights: JSON file of ScoringWeightsRequest fields.
+    """
+    if not path:
+        return default_weights()
+
+    with open(path, encoding="utf-8") as f:
+        request = ScoringWeightsRequest.model_validate_json(f.read())
+
+    return default_weights().with_overrides(
+        request.model_dump(exclude_none=True)
+    )
+
+
+def _progress(done: int, total: int) -> None:
+    print(f"[Batch] {done}/{total} resumes", file=sys.stderr, flush=True)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli",
+        description=__doc__.split("\n\n")[0].strip()
+    )
+    parser.add_argument(
+        "inputs", nargs="+",
+        help="Resume directories (recursive) or glob patterns"
+    )
+    parser.add_argument(
+        "--jd", action="append", required=True, metavar="FILE",
+        help="Job description text file (repeat for several)"
+    )
+    parser.add_argument(
+        "--output", required=True,
+        help="CSV file, or Parquet dataset directory (*.parquet)"
+    )
+    parser.add_argument("--format", choices=["csv", "parquet"])
+    parser.add_argument("--weights", metavar="FILE", help="Scoring weights JSON")
+    parser.add_argument(
+        "--workers", type=int, default=0,
+        help="Worker processes (default: PDF_WORKERS / CPU count)"
+    )
+    parser.add_argument(
+        "--flush-every", type=int, default=100,
+        help="Resumes per output flush + checkpoint"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        help="Checkpoint file (default: <output>.checkpoint)"
+    )
+    parser.add_argument(
+        "--restart", action="store_true",
+        help="Discard previous output and checkpoint"
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    try:
+        jobs = load_job_descriptions(args.jd)
+        weights = _load_weights(args.weights)
+
+        summary = run_batch(
+            args.inputs,
+            jobs,
+            args.output,
+            weights,
+            fmt=args.format,
+            checkpoint_path=args.checkpoint,
+            workers=args.workers or None,
+            flush_every=max(1, args.flush_every),
+            restart=args.restart,
+            progress=_progress,
+        )
+
+    except KeyboardInterrupt:
+        print("[Batch] Interrupted – re-run to resume", file=sys.stderr)
+        return 130
+    except (OSError, ValueError, ValidationError, RuntimeError) as e:
+        print(f"[Batch] {e}", file=sys.stderr)
+        return 2
+
+    print(json.dumps(summary._asdict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
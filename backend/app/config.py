@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -46,20 +46,338 @@ class Settings(BaseSettings):
         default=None,
         description="Google Gemini API key"
     )
+    LLM_BACKEND: Literal["none", "gemini", "fake"] = Field(
+        default="none",
+        description="none = deterministic only, fake = local stand-in for tests"
+    )
+    LLM_MODEL: str = Field(default="gemini-2.0-flash")
+    LLM_MAX_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="LLM calls in flight at once (per worker process)"
+    )
+    LLM_BATCH_SIZE: int = Field(
+        default=5,
+        ge=1,
+        description="Resumes evaluated per LLM prompt"
+    )
+    LLM_BATCH_WAIT_MS: int = Field(
+        default=50,
+        ge=0,
+        description="How long a partial batch waits for more resumes"
+    )
+    LLM_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Per-call timeout; timed-out resumes use the fallback"
+    )
+    LLM_CACHE_SIZE: int = Field(
+        default=4096,
+        ge=0,
+        description="Cached LLM evaluations (JD hash, resume hash, prompt)"
+    )
+    LLM_MAX_RESUME_CHARS: int = Field(
+        default=6000,
+        ge=500,
+        description="Resume text sent to the LLM is cut to this length"
+    )
+    LLM_FAKE_LATENCY_MS: int = Field(
+        default=200,
+        ge=0,
+        description="Simulated round trip of the fake backend"
+    )
+
+    # ===============================
+    # EMBEDDINGS
+    # ===============================
+    EMBEDDING_BACKEND: Literal["auto", "gemini", "local", "none"] = Field(
+        default="auto",
+        description="auto = Gemini if a key is set, else local hashing"
+    )
+    EMBEDDING_MODEL: str = Field(default="models/embedding-001")
+    EMBEDDING_DIM: int = Field(
+        default=1024,
+        ge=16,
+        description="Vector size of the local embedding backend"
+    )
+    EMBEDDING_CACHE_SIZE: int = Field(
+        default=2048,
+        ge=0,
+        description="Max cached embeddings (keyed by text hash)"
+    )
 
     # ===============================
     # FILE UPLOAD LIMITS
     # ===============================
     MAX_FILE_SIZE_MB: int = Field(default=5)
     ALLOWED_RESUME_TYPES: List[str] = Field(
-        default_factory=lambda: ["application/pdf"]
+        default_factory=lambda: [
+            "application/pdf",
+            "application/vnd.openxmlformats-officedocument"
+            ".wordprocessingml.document",
+            "text/html",
+            "text/plain",
+        ],
+        description="Accepted formats (sniffed from content, not the name)"
+    )
+    INGEST_MODE: Literal["memory", "disk"] = Field(
+        default="memory",
+        description="Parse uploads from memory or via temp files"
+    )
+    INGEST_MEMORY_LIMIT_MB: int = Field(
+        default=2,
+        ge=0,
+        description="Uploads larger than this fall back to a temp file"
+                    " (keep below MAX_FILE_SIZE_MB)"
+    )
+
+    # ===============================
+    # ARCHIVE (ZIP) UPLOADS
+    # ===============================
+    ARCHIVE_MAX_ENTRIES: int = Field(
+        default=5000,
+        ge=1,
+        description="Max files in one ZIP archive"
+    )
+    ARCHIVE_MAX_TOTAL_MB: int = Field(
+        default=1024,
+        ge=1,
+        description="Max total uncompressed size of one ZIP archive"
+    )
+    ARCHIVE_MAX_RATIO: int = Field(
+        default=100,
+        ge=1,
+        description="Max uncompressed/compressed ratio per entry (zip bombs)"
+    )
+
+    # ===============================
+    # ADMISSION CONTROL (BACKPRESSURE)
+    # ===============================
+    ADMISSION_ENABLED: bool = Field(
+        default=True,
+        description="Budget and per-client fairness for upload endpoints"
+    )
+    ADMISSION_PATHS: List[str] = Field(
+        default_factory=lambda: ["/analyze", "/candidates", "/jobs"],
+        description="POST path prefixes subject to admission control"
+    )
+    MAX_FILES_PER_REQUEST: int = Field(
+        default=500,
+        ge=1,
+        description="Uploaded files per request (ZIP entries: see ARCHIVE_*)"
+    )
+    MAX_REQUEST_MB: int = Field(
+        default=200,
+        ge=1,
+        description="Max request body size"
+    )
+    MAX_FILES_PER_JOB: int = Field(
+        default=5000,
+        ge=1,
+        description="Uploaded files per bulk /jobs submission"
+    )
+    MAX_JOB_REQUEST_MB: int = Field(
+        default=2048,
+        ge=1,
+        description="Max /jobs request body size (spooled to disk)"
+    )
+    ADMISSION_INFLIGHT_MB: int = Field(
+        default=512,
+        ge=1,
+        description="Upload bytes processed at once across all requests"
+    )
+    ADMISSION_TENANT_MAX_ACTIVE: int = Field(
+        default=4,
+        ge=1,
+        description="Requests running at once per client"
+    )
+    ADMISSION_TENANT_MAX_WAITING: int = Field(
+        default=8,
+        ge=0,
+        description="Queued requests per client before 429"
+    )
+    ADMISSION_MAX_WAITING: int = Field(
+        default=64,
+        ge=0,
+        description="Queued requests in total before 503"
+    )
+    ADMISSION_QUEUE_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        ge=0,
+        description="Max time a request waits for admission before 503"
+    )
+    ADMISSION_API_KEYS: List[str] = Field(
+        default_factory=list,
+        description="X-API-Key values trusted as client identity;"
+                    " any other request is keyed by its address"
+    )
+
+    # ===============================
+    # ANALYSIS PIPELINE (CONCURRENCY)
+    # ===============================
+    PDF_WORKERS: int = Field(
+        default=0,
+        ge=0,
+        description="Process pool size for PDF extraction (0 = CPU count)"
+    )
+    SCORING_WORKERS: int = Field(
+        default=4,
+        ge=1,
+        description="Pool size for candidate scoring"
+    )
+    SCORING_EXECUTOR: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Executor type used for scoring: thread | process"
+    )
+    PDF_TEXT_MODE: Literal["layout", "fast"] = Field(
+        default="layout",
+        description="layout = pdfplumber extract_text, fast = no layout analysis"
+    )
+    PDF_MAX_PAGES: int = Field(
+        default=30,
+        ge=0,
+        description="Pages read per PDF (0 = no limit)"
+    )
+    PDF_MAX_CHARS: int = Field(
+        default=200_000,
+        ge=0,
+        description="Characters extracted per PDF (0 = no limit)"
+    )
+    PDF_PAGE_PARALLEL: bool = Field(
+        default=True,
+        description="Spread pages of large PDFs across the PDF process pool"
+    )
+    PDF_PARALLEL_MIN_PAGES: int = Field(
+        default=12,
+        ge=2,
+        description="Page count from which a PDF is split across workers"
+    )
+    PDF_PARALLEL_MIN_BYTES: int = Field(
+        default=256 * 1024,
+        ge=0,
+        description="Only PDFs at least this large are checked for splitting"
+    )
+    MAX_CONCURRENT_RESUMES: int = Field(
+        default=16,
+        ge=1,
+        description="Max resumes in flight per /analyze request"
+    )
+
+    # ===============================
+    # DUPLICATE DETECTION
+    # ===============================
+    DEDUP_ENABLED: bool = Field(
+        default=True,
+        description="Collapse identical / near-identical resumes per batch"
+    )
+    DEDUP_MAX_DISTANCE: int = Field(
+        default=3,
+        ge=0,
+        le=15,
+        description="Max SimHash bit distance for a near-duplicate"
+    )
+    DEDUP_RESULTS: Literal["collapse", "mark"] = Field(
+        default="collapse",
+        description="collapse = drop copies from results, mark = keep them"
+    )
+
+    # ===============================
+    # EXTRACTED TEXT CACHE
+    # ===============================
+    TEXT_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache extracted resume text by PDF content hash"
+    )
+    TEXT_CACHE_MEMORY_MB: int = Field(
+        default=64,
+        ge=1,
+        description="In-memory LRU tier size"
+    )
+    TEXT_CACHE_DIR: Optional[str] = Field(
+        default=None,
+        description="Directory for the SQLite tier (None = memory only)"
+    )
+    TEXT_CACHE_DISK_MB: int = Field(
+        default=512,
+        ge=0,
+        description="SQLite tier size"
+    )
+
+    # ===============================
+    # CANDIDATE POOL (PERSISTENT)
+    # ===============================
+    CANDIDATE_STORE_DIR: str = Field(
+        default="data/candidates",
+        description="Directory for the candidate SQLite DB + vector file"
+    )
+
+    # ===============================
+    # BULK SCREENING JOBS
+    # ===============================
+    JOB_STORE_DIR: str = Field(
+        default="data/jobs",
+        description="Directory for the job queue DB and queued uploads"
+    )
+    JOB_WORKERS: int = Field(
+        default=2,
+        ge=1,
+        description="Background threads processing queued resumes"
+    )
+    JOB_LEASE_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="A claimed file is re-queued if its worker stops"
+                    " renewing the claim for this long"
+    )
+
+    # ===============================
+    # OBSERVABILITY
+    # ===============================
+    METRICS_ENABLED: bool = Field(
+        default=True,
+        description="Per-stage timing + Prometheus /metrics endpoint"
+    )
+
+    # ===============================
+    # STARTUP
+    # ===============================
+    WARMUP_ON_STARTUP: bool = Field(
+        default=True,
+        description="Preload parsers, matchers, embeddings and pool workers"
     )
 
     # ===============================
     # SCORING ENGINE
     # ===============================
-    STRONG_MATCH_THRESHOLD: int = Field(default=70)
-    MODERATE_MATCH_THRESHOLD: int = Field(default=40)
+    JOB_PROFILE_CACHE_SIZE: int = Field(
+        default=128,
+        ge=1,
+        description="Compiled job descriptions kept in memory"
+    )
+    STRONG_MATCH_THRESHOLD: int = Field(default=80)
+    MODERATE_MATCH_THRESHOLD: int = Field(default=60)
+    WEAK_MATCH_THRESHOLD: int = Field(default=40)
+    SCORE_STRENGTH_BONUS: float = Field(
+        default=2,
+        ge=0,
+        description="Points added per matched skill"
+    )
+    SCORE_MAX_BONUS: float = Field(default=10, ge=0)
+    SCORE_GAP_PENALTY: float = Field(
+        default=3,
+        ge=0,
+        description="Points removed per missing skill"
+    )
+    SCORE_MAX_PENALTY: float = Field(default=15, ge=0)
+    RESULT_STORE_DIR: str = Field(
+        default="data/results",
+        description="Directory for persisted per-candidate scoring features"
+    )
+    RESULT_STORE_MAX_SETS: int = Field(
+        default=1000,
+        ge=1,
+        description="Result sets kept for re-scoring (oldest dropped first)"
+    )
 
     # ===============================
     # PYDANTIC v2 CONFIG
@@ -1,14 +1,49 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.routes import router
 from app.config import get_settings
+from app.services.admission import AdmissionMiddleware, get_admission_controller
+from app.services.job_queue import get_job_queue
+from app.services.embedding_service import embedding_cache_stats
+from app.services.llm_client import llm_cache_size
+from app.services.pipeline import shutdown_executors
+from app.services.text_cache import get_text_cache
+from app.services import warmup
+from app.utils import metrics
 
 # ===============================
 # Load settings (Singleton)
 # ===============================
 settings = get_settings()
 
+# ===============================
+# Lifespan (startup / shutdown)
+# ===============================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    job_queue = get_job_queue()
+    job_queue.start()
+
+    warmup_task = None
+    if settings.WARMUP_ON_STARTUP:
+        warmup_task = asyncio.create_task(warmup.warm_up())
+    else:
+        warmup.mark_ready()
+
+    yield
+
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
+    job_queue.stop()
+    shutdown_executors()
+
+
 # ===============================
 # FastAPI App
 # ===============================
@@ -17,8 +52,16 @@ app = FastAPI(
     description="AI-powered resume screening system for recruiters",
     version="1.0.0",
     debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
+# ===============================
+# Admission control (upload endpoints)
+# ===============================
+# added before CORS so rejections still carry CORS headers
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(AdmissionMiddleware)
+
 # ===============================
 # CORS (Frontend Integration)
 # ===============================
@@ -47,4 +90,79 @@ def root():
         "status": "Backend running successfully 🚀",
         "app": settings.APP_NAME,
         "env": settings.APP_ENV,
-    }
\ No newline at end of file
+    }
+
+
+@app.get("/ready", tags=["Health"])
+def ready():
+    """
+    200 once the startup warm-up has finished, 503 before that.
+    """
+    status = warmup.STATE.snapshot()
+    return JSONResponse(status, status_code=200 if status["ready"] else 503)
+
+
+# ===============================
+# Metrics (Prometheus text format)
+# ===============================
+def _cache_metrics():
+    samples = []
+
+    text_cache = get_text_cache()
+    if text_cache:
+        stats = text_cache.stats()
+        samples += [
+            ("text_cache_hits_total", "counter", "Text cache hits",
+             stats["memory_hits"] + stats["disk_hits"]),
+            ("text_cache_misses_total", "counter", "Text cache misses",
+             stats["misses"]),
+            ("text_cache_evictions_total", "counter", "Text cache evictions",
+             stats["evictions"]),
+            ("text_cache_memory_bytes", "gauge", "Text cache memory tier size",
+             stats["memory_bytes"]),
+        ]
+
+    stats = embedding_cache_stats()
+    samples += [
+        ("embedding_cache_hits_total", "counter", "Embedding cache hits",
+         stats["hits"]),
+        ("embedding_cache_misses_total", "counter", "Embedding cache misses",
+         stats["misses"]),
+        ("llm_cache_entries", "gauge", "Cached LLM evaluations",
+         llm_cache_size()),
+    ]
+
+    if settings.ADMISSION_ENABLED:
+        admission = get_admission_controller().stats()
+        samples += [
+            ("admission_in_use_bytes", "gauge",
+             "Upload bytes admitted and in progress", admission["in_use_bytes"]),
+            ("admission_active_requests", "gauge",
+             "Requests admitted and running", admission["active"]),
+            ("admission_waiting_requests", "gauge",
+             "Requests queued for admission", admission["waiting"]),
+        ]
+
+    status = warmup.STATE.snapshot()
+    samples += [
+        ("ready", "gauge", "1 once startup warm-up has finished",
+         int(status["ready"])),
+        ("warmup_seconds", "gauge", "Duration of the startup warm-up",
+         status["warmup_seconds"] or 0.0),
+    ]
+
+    return samples
+
+
+metrics.REGISTRY.add_collector(_cache_metrics)
+
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+def metrics_endpoint():
+    if not metrics.ENABLED:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+
+    return PlainTextResponse(
+        metrics.render_metrics(),
+        media_type="text/plain; version=0.0.4"
+    )
\ No newline at end of file
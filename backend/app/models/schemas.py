@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional, Literal
+from typing import Dict, List, Optional, Literal
 
 
 # ======================================================
@@ -21,6 +21,35 @@ class AnalyzeRequest(BaseModel):
     )
 
 
+class ScoringWeightsRequest(BaseModel):
+    """
+    Per-request scoring overrides. Omitted fields keep their
+    configured defaults (or, when re-scoring, the result set's weights).
+    Sent as a JSON string in the `weights` form field of /analyze,
+    or as the JSON body of /results/{id}/rescore.
+    """
+    skill_weight: Optional[float] = Field(default=None, ge=0)
+    listed_skill_weight: Optional[float] = Field(default=None, ge=0, le=1)
+    project_points: Optional[float] = Field(default=None, ge=0)
+    senior_experience_points: Optional[float] = Field(default=None, ge=0)
+    mid_experience_points: Optional[float] = Field(default=None, ge=0)
+    junior_experience_points: Optional[float] = Field(default=None, ge=0)
+    general_experience_points: Optional[float] = Field(default=None, ge=0)
+    similarity_points: Optional[float] = Field(default=None, ge=0)
+    experience_gate: Optional[bool] = None
+
+    strength_bonus: Optional[float] = Field(default=None, ge=0)
+    max_bonus: Optional[float] = Field(default=None, ge=0)
+    gap_penalty: Optional[float] = Field(default=None, ge=0)
+    max_penalty: Optional[float] = Field(default=None, ge=0)
+
+    strong_threshold: Optional[int] = Field(default=None, ge=0, le=100)
+    moderate_threshold: Optional[int] = Field(default=None, ge=0, le=100)
+    weak_threshold: Optional[int] = Field(default=None, ge=0, le=100)
+
+    model_config = {"extra": "forbid"}
+
+
 # ======================================================
 # CANDIDATE EVALUATION SCHEMA
 # ======================================================
@@ -59,20 +88,61 @@ class CandidateEvaluation(BaseModel):
         description="Missing or weak skills"
     )
 
-    explanation: str = Field(
-        ...,
-        description="Recruiter-friendly explanation of the evaluation"
+    explanation: Optional[str] = Field(
+        default=None,
+        description="Recruiter-friendly explanation (omitted with explain=false)"
+    )
+
+    duplicate_of: Optional[str] = Field(
+        default=None,
+        description="Set when this resume duplicates an earlier upload"
     )
 
-    # 🔮 Optional future extensions (SAFE to ignore now)
     experience_match: Optional[bool] = Field(
         default=None,
         description="Whether experience requirements were satisfied"
+                    " (null when the job description states none)"
     )
 
-    project_relevance: Optional[str] = Field(
+    project_relevance: Optional[Literal["High", "Medium", "Low"]] = Field(
         default=None,
-        description="High-level relevance of projects to the role"
+        description="Share of the role's skills used in experience /"
+                    " projects sections"
+    )
+
+    breakdown: Optional["ScoreBreakdown"] = Field(
+        default=None,
+        description="How the final score was computed"
+    )
+
+
+class ScoreBreakdown(BaseModel):
+    skill_match: int = Field(
+        ...,
+        ge=0,
+        le=100,
+        description="Weighted skill match before skill_weight"
+    )
+    skill_points: float
+    project_points: float
+    experience_points: float
+    similarity_points: float
+    base_score: int = Field(
+        ...,
+        description="Capped sum of the points (LLM match score when llm)"
+    )
+    bonus: float = Field(..., description="Added for matched skills")
+    penalty: float = Field(..., description="Subtracted for missing skills")
+    final_score: int
+    gated: bool = Field(
+        ...,
+        description="Required experience missing: base score forced to 0"
+    )
+    llm: bool = Field(..., description="Base score came from the LLM")
+    matched_positions: Dict[str, List[List[int]]] = Field(
+        default_factory=dict,
+        description="[start, end) offsets of each matched skill"
+                    " in the extracted resume text"
     )
 
 
@@ -92,6 +162,80 @@ class AnalyzeResponse(BaseModel):
         description="List of evaluated candidates"
     )
 
+    duplicate_groups: List["DuplicateGroup"] = Field(
+        default_factory=list,
+        description="Uploads collapsed into an earlier copy"
+    )
+
+
+class DuplicateMember(BaseModel):
+    candidate_name: str
+    match: Literal["exact", "near"] = Field(
+        ...,
+        description="exact = identical file, near = near-identical text"
+    )
+
+
+class DuplicateGroup(BaseModel):
+    candidate_name: str = Field(..., description="Copy that was scored")
+    duplicates: List[DuplicateMember] = Field(default_factory=list)
+
+
+# ======================================================
+# CANDIDATE POOL SCHEMAS
+# ======================================================
+
+class PoolIngestResponse(BaseModel):
+    received: int = Field(..., ge=0, description="Resumes uploaded")
+    added: int = Field(..., ge=0, description="New candidates stored")
+    duplicates: int = Field(
+        ...,
+        ge=0,
+        description="Resumes already present in the pool"
+    )
+    failed: int = Field(
+        ...,
+        ge=0,
+        description="Resumes whose text could not be extracted"
+    )
+    near_duplicates: int = Field(
+        default=0,
+        ge=0,
+        description="Resumes near-identical to a pool candidate (skipped)"
+    )
+    pool_size: int = Field(..., ge=0, description="Candidates in the pool")
+
+
+class PoolCandidate(BaseModel):
+    candidate_id: int = Field(..., ge=0)
+    candidate_name: str
+    similarity: int = Field(
+        ...,
+        ge=0,
+        le=100,
+        description="Embedding similarity to the job description (0–100)"
+    )
+    matched_skills: List[str] = Field(default_factory=list)
+    missing_skills: List[str] = Field(default_factory=list)
+    years: int = Field(default=0, ge=0)
+    has_experience: bool = False
+
+
+class PoolSearchResponse(BaseModel):
+    pool_size: int = Field(..., ge=0)
+    results: List[PoolCandidate] = Field(
+        ...,
+        description="Best matching stored candidates, best first"
+    )
+
+
+class PoolBatchSearchResponse(BaseModel):
+    pool_size: int = Field(..., ge=0)
+    results: List[List[PoolCandidate]] = Field(
+        ...,
+        description="One ranked list per job description, in request order"
+    )
+
 
 # ======================================================
 # ERROR RESPONSE SCHEMA
@@ -0,0 +1,403 @@
+import asyncio
+import json
+import math
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Optional, Tuple
+
+from app.config import get_settings
+from app.utils import metrics
+
+# Smoothing of the observed request duration (Retry-After estimate)
+SERVICE_TIME_ALPHA = 0.2
+MAX_RETRY_AFTER = 60
+
+# bulk submissions (spooled to disk) have their own body limit
+JOBS_PATH = "/jobs"
+
+
+class AdmissionRejected(Exception):
+    """
+    status_code: 429 (this tenant is over its share),
+                 503 (server saturated) or 413 (request too large).
+    """
+
+    def __init__(self, status_code: int, detail: str, retry_after: Optional[int]):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+def _count_rejection() -> None:
+    metrics.inc(
+        "admission_rejected_total",
+        help_text="Requests rejected by admission control (429 / 503)"
+    )
+
+
+class _Tenant:
+    __slots__ = ("active", "waiting")
+
+    def __init__(self):
+        self.active = 0
+        self.waiting: Deque[Tuple[int, asyncio.Future]] = deque()
+
+
+# -------------------------------------------------
+# Global in-flight budget with per-tenant fairness
+# -------------------------------------------------
+class AdmissionController:
+    """
+    Bounds the upload bytes being processed across all requests of
+    this worker process (`capacity`) and schedules waiting requests
+    round-robin across tenants (API key or client address).
+
+    A request is admitted at once if nobody is waiting and it fits.
+    Otherwise it waits in its tenant's FIFO; whenever budget frees up,
+    tenants take turns, so one tenant's burst cannot starve the rest.
+    A tenant may have `tenant_max_active` requests running and
+    `tenant_max_waiting` queued – beyond that it gets 429 right away.
+    A request still waiting after `queue_timeout` seconds, or arriving
+    when `max_waiting` requests are already queued, gets 503.
+    Both carry a Retry-After estimated from recent request durations.
+
+    Event-loop only (not thread-safe); one instance per process.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        tenant_max_active: int,
+        tenant_max_waiting: int,
+        max_waiting: int,
+        queue_timeout: float
+    ):
+        self.capacity = capacity
+        self.tenant_max_active = tenant_max_active
+        self.tenant_max_waiting = tenant_max_waiting
+        self.max_waiting = max_waiting
+        self.queue_timeout = queue_timeout
+
+        self.in_use = 0
+        self._tenants: Dict[str, _Tenant] = {}
+        self._rotation: Deque[str] = deque()    # tenants with waiters
+        self._service_time = 1.0
+
+    # ---------- bookkeeping ----------
+    def _tenant(self, key: str) -> _Tenant:
+        tenant = self._tenants.get(key)
+        if tenant is None:
+            tenant = self._tenants[key] = _Tenant()
+        return tenant
+
+    def _forget_if_idle(self, key: str) -> None:
+        tenant = self._tenants.get(key)
+        if tenant is not None and not tenant.active and not tenant.waiting:
+            del self._tenants[key]
+
+    def _fits(self, tenant: _Tenant, cost: int) -> bool:
+        return (
+            tenant.active < self.tenant_max_active
+            and self.in_use + cost <= self.capacity
+        )
+
+    def _grant(self, tenant: _Tenant, cost: int) -> None:
+        tenant.active += 1
+        self.in_use += cost
+
+    def waiting(self) -> int:
+        return sum(len(t.waiting) for t in self._tenants.values())
+
+    def retry_after(self) -> int:
+        queued = self.waiting() + 1
+        running = max(1, sum(t.active for t in self._tenants.values()))
+        estimate = self._service_time * queued / running
+        return max(1, min(MAX_RETRY_AFTER, math.ceil(estimate)))
+
+    # ---------- admission ----------
+    async def acquire(self, key: str, cost: int) -> None:
+        cost = min(cost, self.capacity)
+        tenant = self._tenant(key)
+
+        if not self._rotation and self._fits(tenant, cost):
+            self._grant(tenant, cost)
+            return
+
+        if len(tenant.waiting) >= self.tenant_max_waiting:
+            self._forget_if_idle(key)
+            _count_rejection()
+            raise AdmissionRejected(
+                429, "Too many concurrent requests for this client",
+                self.retry_after()
+            )
+
+        if self.waiting() >= self.max_waiting:
+            self._forget_if_idle(key)
+            _count_rejection()
+            raise AdmissionRejected(
+                503, "Server is busy, retry later", self.retry_after()
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        tenant.waiting.append((cost, future))
+        if key not in self._rotation:
+            self._rotation.append(key)
+
+        # the waiters ahead may only be blocked by their own tenant's
+        # limit; this request can then run at once
+        self._dispatch()
+
+        try:
+            # admission_queue_in_flight = requests currently queued
+            with metrics.timer("admission_queue"):
+                await asyncio.wait_for(
+                    asyncio.shield(future), self.queue_timeout
+                )
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # granted in the same tick the timer fired
+                return
+            future.cancel()
+            self._drop_waiter(key, future)
+            _count_rejection()
+            raise AdmissionRejected(
+                503, "Server is busy, retry later", self.retry_after()
+            )
+        except asyncio.CancelledError:
+            # client went away while queued
+            if future.done() and not future.cancelled():
+                self.release(key, cost)
+            else:
+                future.cancel()
+                self._drop_waiter(key, future)
+            raise
+
+    def _drop_waiter(self, key: str, future: asyncio.Future) -> None:
+        tenant = self._tenants.get(key)
+        if tenant is not None:
+            tenant.waiting = deque(
+                entry for entry in tenant.waiting if entry[1] is not future
+            )
+            if not tenant.waiting and key in self._rotation:
+                self._rotation.remove(key)
+        self._forget_if_idle(key)
+        self._dispatch()
+
+    def release(self, key: str, cost: int, seconds: Optional[float] = None) -> None:
+        cost = min(cost, self.capacity)
+        tenant = self._tenants.get(key)
+        if tenant is not None:
+            tenant.active -= 1
+        self.in_use -= cost
+
+        if seconds is not None:
+            self._service_time += SERVICE_TIME_ALPHA * (seconds - self._service_time)
+
+        self._forget_if_idle(key)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """
+        Round-robin over tenants with waiters: each turn admits the
+        head of one tenant's queue if it fits. Stops after a full
+        rotation without progress.
+        """
+
+        idle_turns = 0
+        while self._rotation and idle_turns < len(self._rotation):
+            key = self._rotation[0]
+            self._rotation.rotate(-1)
+            tenant = self._tenants[key]
+
+            while tenant.waiting and tenant.waiting[0][1].done():
+                tenant.waiting.popleft()        # timed out / cancelled
+
+            if not tenant.waiting:
+                self._rotation.remove(key)
+                self._forget_if_idle(key)
+                continue
+
+            cost, future = tenant.waiting[0]
+            if not self._fits(tenant, cost):
+                idle_turns += 1
+                continue
+
+            tenant.waiting.popleft()
+            self._grant(tenant, cost)
+            future.set_result(None)
+            idle_turns = 0
+
+            if not tenant.waiting:
+                self._rotation.remove(key)
+
+    def stats(self) -> Dict:
+        return {
+            "in_use_bytes": self.in_use,
+            "capacity_bytes": self.capacity,
+            "active": sum(t.active for t in self._tenants.values()),
+            "waiting": self.waiting(),
+            "tenants": len(self._tenants),
+        }
+
+
+@lru_cache
+def get_admission_controller() -> AdmissionController:
+    settings = get_settings()
+    return AdmissionController(
+        capacity=settings.ADMISSION_INFLIGHT_MB * 1024 * 1024,
+        tenant_max_active=settings.ADMISSION_TENANT_MAX_ACTIVE,
+        tenant_max_waiting=settings.ADMISSION_TENANT_MAX_WAITING,
+        max_waiting=settings.ADMISSION_MAX_WAITING,
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_SECONDS,
+    )
+
+
+# -------------------------------------------------
+# ASGI middleware
+# -------------------------------------------------
+class _BodyTooLarge(Exception):
+    pass
+
+
+class AdmissionMiddleware:
+    """
+    Applies admission control to upload endpoints (POST on
+    ADMISSION_PATHS) before the multipart body is parsed:
+
+    - Content-Length above MAX_REQUEST_MB (MAX_JOB_REQUEST_MB for
+      /jobs) → 413 at once
+    - the body is counted while it streams in, so chunked uploads
+      are cut off at the same limit
+    - the request's cost (its declared size, or the limit when
+      unknown) is held against the global budget until the response
+      has been fully sent (streaming responses included)
+
+    Fairness is per client address. X-API-Key is only used as the
+    client identity when it is one of ADMISSION_API_KEYS: the header
+    is not authenticated otherwise, so a client could send a new key
+    on every request to escape its per-client limits. Behind a
+    reverse proxy, run uvicorn with --proxy-headers so the address is
+    the real client's.
+
+    Rejections are JSON {"detail": ...} like HTTPException,
+    with Retry-After on 429 / 503.
+    """
+
+    def __init__(self, app, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self._controller = controller
+
+        settings = get_settings()
+        self.paths = tuple(settings.ADMISSION_PATHS)
+        self.request_bytes = settings.MAX_REQUEST_MB * 1024 * 1024
+        self.job_bytes = settings.MAX_JOB_REQUEST_MB * 1024 * 1024
+        self.api_keys = frozenset(
+            key.encode("latin-1") for key in settings.ADMISSION_API_KEYS
+        )
+
+    @property
+    def controller(self) -> AdmissionController:
+        return self._controller or get_admission_controller()
+
+    def _applies(self, scope) -> bool:
+        return (
+            scope["type"] == "http"
+            and scope["method"] == "POST"
+            and scope["path"].startswith(self.paths)
+        )
+
+    def _max_bytes(self, scope) -> int:
+        if scope["path"].startswith(JOBS_PATH):
+            return self.job_bytes
+        return self.request_bytes
+
+    def tenant(self, scope) -> str:
+        api_key = dict(scope["headers"]).get(b"x-api-key")
+        if api_key and api_key in self.api_keys:
+            return "key:" + api_key.decode("latin-1")
+
+        client = scope.get("client")
+        return "host:" + (client[0] if client else "unknown")
+
+    async def __call__(self, scope, receive, send):
+        if not self._applies(scope):
+            await self.app(scope, receive, send)
+            return
+
+        length = dict(scope["headers"]).get(b"content-length")
+        try:
+            declared = int(length) if length is not None else None
+        except ValueError:
+            declared = None
+
+        max_bytes = self._max_bytes(scope)
+        too_large_error = AdmissionRejected(
+            413, f"Request body exceeds {max_bytes // (1024 * 1024)} MB", None
+        )
+
+        if declared is not None and declared > max_bytes:
+            await _reject(send, too_large_error)
+            return
+
+        key = self.tenant(scope)
+        cost = declared if declared is not None else max_bytes
+
+        try:
+            await self.controller.acquire(key, cost)
+        except AdmissionRejected as e:
+            await _reject(send, e)
+            return
+
+        received = 0
+        too_large = False
+        started = False
+
+        async def counting_receive():
+            nonlocal received, too_large
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    too_large = True
+                    raise _BodyTooLarge()
+            return message
+
+        async def guarded_send(message):
+            nonlocal started
+            if too_large:
+                # the app turned the aborted body into its own error
+                return
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        begun = time.perf_counter()
+        try:
+            await self.app(scope, counting_receive, guarded_send)
+        except _BodyTooLarge:
+            too_large = True
+        finally:
+            self.controller.release(key, cost, time.perf_counter() - begun)
+
+        if too_large and not started:
+            await _reject(send, too_large_error)
+
+
+async def _reject(send, error: AdmissionRejected) -> None:
+    headers: List[Tuple[bytes, bytes]] = [
+        (b"content-type", b"application/json"),
+    ]
+    if error.retry_after is not None:
+        headers.append((b"retry-after", str(error.retry_after).encode()))
+
+    body = json.dumps({"detail": error.detail}).encode("utf-8")
+    headers.append((b"content-length", str(len(body)).encode()))
+
+    await send({
+        "type": "http.response.start",
+        "status": error.status_code,
+        "headers": headers,
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,195 @@
+import posixpath
+import zipfile
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from fastapi import UploadFile
+
+from app.config import get_settings
+from app.utils import metrics
+from app.services.extractors import ZIP_MAGIC
+from app.utils.file_handler import max_upload_bytes
+
+SUPPORTED_COMPRESSION = {
+    zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED,
+    zipfile.ZIP_BZIP2, zipfile.ZIP_LZMA,
+}
+
+# macOS resource forks etc. – never resumes
+_IGNORED_PREFIXES = ("__MACOSX/",)
+
+
+class ArchiveError(ValueError):
+    """
+    The archive as a whole cannot be processed.
+    status_code: 413 for limit violations, 422 for invalid archives.
+    """
+
+    def __init__(self, message: str, status_code: int = 422):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class SkippedEntry(NamedTuple):
+    name: str
+    reason: str
+
+
+class ArchiveLimits(NamedTuple):
+    max_entries: int
+    max_entry_bytes: int
+    max_total_bytes: int
+    max_ratio: int
+
+
+def default_limits() -> ArchiveLimits:
+    settings = get_settings()
+    return ArchiveLimits(
+        max_entries=settings.ARCHIVE_MAX_ENTRIES,
+        max_entry_bytes=max_upload_bytes(),
+        max_total_bytes=settings.ARCHIVE_MAX_TOTAL_MB * 1024 * 1024,
+        max_ratio=settings.ARCHIVE_MAX_RATIO,
+    )
+
+
+def is_zip_upload(upload_file: Optional[UploadFile]) -> bool:
+    """
+    Magic-byte check (the file position is restored).
+    """
+    if not upload_file or not upload_file.file:
+        return False
+
+    try:
+        upload_file.file.seek(0)
+        head = upload_file.file.read(len(ZIP_MAGIC))
+        upload_file.file.seek(0)
+        return head == ZIP_MAGIC
+    except Exception:
+        return False
+
+
+# -------------------------------------------------
+# Lazily read ZIP of resumes
+# -------------------------------------------------
+class ResumeArchive:
+    """
+    A ZIP upload whose entries are fed to the pipeline one by one.
+    Entry formats are sniffed like plain uploads (PDF, DOCX, HTML,
+    text); anything else ends up as an unreadable result.
+
+    Only the central directory is read up front: every entry is
+    checked against the limits there (count, declared size, total
+    uncompressed size, compression ratio, encryption, compression
+    method), so a zip bomb
+    is rejected before anything is decompressed. Entries are opened
+    lazily by uploads() and decompressed by whoever reads them
+    (the ingest thread), never unpacked to disk. zipfile stops every
+    entry at its declared size, so the checked sizes are hard caps.
+
+    Blocking (reads the archive) – construct in a thread.
+    """
+
+    def __init__(
+        self,
+        upload_file: UploadFile,
+        limits: Optional[ArchiveLimits] = None
+    ):
+        self.limits = limits or default_limits()
+        self.name = upload_file.filename or "archive.zip"
+
+        if not is_zip_upload(upload_file):
+            raise ArchiveError(f"{self.name} is not a ZIP archive")
+
+        try:
+            self._zip = zipfile.ZipFile(upload_file.file)
+        except (zipfile.BadZipFile, OSError) as e:
+            raise ArchiveError(f"Invalid ZIP archive {self.name}: {e}")
+
+        try:
+            self.entries, self.skipped = self._plan(self._zip.infolist())
+        except ArchiveError:
+            self._zip.close()
+            raise
+
+    def _plan(self, infos: List[zipfile.ZipInfo]):
+        limits = self.limits
+        entries: List[zipfile.ZipInfo] = []
+        skipped: List[SkippedEntry] = []
+
+        files = [
+            info for info in infos
+            if not info.is_dir() and not info.filename.startswith(
+                _IGNORED_PREFIXES
+            )
+        ]
+        if len(files) > limits.max_entries:
+            raise ArchiveError(
+                f"Archive has {len(files)} files"
+                f" (limit {limits.max_entries})",
+                status_code=413
+            )
+
+        total = 0
+        for info in files:
+            reason = self._rejection(info)
+            if reason is not None:
+                skipped.append(SkippedEntry(info.filename, reason))
+                continue
+
+            total += info.file_size
+            if total > limits.max_total_bytes:
+                raise ArchiveError(
+                    "Archive uncompressed size exceeds"
+                    f" {limits.max_total_bytes // (1024 * 1024)} MB",
+                    status_code=413
+                )
+            entries.append(info)
+
+        if skipped:
+            metrics.inc(
+                "archive_entries_skipped_total",
+                len(skipped),
+                help_text="ZIP entries rejected before extraction"
+            )
+
+        return entries, skipped
+
+    def _rejection(self, info: zipfile.ZipInfo) -> Optional[str]:
+        limits = self.limits
+        base = posixpath.basename(info.filename)
+
+        if base.startswith("."):
+            return "hidden file"
+        if info.flag_bits & 0x1:
+            return "encrypted"
+        if info.compress_type not in SUPPORTED_COMPRESSION:
+            return "unsupported compression"
+        if info.file_size > limits.max_entry_bytes:
+            return "too large"
+        if info.file_size > max(info.compress_size, 1) * limits.max_ratio:
+            return "compression ratio too high"
+        return None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def uploads(self) -> Iterator[UploadFile]:
+        """
+        One UploadFile per accepted entry, opened only when requested.
+        Reads decompress straight from the archive (thread-safe).
+        """
+        for info in self.entries:
+            yield UploadFile(
+                file=self._zip.open(info),
+                filename=info.filename,
+                size=info.file_size,
+            )
+
+    def summary(self) -> Dict:
+        return {
+            "archive": self.name,
+            "entries": len(self.entries),
+            "skipped": [entry._asdict() for entry in self.skipped],
+        }
+
+    def close(self) -> None:
+        self._zip.close()
@@ -0,0 +1,538 @@
+import csv
+import glob
+import hashlib
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+from app.services.embedding_service import text_hash
+from app.services.job_profile import compile_job_profile
+from app.services.llm_client import evaluate_blocking
+from app.services.pipeline import (
+    UNREADABLE_EXPLANATION,
+    analyze_resume,
+    new_process_pool,
+    pdf_workers,
+    unreadable_result,
+)
+from app.services.resume_parser import parse_document_bytes
+from app.services.scoring_engine import ScoringWeights
+from app.services.text_cache import get_text_cache, hash_bytes
+from app.utils.file_handler import max_upload_bytes
+
+# One output row per (resume, JD)
+COLUMNS = (
+    "job", "candidate_name", "content_hash", "final_score", "verdict",
+    "strengths", "gaps", "years", "has_experience", "explanation",
+)
+
+# joins strengths / gaps into one CSV / Parquet string column
+LIST_SEPARATOR = "; "
+
+
+class JobDescription(NamedTuple):
+    name: str       # file stem, the "job" column
+    text: str
+
+
+# -------------------------------------------------
+# Inputs
+# -------------------------------------------------
+def expand_inputs(
+    patterns: Iterable[str],
+    exclude: Iterable[str] = ()
+) -> List[str]:
+    """
+    Directories (walked recursively) and glob patterns → sorted,
+    de-duplicated file paths. Hidden files are skipped; formats are
+    sniffed later, so no extension filter.
+
+    `exclude`: the run's own output and checkpoint files (and
+    anything inside an excluded directory, e.g. a Parquet dataset),
+    which may sit inside an input directory.
+    """
+
+    paths: Set[str] = set()
+    excluded = tuple(os.path.realpath(path) for path in exclude)
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, dirs, files in os.walk(pattern):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                paths.update(
+                    os.path.join(root, name) for name in files
+                    if not name.startswith(".")
+                )
+        else:
+            paths.update(
+                path for path in glob.glob(pattern, recursive=True)
+                if os.path.isfile(path)
+                and not os.path.basename(path).startswith(".")
+            )
+
+    def wanted(path: str) -> bool:
+        real = os.path.realpath(path)
+        return not any(
+            real == skip or real.startswith(skip + os.sep)
+            for skip in excluded
+        )
+
+    return sorted(path for path in paths if wanted(path))
+
+
+def load_job_descriptions(paths: Sequence[str]) -> List[JobDescription]:
+    jobs = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            text = f.read().strip()
+        if not text:
+            raise ValueError(f"Job description {path} is empty")
+        jobs.append(JobDescription(os.path.splitext(os.path.basename(path))[0], text))
+
+    names = [job.name for job in jobs]
+    if len(set(names)) != len(names):
+        raise ValueError("Job description file names must be unique")
+    return jobs
+
+
+def jobs_fingerprint(jobs: Sequence[JobDescription], weights: ScoringWeights) -> str:
+    """
+    Identifies a run configuration; a checkpoint only resumes the same one.
+    """
+    digest = hashlib.sha256()
+    for job in jobs:
+        digest.update(job.name.encode("utf-8") + b"\0")
+        digest.update(job.text.encode("utf-8") + b"\0")
+    digest.update(repr(sorted(weights.to_dict().items())).encode("utf-8"))
+    return digest.hexdigest()
+
+
+# -------------------------------------------------
+# Worker task (runs in the process pool)
+# -------------------------------------------------
+def screen_file(
+    path: str,
+    candidate_name: str,
+    jobs: Sequence[JobDescription],
+    weights: ScoringWeights
+) -> List[Dict]:
+    """
+    Extract one resume once and score it against every JD
+    (with the LLM evaluator when one is configured, as in /analyze).
+    Top-level (picklable) so it can run inside a process pool.
+    Files over MAX_FILE_SIZE_MB are unreadable, as uploads are.
+    """
+
+    max_bytes = max_upload_bytes()
+    try:
+        with open(path, "rb") as f:
+            data = f.read(max_bytes + 1)
+    except OSError as e:
+        print(f"[Batch] Cannot read {path}: {e}", file=sys.stderr)
+        data = b""
+
+    if len(data) > max_bytes:
+        print(f"[Batch] File too large: {path}", file=sys.stderr)
+        data = b""
+
+    content_hash = hash_bytes(data) if data else ""
+    cache = get_text_cache()
+
+    resume_text = cache.get(content_hash) if cache and data else None
+    if resume_text is None and data:
+        resume_text = parse_document_bytes(data).text
+        if resume_text and cache:
+            cache.put(content_hash, resume_text)
+
+    rows = []
+    for job in jobs:
+        if not resume_text or not resume_text.strip():
+            result, features = unreadable_result(candidate_name), None
+        else:
+            profile = compile_job_profile(
+                job.text, with_embedding=bool(weights.similarity_points)
+            )
+            llm_result = evaluate_blocking(
+                profile, text_hash(resume_text), resume_text
+            )
+            result, features = analyze_resume(
+                candidate_name, resume_text, job.text, profile, weights,
+                llm_result
+            )
+
+        rows.append({
+            "job": job.name,
+            "candidate_name": candidate_name,
+            "content_hash": content_hash,
+            "final_score": result.final_score,
+            "verdict": result.verdict,
+            "strengths": LIST_SEPARATOR.join(result.strengths),
+            "gaps": LIST_SEPARATOR.join(result.gaps),
+            "years": features.years if features else 0,
+            "has_experience": bool(features and features.has_experience),
+            "explanation": result.explain(),
+        })
+
+    return rows
+
+
+# -------------------------------------------------
+# Output writers (incremental, truncatable to a checkpoint)
+# -------------------------------------------------
+class CsvResultWriter:
+    """
+    Appends rows to one CSV file. position() is the committed byte
+    size; reopening at a position drops anything written after it.
+    """
+
+    def __init__(self, path: str, position: int = 0):
+        self.path = path
+        if os.path.exists(path):
+            os.truncate(path, position)
+
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=COLUMNS)
+        if position == 0:
+            self._writer.writeheader()
+
+    def write(self, rows: List[Dict]) -> None:
+        self._writer.writerows(rows)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def position(self) -> int:
+        return os.fstat(self._file.fileno()).st_size
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def _import_parquet():
+    try:
+        import pyarrow
+        import pyarrow.parquet as parquet
+        return pyarrow, parquet
+    except ImportError:
+        return None
+
+
+PARQUET_MISSING = "Parquet output needs pyarrow (pip install pyarrow)"
+
+
+class ParquetResultWriter:
+    """
+    Writes each flush as one part file of a Parquet dataset directory
+    (part-00000.parquet, ...). Parts are renamed into place when
+    complete; position() is the number of committed parts, and parts
+    beyond it are removed on reopen.
+
+    Needs pyarrow (optional dependency, imported lazily).
+    """
+
+    def __init__(self, path: str, position: int = 0):
+        modules = _import_parquet()
+        if modules is None:
+            raise RuntimeError(PARQUET_MISSING)
+        self._pa, self._pq = modules
+        pa = self._pa
+        self._schema = pa.schema([
+            ("job", pa.string()),
+            ("candidate_name", pa.string()),
+            ("content_hash", pa.string()),
+            ("final_score", pa.int32()),
+            ("verdict", pa.string()),
+            ("strengths", pa.string()),
+            ("gaps", pa.string()),
+            ("years", pa.int32()),
+            ("has_experience", pa.bool_()),
+            ("explanation", pa.string()),
+        ])
+
+        self.path = path
+        self._parts = position
+        os.makedirs(path, exist_ok=True)
+
+        for name in os.listdir(path):
+            stem = name.split(".", 1)[0]
+            if stem.startswith("part-") and (
+                not name.endswith(".parquet")
+                or int(stem[len("part-"):]) >= position
+            ):
+                os.remove(os.path.join(path, name))
+
+    def write(self, rows: List[Dict]) -> None:
+        table = self._pa.Table.from_pylist(rows, schema=self._schema)
+        final = os.path.join(self.path, f"part-{self._parts:05d}.parquet")
+
+        self._pq.write_table(table, final + ".tmp")
+        os.replace(final + ".tmp", final)
+        self._parts += 1
+
+    def position(self) -> int:
+        return self._parts
+
+    def close(self) -> None:
+        pass
+
+
+WRITERS = {"csv": CsvResultWriter, "parquet": ParquetResultWriter}
+
+
+def output_format(path: str, fmt: Optional[str] = None) -> str:
+    if fmt:
+        return fmt
+    return "parquet" if path.rstrip("/").endswith(".parquet") else "csv"
+
+
+# -------------------------------------------------
+# Checkpoint (SQLite)
+# -------------------------------------------------
+class Checkpoint:
+    """
+    Which resumes are already in the output, and the output position
+    they end at. Both are committed in one transaction after the rows
+    are durably written, so an interrupted run resumes exactly at the
+    last commit: rows written after it are truncated away and their
+    resumes are screened again.
+    """
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS meta ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS done ("
+            " path TEXT PRIMARY KEY);"
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def start(self, fingerprint: str, output: str, fmt: str) -> int:
+        """
+        Check the run matches the checkpoint; returns the output
+        position to reopen at (0 for a fresh run).
+        """
+
+        stored = self.get("fingerprint")
+        if stored is not None and (
+            stored != fingerprint
+            or self.get("output") != output
+            or self.get("format") != fmt
+        ):
+            raise ValueError(
+                "Checkpoint belongs to a different run (job descriptions,"
+                " weights or output changed); use --restart"
+            )
+
+        if stored is None:
+            with self._lock:
+                self._db.executemany(
+                    "INSERT INTO meta (key, value) VALUES (?, ?)",
+                    [("fingerprint", fingerprint), ("output", output),
+                     ("format", fmt), ("position", "0")]
+                )
+                self._db.commit()
+
+        return int(self.get("position") or 0)
+
+    def done(self) -> Set[str]:
+        with self._lock:
+            return {row[0] for row in self._db.execute("SELECT path FROM done")}
+
+    def commit(self, paths: Sequence[str], position: int) -> None:
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR IGNORE INTO done (path) VALUES (?)",
+                [(path,) for path in paths]
+            )
+            self._db.execute(
+                "UPDATE meta SET value = ? WHERE key = 'position'",
+                (str(position),)
+            )
+            self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+
+# -------------------------------------------------
+# Runner
+# -------------------------------------------------
+class BatchSummary(NamedTuple):
+    total: int
+    skipped: int        # already in the output (checkpoint)
+    screened: int
+    unreadable: int
+    rows: int
+    seconds: float
+
+
+# SQLite checkpoint file and its WAL side files
+CHECKPOINT_SUFFIXES = ("", "-wal", "-shm")
+
+
+def remove_outputs(output: str, checkpoint_path: str) -> None:
+    """
+    --restart: drop a previous run's output and checkpoint.
+    """
+    if os.path.isdir(output):
+        shutil.rmtree(output)
+    elif os.path.exists(output):
+        os.remove(output)
+
+    for suffix in CHECKPOINT_SUFFIXES:
+        if os.path.exists(checkpoint_path + suffix):
+            os.remove(checkpoint_path + suffix)
+
+
+def _candidate_name(path: str, roots: Sequence[str]) -> str:
+    for root in roots:
+        if os.path.isdir(root):
+            relative = os.path.relpath(path, root)
+            if not relative.startswith(".."):
+                return relative
+    return path
+
+
+def run_batch(
+    inputs: Sequence[str],
+    jobs: Sequence[JobDescription],
+    output: str,
+    weights: ScoringWeights,
+    fmt: Optional[str] = None,
+    checkpoint_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    flush_every: int = 100,
+    restart: bool = False,
+    progress=None
+) -> BatchSummary:
+    """
+    Screen every resume under `inputs` against every JD and append
+    the rows to `output`, committing a checkpoint every `flush_every`
+    resumes. Re-running with the same arguments continues where an
+    interrupted run stopped (restart=True starts over instead).
+
+    Extraction and scoring run in a spawn process pool
+    (`workers`, default PDF_WORKERS / CPU count); the parent only
+    writes output.
+    """
+
+    started = time.perf_counter()
+    fmt = output_format(output, fmt)
+    checkpoint_path = checkpoint_path or output.rstrip("/") + ".checkpoint"
+
+    # before anything is created on disk
+    if fmt == "parquet" and _import_parquet() is None:
+        raise RuntimeError(PARQUET_MISSING)
+
+    if restart:
+        remove_outputs(output, checkpoint_path)
+    elif os.path.exists(output) and not os.path.exists(checkpoint_path):
+        raise ValueError(
+            f"{output} exists but has no checkpoint; use --restart"
+            " to overwrite it"
+        )
+
+    checkpoint = Checkpoint(checkpoint_path)
+
+    try:
+        position = checkpoint.start(jobs_fingerprint(jobs, weights), output, fmt)
+        done = checkpoint.done()
+
+        paths = expand_inputs(
+            inputs,
+            exclude=[output] + [
+                checkpoint_path + suffix for suffix in CHECKPOINT_SUFFIXES
+            ]
+        )
+        pending = [path for path in paths if path not in done]
+
+        writer = WRITERS[fmt](output, position)
+        executor = new_process_pool(workers or pdf_workers())
+        max_in_flight = max(1, (workers or pdf_workers()) * 4)
+
+        buffered_rows: List[Dict] = []
+        buffered_paths: List[str] = []
+        screened = unreadable = rows = 0
+        in_flight: Dict[Future, str] = {}
+        queue = iter(pending)
+
+        def flush() -> None:
+            nonlocal rows
+            if not buffered_paths:
+                return
+            if buffered_rows:
+                writer.write(buffered_rows)
+            checkpoint.commit(buffered_paths, writer.position())
+            rows += len(buffered_rows)
+            buffered_rows.clear()
+            buffered_paths.clear()
+
+        try:
+            while True:
+                for path in queue:
+                    future = executor.submit(
+                        screen_file, path, _candidate_name(path, inputs),
+                        tuple(jobs), weights
+                    )
+                    in_flight[future] = path
+                    if len(in_flight) >= max_in_flight:
+                        break
+
+                if not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    path = in_flight.pop(future)
+                    result_rows = future.result()
+
+                    screened += 1
+                    unreadable += (
+                        result_rows[0]["explanation"] == UNREADABLE_EXPLANATION
+                    )
+                    buffered_rows.extend(result_rows)
+                    buffered_paths.append(path)
+
+                if len(buffered_paths) >= flush_every:
+                    flush()
+                    if progress:
+                        progress(len(done) + screened, len(paths))
+
+            flush()
+        except KeyboardInterrupt:
+            # keep what already finished; the rest is redone on resume
+            flush()
+            raise
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            writer.close()
+
+        if progress:
+            progress(len(done) + screened, len(paths))
+
+        return BatchSummary(
+            total=len(paths),
+            skipped=len(paths) - len(pending),
+            screened=screened,
+            unreadable=unreadable,
+            rows=rows,
+            seconds=round(time.perf_counter() - started, 3),
+        )
+
+    finally:
+        checkpoint.close()
@@ -0,0 +1,572 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config import get_settings
+from app.services.dedup import SimHashIndex, simhash, to_signed, to_unsigned
+from app.services.embedding_service import get_embeddings
+from app.services.llm_explainer import TERM_MATCHER, segment
+from app.services.vector_scoring import VectorMatrix, normalize_rows
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from app.services.resume_sections import ResumeSections
+
+WORD_BITS = 64
+
+
+# -------------------------------------------------
+# Skill bitsets as uint64 words
+# -------------------------------------------------
+def _to_words(bits: int, words: int) -> "np.ndarray":
+    """
+    TERM_MATCHER bitset → `words` uint64 words (lowest bits first).
+    """
+
+    import numpy as np
+
+    mask = (1 << WORD_BITS) - 1
+    return np.array(
+        [(bits >> (WORD_BITS * i)) & mask for i in range(words)],
+        dtype=np.uint64
+    )
+
+
+def _from_words(row: "np.ndarray") -> int:
+    bits = 0
+    for i, word in enumerate(row.tolist()):
+        bits |= int(word) << (WORD_BITS * i)
+    return bits
+
+
+def _popcount(words: "np.ndarray") -> "np.ndarray":
+    """
+    Set bits per row of a (rows, words) uint64 matrix.
+    """
+
+    import numpy as np
+
+    if hasattr(np, "bitwise_count"):
+        counts = np.bitwise_count(words)
+    else:
+        counts = np.unpackbits(
+            words.view(np.uint8).reshape(words.shape + (8,)), axis=-1
+        ).sum(axis=-1)
+    return counts.sum(axis=1, dtype=np.int64)
+
+
+# -------------------------------------------------
+# Persistent Candidate Pool
+# -------------------------------------------------
+class CandidateStore:
+    """
+    Write-once store of parsed candidates for talent-pool queries.
+
+    Layout (inside `directory`):
+    - candidates.sqlite3 → text, skills, years, experience flag
+    - vectors.f32        → memory-mapped float32 matrix,
+                           one L2-normalized row per candidate
+                           (rebuilt from the stored texts when the
+                           embedding size changes)
+
+    A skill bitset matrix (one row of uint64 words per candidate,
+    bits from TERM_MATCHER's vocabulary) and a SimHash index
+    (near-duplicate detection across ingests) are kept in memory
+    and rebuilt from SQLite on open.
+
+    Query = skill prefilter (AND + popcount over the bitset matrix)
+    → brute-force cosine (one pool × JD matmul on the memmap slice).
+    """
+
+    GROWTH_ROWS = 1024
+    REBUILD_BATCH = 256
+
+    def __init__(self, directory: str, max_distance: int = 3):
+        import numpy as np
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._vector_path = os.path.join(directory, "vectors.f32")
+
+        self._db = sqlite3.connect(
+            os.path.join(directory, "candidates.sqlite3"),
+            check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS candidates ("
+            " row INTEGER PRIMARY KEY,"
+            " name TEXT NOT NULL,"
+            " content_hash TEXT UNIQUE NOT NULL,"
+            " text TEXT NOT NULL,"
+            " skills TEXT NOT NULL,"
+            " years INTEGER NOT NULL,"
+            " has_experience INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " simhash INTEGER);"
+            "CREATE TABLE IF NOT EXISTS meta ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL);"
+        )
+
+        # pools created before near-duplicate detection
+        columns = {
+            row[1] for row in self._db.execute(
+                "PRAGMA table_info(candidates)"
+            )
+        }
+        if "simhash" not in columns:
+            self._db.execute(
+                "ALTER TABLE candidates ADD COLUMN simhash INTEGER"
+            )
+
+        self._db.commit()
+
+        self._count = 0
+        self._dim = int(self._meta("dim") or 0)
+        self._vectors: "Optional[np.memmap]" = None
+        self._words = max(
+            1, -(-len(TERM_MATCHER.vocabulary) // WORD_BITS)
+        )
+        self._skill_bits = np.zeros((0, self._words), dtype=np.uint64)
+        self._signatures = SimHashIndex(max_distance)
+
+        self._load()
+        self._db.commit()
+
+    # ---------- metadata ----------
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, value)
+        )
+
+    # ---------- loading ----------
+    def _load(self, start: int = 0) -> None:
+        """
+        Index stored rows >= start (all on open; rows other processes
+        added, before a write). Commits are left to the caller.
+        """
+
+        missing = []
+        count = self._count
+
+        for row, skills, signature in self._db.execute(
+            "SELECT row, skills, simhash FROM candidates WHERE row >= ?",
+            (start,)
+        ):
+            self._index_skills(row, TERM_MATCHER.encode(json.loads(skills)))
+            self._count = max(self._count, row + 1)
+
+            if signature is None:
+                missing.append(row)
+            else:
+                self._signatures.add(to_unsigned(signature), row)
+
+        for row in missing:
+            (text,) = self._db.execute(
+                "SELECT text FROM candidates WHERE row = ?", (row,)
+            ).fetchone()
+            signature = simhash(text)
+            self._signatures.add(signature, row)
+            self._db.execute(
+                "UPDATE candidates SET simhash = ? WHERE row = ?",
+                (to_signed(signature), row)
+            )
+
+        if not self._dim:
+            self._dim = int(self._meta("dim") or 0)
+
+        if (
+            self._dim and os.path.exists(self._vector_path)
+            and (start == 0 or self._count > count)
+        ):
+            self._open_vectors(self._count)
+
+    def _index_skills(self, row: int, skill_bits: int) -> None:
+        import numpy as np
+
+        if row >= len(self._skill_bits):
+            grown = np.zeros(
+                (row + self.GROWTH_ROWS, self._words), dtype=np.uint64
+            )
+            grown[:len(self._skill_bits)] = self._skill_bits
+            self._skill_bits = grown
+
+        self._skill_bits[row] = _to_words(skill_bits, self._words)
+
+    # ---------- vector file ----------
+    def _open_vectors(self, min_rows: int) -> None:
+        """
+        (Re)map the vector file with room for at least min_rows rows.
+        The file grows in GROWTH_ROWS steps; unused rows stay zero.
+        """
+
+        import numpy as np
+
+        row_bytes = self._dim * 4
+        current_rows = (
+            os.path.getsize(self._vector_path) // row_bytes
+            if os.path.exists(self._vector_path) else 0
+        )
+
+        rows = max(current_rows, 1)
+        while rows < min_rows:
+            rows += self.GROWTH_ROWS
+
+        if rows != current_rows:
+            if self._vectors is not None:
+                self._vectors.flush()
+            with open(self._vector_path, "ab") as f:
+                f.truncate(rows * row_bytes)
+
+        self._vectors = np.memmap(
+            self._vector_path,
+            dtype=np.float32,
+            mode="r+",
+            shape=(rows, self._dim)
+        )
+
+    def _rebuild_vectors(self, dim: int) -> None:
+        """
+        Re-embed every stored candidate into a new vector file with
+        `dim` columns. Rows whose text cannot be embedded stay zero.
+        Called with the lock held.
+        """
+
+        print(
+            f"[Candidate Store] Embedding size changed ({self._dim} -> {dim}):"
+            f" re-embedding {self._count} stored candidates"
+        )
+
+        self._vectors = None
+        if os.path.exists(self._vector_path):
+            os.remove(self._vector_path)
+
+        self._dim = dim
+        self._set_meta("dim", str(dim))
+        self._open_vectors(self._count)
+
+        for start in range(0, self._count, self.REBUILD_BATCH):
+            rows = self._db.execute(
+                "SELECT row, text FROM candidates"
+                " WHERE row >= ? AND row < ? ORDER BY row",
+                (start, start + self.REBUILD_BATCH)
+            ).fetchall()
+
+            vectors = normalize_rows(get_embeddings([text for _, text in rows]))
+            if vectors.shape[1] != dim:
+                print(
+                    f"[Candidate Store] Re-embedding failed for rows"
+                    f" {start}-{start + len(rows) - 1}"
+                )
+                continue
+
+            for (row, _), vector in zip(rows, vectors):
+                self._vectors[row] = vector
+
+        self._vectors.flush()
+
+    # ---------- ingest ----------
+    def _known_hashes(self, hashes: List[str]) -> Set[str]:
+        known: Set[str] = set()
+
+        # stay below SQLite's bound-parameter limit
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            known.update(
+                h for (h,) in self._db.execute(
+                    "SELECT content_hash FROM candidates"
+                    f" WHERE content_hash IN ({placeholders})",
+                    chunk
+                )
+            )
+
+        return known
+
+    def add_many(
+        self,
+        items: Iterable[Tuple[str, str, str]]
+    ) -> Dict[str, int]:
+        """
+        Add (name, content_hash, text) triples.
+        Already-stored content hashes are skipped, and so are texts
+        within the SimHash distance of a stored (or earlier) candidate.
+        Embeddings for all new candidates are computed in one batch,
+        outside the lock; the checks are repeated when writing, in
+        case another writer stored the same resume meanwhile.
+        """
+
+        items = [item for item in items if item[2] and item[2].strip()]
+
+        with self._lock:
+            known = self._known_hashes([h for _, h, _ in items])
+
+            fresh, seen, signatures = [], set(), []
+            near_duplicates = 0
+            batch_index = SimHashIndex(self._signatures.max_distance)
+
+            for name, content_hash, text in items:
+                if content_hash in known or content_hash in seen:
+                    continue
+                seen.add(content_hash)
+
+                signature = simhash(text)
+                if (
+                    self._signatures.find(signature) is not None
+                    or batch_index.find(signature) is not None
+                ):
+                    near_duplicates += 1
+                    continue
+
+                batch_index.add(signature, len(fresh))
+                fresh.append((name, content_hash, text))
+                signatures.append(signature)
+
+        if not fresh:
+            return {
+                "added": 0,
+                "duplicates": len(items) - near_duplicates,
+                "near_duplicates": near_duplicates,
+            }
+
+        vectors = normalize_rows(get_embeddings([t for _, _, t in fresh]))
+        sections = [segment(text) for _, _, text in fresh]
+
+        with self._lock:
+            # row ids come from SQLite inside the write transaction, so
+            # concurrent writers (other processes) never share one
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                added = self._insert(fresh, signatures, sections, vectors)
+                self._db.commit()
+            except BaseException:
+                self._db.rollback()
+                raise
+
+        return {
+            "added": added,
+            "duplicates": len(items) - added - near_duplicates,
+            "near_duplicates": near_duplicates,
+        }
+
+    def _insert(
+        self,
+        fresh: List[Tuple[str, str, str]],
+        signatures: List[int],
+        sections: List["ResumeSections"],
+        vectors: "np.ndarray"
+    ) -> int:
+        """
+        Write the checked candidates; called with the lock held,
+        inside a write transaction. Returns the number stored.
+        """
+
+        # candidates other processes stored since we last looked
+        self._load(start=self._count)
+
+        known = self._known_hashes([h for _, h, _ in fresh])
+        keep = [
+            offset for offset, (_, content_hash, _) in enumerate(fresh)
+            if content_hash not in known
+            and self._signatures.find(signatures[offset]) is None
+        ]
+        if not keep:
+            return 0
+
+        if not vectors.shape[1]:
+            print(
+                f"[Candidate Store] No embeddings: {len(keep)}"
+                " candidates stored without vectors"
+            )
+        elif not self._dim:
+            self._dim = vectors.shape[1]
+            self._set_meta("dim", str(self._dim))
+        elif vectors.shape[1] != self._dim:
+            # the embedding backend changed: old rows are not
+            # comparable with the new vectors any more
+            self._rebuild_vectors(vectors.shape[1])
+
+        store_vectors = bool(self._dim) and vectors.shape[1] == self._dim
+        if store_vectors:
+            self._open_vectors(self._count + len(keep))
+
+        now = time.time()
+        for offset in keep:
+            name, content_hash, text = fresh[offset]
+            row = self._count
+            skill_bits = sections[offset].skill_bits
+
+            self._db.execute(
+                "INSERT INTO candidates (row, name, content_hash, text,"
+                " skills, years, has_experience, created_at, simhash)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    row,
+                    name,
+                    content_hash,
+                    text,
+                    json.dumps(TERM_MATCHER.decode(skill_bits)),
+                    sections[offset].years,
+                    int(sections[offset].has_experience),
+                    now,
+                    to_signed(signatures[offset]),
+                )
+            )
+
+            if store_vectors:
+                self._vectors[row] = vectors[offset]
+
+            self._index_skills(row, skill_bits)
+            self._signatures.add(signatures[offset], row)
+            self._count += 1
+
+        if store_vectors:
+            self._vectors.flush()
+
+        return len(keep)
+
+    # ---------- query ----------
+    def search(
+        self,
+        job_description: str,
+        top_k: int = 20,
+        min_skill_overlap: int = 1
+    ) -> List[Dict]:
+        """
+        Rank stored candidates against a job description.
+        See search_many.
+        """
+        return self.search_many(
+            [job_description], top_k, min_skill_overlap
+        )[0]
+
+    def search_many(
+        self,
+        job_descriptions: List[str],
+        top_k: int = 20,
+        min_skill_overlap: int = 1
+    ) -> List[List[Dict]]:
+        """
+        Rank stored candidates against several job descriptions at once.
+
+        1. prefilter: candidates sharing >= min_skill_overlap JD skills
+           (skipped when the JD mentions no known skills)
+        2. rank: cosine similarity to the JD embedding,
+           ties broken by skill overlap
+
+        The JDs are embedded in one batch before the lock is taken,
+        and the pool × JD similarity matrix is one matmul.
+        Returns one ranked list per job description.
+        """
+
+        import numpy as np
+
+        if not job_descriptions:
+            return []
+
+        jds = VectorMatrix(get_embeddings(list(job_descriptions)))
+        jd_bits = [TERM_MATCHER.find_bits(jd) for jd in job_descriptions]
+
+        selections = []
+        with self._lock:
+            count = self._count
+            if not count or top_k <= 0:
+                return [[] for _ in job_descriptions]
+
+            if self._vectors is not None:
+                pool = VectorMatrix(self._vectors[:count], normalized=True)
+                similarity = pool.similarity(jds)
+            else:
+                similarity = np.zeros(
+                    (count, len(jds)), dtype=np.float32
+                )
+
+            skill_words = self._skill_bits[:count]
+
+            for col, bits in enumerate(jd_bits):
+                overlap = _popcount(
+                    skill_words & _to_words(bits, self._words)
+                )
+
+                if bits and min_skill_overlap > 0:
+                    rows = np.flatnonzero(overlap >= min_skill_overlap)
+                else:
+                    rows = np.arange(count, dtype=np.int64)
+
+                column = similarity[rows, col]
+                order = np.lexsort((-overlap[rows], -column))[:top_k]
+                top_rows = rows[order]
+
+                selections.append((
+                    top_rows.tolist(),
+                    column[order].tolist(),
+                    [_from_words(words) for words in skill_words[top_rows]],
+                    bits
+                ))
+
+        return [self._fetch(*selection) for selection in selections]
+
+    def _fetch(
+        self,
+        rows: List[int],
+        similarities: List[float],
+        skill_bits: List[int],
+        jd_bits: int
+    ) -> List[Dict]:
+        if not rows:
+            return []
+
+        placeholders = ",".join("?" * len(rows))
+        with self._lock:
+            records = {
+                row: (name, years, has_experience)
+                for row, name, years, has_experience in self._db.execute(
+                    "SELECT row, name, years, has_experience FROM candidates"
+                    f" WHERE row IN ({placeholders})",
+                    rows
+                )
+            }
+
+        results = []
+        for row, similarity, bits in zip(rows, similarities, skill_bits):
+            name, years, has_experience = records[row]
+            results.append({
+                "candidate_id": row,
+                "candidate_name": name,
+                "similarity": max(0, min(100, int(similarity * 100))),
+                "matched_skills": list(TERM_MATCHER.decode(bits & jd_bits)),
+                "missing_skills": list(TERM_MATCHER.decode(jd_bits & ~bits)),
+                "years": years,
+                "has_experience": bool(has_experience),
+            })
+
+        return results
+
+    def __len__(self) -> int:
+        return self._count
+
+
+# -------------------------------------------------
+# Singleton
+# -------------------------------------------------
+@lru_cache
+def get_candidate_store() -> CandidateStore:
+    settings = get_settings()
+    return CandidateStore(
+        settings.CANDIDATE_STORE_DIR,
+        max_distance=settings.DEDUP_MAX_DISTANCE
+    )
@@ -0,0 +1,240 @@
+import asyncio
+import hashlib
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from app.config import get_settings
+from app.services.skill_matcher import tokenize
+
+if TYPE_CHECKING:
+    import numpy as np
+
+SIGNATURE_BITS = 64
+SHINGLE_SIZE = 3
+
+
+# -------------------------------------------------
+# SimHash signatures
+# -------------------------------------------------
+def _shingle_hashes(text: str) -> "np.ndarray":
+    import numpy as np
+
+    tokens = tokenize(text)
+    if len(tokens) < SHINGLE_SIZE:
+        shingles = [" ".join(tokens)] if tokens else []
+    else:
+        shingles = [
+            " ".join(tokens[i:i + SHINGLE_SIZE])
+            for i in range(len(tokens) - SHINGLE_SIZE + 1)
+        ]
+
+    return np.fromiter(
+        (
+            int.from_bytes(
+                hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(),
+                "little"
+            )
+            for s in shingles
+        ),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+
+
+def simhash(text: str) -> int:
+    """
+    64-bit SimHash over word 3-shingles (repeated shingles weigh more).
+    Near-identical texts get signatures a few bits apart.
+    """
+
+    import numpy as np
+
+    hashes = _shingle_hashes(text or "")
+    if not hashes.size:
+        return 0
+
+    # (n, 64) bit matrix → per-bit majority vote
+    bits = np.unpackbits(
+        hashes.view(np.uint8).reshape(-1, 8), axis=1, bitorder="little"
+    )
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 - len(hashes)
+
+    packed = np.packbits(votes > 0, bitorder="little")
+    return int(packed.view(np.uint64)[0])
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def to_signed(signature: int) -> int:
+    """
+    uint64 → int64, for storage in SQLite INTEGER columns.
+    """
+    return signature - (1 << 64) if signature >= 1 << 63 else signature
+
+
+def to_unsigned(signature: int) -> int:
+    return signature & ((1 << 64) - 1)
+
+
+# -------------------------------------------------
+# LSH index (banded exact-match lookup)
+# -------------------------------------------------
+class SimHashIndex:
+    """
+    Finds stored signatures within `max_distance` bits.
+
+    The 64 bits are split into max_distance + 1 bands; two signatures
+    within max_distance bits must agree exactly on at least one band
+    (pigeonhole), so only items sharing a band are compared.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width = SIGNATURE_BITS // bands
+
+        self._bands: List[Tuple[int, int]] = [
+            (i * width, width if i < bands - 1 else SIGNATURE_BITS - i * width)
+            for i in range(bands)
+        ]
+        self._tables: List[Dict[int, List[Tuple[int, object]]]] = [
+            defaultdict(list) for _ in self._bands
+        ]
+
+    def _keys(self, signature: int):
+        for table, (shift, width) in zip(self._tables, self._bands):
+            yield table, (signature >> shift) & ((1 << width) - 1)
+
+    def add(self, signature: int, item) -> None:
+        for table, key in self._keys(signature):
+            table[key].append((signature, item))
+
+    def find(self, signature: int):
+        """
+        Closest stored item within max_distance bits, else None.
+        """
+
+        best, best_distance = None, self.max_distance + 1
+
+        for table, key in self._keys(signature):
+            for other, item in table.get(key, ()):
+                distance = hamming(signature, other)
+                if distance < best_distance:
+                    best, best_distance = item, distance
+
+        return best
+
+
+# -------------------------------------------------
+# Per-batch duplicate coordination
+# -------------------------------------------------
+class BatchDeduplicator:
+    """
+    Collapses duplicate resumes inside one analysis batch.
+
+    - exact: same raw upload bytes (content hash) → claimed right after
+      ingestion, the copy is never parsed or scored
+    - near:  extracted text within `max_distance` SimHash bits of an
+      earlier resume (re-exports, tiny edits) → the copy is not scored
+
+    The first copy to reach a check becomes the group leader; later
+    copies await the leader's (result, features) and reuse them.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self._exact: Dict[str, int] = {}
+        self._near = SimHashIndex(max_distance)
+        self._names: Dict[int, str] = {}
+        self._members: Dict[int, List[Tuple[int, str]]] = defaultdict(list)
+        self._futures: Dict[int, asyncio.Future] = {}
+
+    def _future(self, index: int) -> asyncio.Future:
+        future = self._futures.get(index)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[index] = future
+        return future
+
+    def claim_exact(
+        self,
+        index: int,
+        candidate_name: str,
+        content_hash: Optional[str]
+    ) -> Optional[int]:
+        """
+        Register an upload; returns the leader index if it is a copy.
+        """
+
+        self._names[index] = candidate_name
+        if not content_hash:
+            return None
+
+        leader = self._exact.setdefault(content_hash, index)
+        if leader == index:
+            return None
+
+        self._members[leader].append((index, "exact"))
+        return leader
+
+    def claim_near(self, index: int, resume_text: str) -> Optional[int]:
+        """
+        Register extracted text; returns the leader index if it is a
+        near-duplicate of an earlier resume.
+        """
+
+        signature = simhash(resume_text)
+        leader = self._near.find(signature)
+
+        if leader is None:
+            self._near.add(signature, index)
+            return None
+
+        self._members[leader].append((index, "near"))
+        return leader
+
+    async def wait(self, leader: int):
+        return await asyncio.shield(self._future(leader))
+
+    def resolve(self, index: int, outcome) -> None:
+        future = self._future(index)
+        if not future.done():
+            future.set_result(outcome)
+
+    def fail(self, index: int, error: BaseException) -> None:
+        future = self._future(index)
+        if future.done():
+            return
+
+        if isinstance(error, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(error)
+            # followers may be gone already; don't log "never retrieved"
+            future.exception()
+
+    def groups(self) -> List[Dict]:
+        return [
+            {
+                "candidate_name": self._names.get(leader, ""),
+                "duplicates": [
+                    {
+                        "candidate_name": self._names.get(index, ""),
+                        "match": kind,
+                    }
+                    for index, kind in sorted(members)
+                ],
+            }
+            for leader, members in sorted(self._members.items())
+        ]
+
+
+def batch_deduplicator() -> Optional[BatchDeduplicator]:
+    """
+    New per-request deduplicator, or None when DEDUP_ENABLED is off.
+    """
+    settings = get_settings()
+    if not settings.DEDUP_ENABLED:
+        return None
+    return BatchDeduplicator(settings.DEDUP_MAX_DISTANCE)
@@ -0,0 +1,159 @@
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional
+
+from app.config import get_settings
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# ---------------------------------------------
+# Optional SDK Imports (lazy, SAFE)
+# ---------------------------------------------
+# google-generativeai and scikit-learn take seconds to import, so they
+# are loaded on first backend construction (or during warm-up), not
+# when the app module is imported.
+def _import_genai():
+    try:
+        import google.generativeai as genai
+        return genai
+    except ImportError:
+        return None
+
+
+def _import_hashing_vectorizer():
+    try:
+        from sklearn.feature_extraction.text import HashingVectorizer
+        return HashingVectorizer
+    except ImportError:
+        return None
+
+
+# ---------------------------------------------
+# Backend Interface
+# ---------------------------------------------
+class EmbeddingBackend:
+    """
+    Turns a batch of texts into a (len(texts), dim) float32 matrix.
+
+    Backends return None when the whole batch fails;
+    callers treat that as "no embeddings available".
+    """
+
+    name = "base"
+
+    def embed(self, texts: List[str]) -> "Optional[np.ndarray]":
+        raise NotImplementedError
+
+
+# ---------------------------------------------
+# Gemini Backend (network)
+# ---------------------------------------------
+class GeminiEmbeddingBackend(EmbeddingBackend):
+    name = "gemini"
+
+    # Gemini accepts at most 100 texts per embed call
+    MAX_BATCH = 100
+
+    def __init__(
+        self,
+        genai,
+        api_key: str,
+        model: str = "models/embedding-001"
+    ):
+        genai.configure(api_key=api_key)
+        self._genai = genai
+        self.model = model
+
+    def embed(self, texts: List[str]) -> "Optional[np.ndarray]":
+        import numpy as np
+
+        rows = []
+
+        try:
+            for start in range(0, len(texts), self.MAX_BATCH):
+                response = self._genai.embed_content(
+                    model=self.model,
+                    content=texts[start:start + self.MAX_BATCH],
+                    task_type="semantic_similarity"
+                )
+                rows.extend(response.get("embedding", []))
+
+            if len(rows) != len(texts):
+                print("[Embedding] Gemini returned an incomplete batch")
+                return None
+
+            return np.asarray(rows, dtype=np.float32)
+
+        except Exception as e:
+            print("[Embedding] Failed to generate embedding:", e)
+            return None
+
+
+# ---------------------------------------------
+# Local Backend (offline, stateless)
+# ---------------------------------------------
+class LocalHashingBackend(EmbeddingBackend):
+    """
+    Hashed unigram + bigram term vectors (L2-normalized).
+    No model download, no fitting, no network.
+    """
+
+    name = "local"
+
+    def __init__(self, vectorizer_cls, dim: int = 1024):
+        import numpy as np
+
+        self.dim = dim
+        self._vectorizer = vectorizer_cls(
+            n_features=dim,
+            ngram_range=(1, 2),
+            stop_words="english",
+            alternate_sign=False,
+            norm="l2",
+            dtype=np.float32
+        )
+
+    def embed(self, texts: List[str]) -> "Optional[np.ndarray]":
+        try:
+            return self._vectorizer.transform(texts).toarray()
+        except Exception as e:
+            print("[Embedding] Local embedding failed:", e)
+            return None
+
+
+# ---------------------------------------------
+# Backend Selection
+# ---------------------------------------------
+@lru_cache
+def get_embedding_backend() -> Optional[EmbeddingBackend]:
+    """
+    EMBEDDING_BACKEND:
+    - "gemini" → Gemini only
+    - "local"  → offline hashing vectors only
+    - "auto"   → Gemini if a key is configured, else local
+    - "none"   → embeddings disabled
+    """
+
+    settings = get_settings()
+    choice = settings.EMBEDDING_BACKEND
+    api_key = os.getenv("GEMINI_API_KEY")
+
+    genai = _import_genai() if choice in ("gemini", "auto") and api_key else None
+
+    if genai:
+        try:
+            return GeminiEmbeddingBackend(
+                genai,
+                api_key=api_key,
+                model=settings.EMBEDDING_MODEL
+            )
+        except Exception as e:
+            print("[Embedding] Gemini config failed:", e)
+
+    if choice in ("local", "auto"):
+        vectorizer_cls = _import_hashing_vectorizer()
+        if vectorizer_cls is not None:
+            return LocalHashingBackend(vectorizer_cls, dim=settings.EMBEDDING_DIM)
+
+    return None
@@ -1,31 +1,129 @@
-import os
-from typing import List
-import numpy as np
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from app.config import get_settings
+from app.services.embedding_backends import get_embedding_backend
+from app.utils import metrics
+from app.utils.metrics import timed
+
+if TYPE_CHECKING:
+    import numpy as np
+
 
 # ---------------------------------------------
-# Optional Gemini Import (SAFE)
+# Embedding Cache (LRU, keyed by text hash)
 # ---------------------------------------------
-try:
-    import google.generativeai as genai
-except ImportError:
-    genai = None
+class EmbeddingCache:
+    """
+    Bounded LRU of embeddings keyed by (backend, SHA-256 of text).
+    The same job description is embedded once, not once per resume.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], np.ndarray]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple[str, str]) -> "Optional[np.ndarray]":
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return vector
+
+    def put(self, key: Tuple[str, str], vector: "np.ndarray") -> None:
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+_cache = EmbeddingCache(get_settings().EMBEDDING_CACHE_SIZE)
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
 
 # ---------------------------------------------
-# Gemini Embedding Configuration
+# Batch embeddings (SAFE)
 # ---------------------------------------------
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-EMBEDDING_MODEL = "models/embedding-001"
+@timed("get_embeddings")
+def get_embeddings(texts: List[str]) -> "np.ndarray":
+    """
+    Embed many texts with one backend call for all cache misses.
 
-client_ready = False
+    Returns a (len(texts), dim) float32 matrix.
+    Empty / failed texts get zero rows.
+    If no backend is available the matrix has dim 0.
+    NEVER crashes.
+    """
 
-if genai and GEMINI_API_KEY:
-    try:
-        genai.configure(api_key=GEMINI_API_KEY)
-        client_ready = True
-    except Exception as e:
-        print("[Embedding] Gemini config failed:", e)
-        client_ready = False
+    import numpy as np
+
+    backend = get_embedding_backend()
+
+    if backend is None or not texts:
+        return np.zeros((len(texts), 0), dtype=np.float32)
+
+    vectors: List[Optional[np.ndarray]] = [None] * len(texts)
+    pending: Dict[str, List[int]] = {}
+
+    for i, text in enumerate(texts):
+        if not text or not text.strip():
+            continue
+
+        key = text_hash(text)
+        cached = _cache.get((backend.name, key))
+
+        if cached is not None:
+            vectors[i] = cached
+        else:
+            pending.setdefault(key, []).append(i)
+
+    if pending:
+        keys = list(pending)
+        with metrics.timer("embedding_backend"):
+            embedded = backend.embed([texts[pending[k][0]] for k in keys])
+
+        if embedded is not None:
+            for key, row in zip(keys, embedded):
+                _cache.put((backend.name, key), row)
+                for i in pending[key]:
+                    vectors[i] = row
+
+    dim = next((v.shape[0] for v in vectors if v is not None), 0)
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+
+    for i, vector in enumerate(vectors):
+        if vector is not None:
+            matrix[i] = vector
+
+    return matrix
 
 
 # ---------------------------------------------
@@ -33,29 +131,23 @@ if genai and GEMINI_API_KEY:
 # ---------------------------------------------
 def get_embedding(text: str) -> List[float]:
     """
-    Convert text into embedding using Gemini.
+    Convert text into an embedding.
     NEVER crashes – returns empty list on failure.
     """
 
-    if not client_ready:
+    if not text or not text.strip():
         return []
 
-    if not text or not text.strip():
+    vector = get_embeddings([text])[0]
+
+    if not vector.size or not vector.any():
         return []
 
-    try:
-        response = genai.embed_content(
-            model=EMBEDDING_MODEL,
-            content=text,
-            task_type="semantic_similarity"
-        )
+    return vector.tolist()
 
-        embedding = response.get("embedding", [])
-        return embedding if isinstance(embedding, list) else []
 
-    except Exception as e:
-        print("[Embedding] Failed to generate embedding:", e)
-        return []
+def embedding_cache_stats() -> Dict[str, int]:
+    return _cache.stats()
 
 
 # ---------------------------------------------
@@ -67,12 +159,14 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     Returns value between 0.0 and 1.0
     """
 
-    if not vec1 or not vec2:
+    import numpy as np
+
+    if vec1 is None or vec2 is None or len(vec1) == 0 or len(vec2) == 0:
         return 0.0
 
     try:
-        v1 = np.array(vec1, dtype=float)
-        v2 = np.array(vec2, dtype=float)
+        v1 = np.asarray(vec1, dtype=float)
+        v2 = np.asarray(vec2, dtype=float)
 
         denom = np.linalg.norm(v1) * np.linalg.norm(v2)
         if denom == 0:
@@ -94,13 +188,16 @@ def resume_jd_similarity_score(
 ) -> int:
     """
     Semantic similarity score using embeddings.
+    Both texts are embedded in one batch; the JD is served
+    from cache after the first resume.
     SAFE fallback → returns 0 if embedding unavailable.
     """
 
-    resume_embedding = get_embedding(resume_text)
-    jd_embedding = get_embedding(job_description)
+    resume_embedding, jd_embedding = get_embeddings(
+        [resume_text, job_description]
+    )
 
     similarity = cosine_similarity(resume_embedding, jd_embedding)
 
     score = int(similarity * 100)
-    return max(0, min(score, 100))
\ No newline at end of file
+    return max(0, min(score, 100))
@@ -0,0 +1,340 @@
+import codecs
+import html
+import io
+import re
+import zipfile
+from typing import Callable, List, NamedTuple, Optional, Union
+from xml.etree import ElementTree
+
+from app.config import get_settings
+from app.services.pdf_engine import (
+    ExtractionOptions,
+    ParsedPdf,
+    PdfSource,
+    default_options,
+    parse_pdf_range,
+)
+
+# Bytes read from the start of a document to pick its extractor
+HEAD_BYTES = 2048
+
+PDF_MAGIC = b"%PDF-"
+PDF_HEADER_WINDOW = 1024
+ZIP_MAGIC = b"PK\x03\x04"
+
+DOCX_MIME = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+
+
+# ---------------------------
+# Registry
+# ---------------------------
+class Extractor(NamedTuple):
+    """
+    One resume format.
+
+    sniff:            magic-byte check on the first HEAD_BYTES of the file
+    extract:          (bytes or path, options) -> ParsedPdf (same result
+                      type for every format; pages stay 0 for non-PDFs)
+    use_process_pool: CPU-heavy → run in the PDF process pool,
+                      otherwise a thread is enough
+    """
+    name: str
+    mime: str
+    sniff: Callable[[bytes], bool]
+    extract: Callable[[PdfSource, ExtractionOptions], ParsedPdf]
+    use_process_pool: bool = True
+
+
+EXTRACTORS: List[Extractor] = []
+
+
+def register_extractor(extractor: Extractor, first: bool = False) -> None:
+    """
+    Add a format. Sniffers are tried in registration order
+    (first=True puts a more specific format in front).
+    """
+    if first:
+        EXTRACTORS.insert(0, extractor)
+    else:
+        EXTRACTORS.append(extractor)
+
+
+def sniff_format(head: bytes) -> Optional[Extractor]:
+    """
+    Extractor for a document, by content (never by file name).
+    Formats whose MIME type is not in ALLOWED_RESUME_TYPES are refused.
+    """
+    allowed = set(get_settings().ALLOWED_RESUME_TYPES)
+
+    for extractor in EXTRACTORS:
+        if extractor.mime in allowed and extractor.sniff(head):
+            return extractor
+    return None
+
+
+def read_head(source: PdfSource) -> bytes:
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source[:HEAD_BYTES])
+
+    with open(source, "rb") as f:
+        return f.read(HEAD_BYTES)
+
+
+def extract_document(
+    source: PdfSource,
+    options: Optional[ExtractionOptions] = None
+) -> ParsedPdf:
+    """
+    Sniff the format and extract text with its extractor.
+    Top-level (picklable) so it can run inside a process pool.
+    """
+
+    try:
+        extractor = sniff_format(read_head(source))
+    except OSError as e:
+        print(f"[Resume Parser] Cannot read document: {e}")
+        return ParsedPdf(None)
+
+    if extractor is None:
+        print("[Resume Parser] Unsupported document format")
+        return ParsedPdf(None)
+
+    return extractor.extract(source, options or default_options())
+
+
+# ---------------------------
+# Shared helpers
+# ---------------------------
+def _read(source: PdfSource) -> Union[bytes, bytearray]:
+    if isinstance(source, (bytes, bytearray)):
+        return source
+
+    with open(source, "rb") as f:
+        return f.read()
+
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def _decode(data: bytes) -> str:
+    for bom, encoding in _BOMS:
+        if data.startswith(bom):
+            return data.decode(encoding, errors="replace")
+
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        # legacy exports (Word "Save as text", old ATS systems)
+        return data.decode("cp1252", errors="replace")
+
+
+def _finish(text: str, options: ExtractionOptions) -> ParsedPdf:
+    text = text.strip()
+    truncated = bool(options.max_chars) and len(text) > options.max_chars
+    if truncated:
+        text = text[:options.max_chars]
+
+    return ParsedPdf(text or None, truncated=truncated)
+
+
+# ---------------------------
+# PDF
+# ---------------------------
+def _sniff_pdf(head: bytes) -> bool:
+    return PDF_MAGIC in head[:PDF_HEADER_WINDOW]
+
+
+def _extract_pdf(source: PdfSource, options: ExtractionOptions) -> ParsedPdf:
+    return parse_pdf_range(source, 0, None, options)
+
+
+# ---------------------------
+# DOCX (stdlib zipfile + streaming XML)
+# ---------------------------
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_TEXT = _W + "t"
+_W_TAB = _W + "tab"
+_W_BREAKS = {_W + "br", _W + "cr"}
+_W_PARAGRAPH = _W + "p"
+
+# document.xml compresses well, but not like a zip bomb
+DOCX_MAX_RATIO = 200
+
+
+# entry names of a Word package; the first local headers (in the
+# head) name [Content_Types].xml or word/* parts
+_DOCX_MARKERS = (b"[Content_Types].xml", b"word/")
+
+
+def _sniff_docx(head: bytes) -> bool:
+    # extraction still confirms word/document.xml
+    return head.startswith(ZIP_MAGIC) and any(
+        marker in head for marker in _DOCX_MARKERS
+    )
+
+
+def _extract_docx(source: PdfSource, options: ExtractionOptions) -> ParsedPdf:
+    """
+    Stream word/document.xml with iterparse: text runs, tabs and
+    breaks are collected in document order, each paragraph is freed
+    once read, and parsing stops at the character budget.
+    """
+
+    parts: List[str] = []
+    chars = 0
+    truncated = False
+
+    archive = source if isinstance(source, str) else io.BytesIO(source)
+
+    try:
+        with zipfile.ZipFile(archive) as docx:
+            info = docx.getinfo("word/document.xml")
+            if info.file_size > max(info.compress_size, 1) * DOCX_MAX_RATIO:
+                print("[Resume Parser] DOCX rejected: compression ratio")
+                return ParsedPdf(None)
+
+            with docx.open(info) as xml:
+                for _, element in ElementTree.iterparse(xml, events=("end",)):
+                    tag = element.tag
+
+                    if tag == _W_TEXT:
+                        if element.text:
+                            parts.append(element.text)
+                            chars += len(element.text)
+                    elif tag == _W_TAB:
+                        parts.append("\t")
+                    elif tag in _W_BREAKS:
+                        parts.append("\n")
+                    elif tag == _W_PARAGRAPH:
+                        parts.append("\n")
+                        element.clear()
+
+                        if options.max_chars and chars >= options.max_chars:
+                            truncated = True
+                            break
+
+    except (KeyError, zipfile.BadZipFile, ElementTree.ParseError, OSError) as e:
+        print(f"[Resume Parser] DOCX parsing error: {e}")
+        return ParsedPdf(None)
+
+    parsed = _finish("".join(parts), options)
+    return parsed._replace(truncated=parsed.truncated or truncated)
+
+
+# ---------------------------
+# HTML (linear strip, no DOM)
+# ---------------------------
+_HTML_MARKERS = (b"<!doctype html", b"<html", b"<head", b"<body")
+
+_HIDDEN_TAGS = ("script", "style", "noscript", "template", "title")
+_HTML_HIDDEN_START = re.compile(
+    r"<!--|<(" + "|".join(_HIDDEN_TAGS) + r")\b", re.IGNORECASE
+)
+_HTML_HIDDEN_END = {
+    tag: re.compile("</" + tag, re.IGNORECASE) for tag in _HIDDEN_TAGS
+}
+_HTML_COMMENT_END = re.compile("-->")
+
+# [^<>] (not [^>]) so an unterminated tag cannot make every later
+# match attempt scan to the end of the document
+_HTML_BLOCK = re.compile(
+    r"<\s*/?\s*(?:p|div|br|li|tr|h[1-6]|section|article|header|footer"
+    r"|ul|ol|table|blockquote|pre|dt|dd)\b[^<>]*>",
+    re.IGNORECASE
+)
+_HTML_TAG = re.compile(r"<[^<>]*>")
+_SPACES = re.compile(r"[ \t\r\f\v\xa0]+")
+_LINE_BREAKS = re.compile(r"\s*\n\s*")
+
+
+def _sniff_html(head: bytes) -> bool:
+    start = head[:PDF_HEADER_WINDOW].lstrip(codecs.BOM_UTF8 + b" \t\r\n")
+    if not start.startswith(b"<"):
+        return False
+
+    start = start.lower()
+    return any(marker in start for marker in _HTML_MARKERS)
+
+
+def _strip_hidden(markup: str) -> str:
+    """
+    Drop comments and script / style / noscript / template / title
+    elements in one forward pass: every search starts where the last
+    one ended, so the cost is linear in the document. An unclosed
+    element hides the rest of the document, as in a browser.
+    """
+
+    parts: List[str] = []
+    position = 0
+
+    while True:
+        start = _HTML_HIDDEN_START.search(markup, position)
+        if start is None:
+            parts.append(markup[position:])
+            break
+
+        parts.append(markup[position:start.start()])
+        parts.append(" ")
+
+        tag = start.group(1)
+        if tag is None:
+            end = _HTML_COMMENT_END.search(markup, start.end())
+            position = end.end() if end else len(markup)
+            continue
+
+        end = _HTML_HIDDEN_END[tag.lower()].search(markup, start.end())
+        close = markup.find(">", end.end()) if end else -1
+        position = close + 1 if close >= 0 else len(markup)
+
+    return "".join(parts)
+
+
+def _extract_html(source: PdfSource, options: ExtractionOptions) -> ParsedPdf:
+    markup = _decode(_read(source))
+
+    markup = _strip_hidden(markup)
+    markup = _HTML_BLOCK.sub("\n", markup)
+    text = html.unescape(_HTML_TAG.sub(" ", markup))
+
+    text = _SPACES.sub(" ", text)
+    text = _LINE_BREAKS.sub("\n", text)
+
+    return _finish(text, options)
+
+
+# ---------------------------
+# Plain text
+# ---------------------------
+# bytes allowed in text besides printable ones: \t \n \f \r ESC
+_TEXT_CONTROLS = bytes(range(32)).translate(None, b"\t\n\x0c\r\x1b")
+
+
+def _sniff_text(head: bytes) -> bool:
+    if head.startswith(tuple(bom for bom, _ in _BOMS)):
+        return True
+    if not head or b"\0" in head:
+        return False
+
+    # binary formats are full of control bytes; text has (almost) none
+    controls = len(head) - len(head.translate(None, _TEXT_CONTROLS))
+    return controls <= len(head) // 100
+
+
+def _extract_text(source: PdfSource, options: ExtractionOptions) -> ParsedPdf:
+    return _finish(_decode(_read(source)), options)
+
+
+# most specific first: PDF, DOCX (Word ZIP), HTML, then any text
+register_extractor(Extractor("pdf", "application/pdf", _sniff_pdf, _extract_pdf))
+register_extractor(Extractor("docx", DOCX_MIME, _sniff_docx, _extract_docx))
+register_extractor(Extractor("html", "text/html", _sniff_html, _extract_html))
+register_extractor(
+    Extractor("text", "text/plain", _sniff_text, _extract_text,
+              use_process_pool=False)
+)
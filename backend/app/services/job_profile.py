@@ -0,0 +1,116 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Dict, FrozenSet, Optional, Tuple
+
+from app.config import get_settings
+from app.services.embedding_service import get_embeddings
+from app.services.llm_explainer import TERM_MATCHER, jd_requires_experience
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# -------------------------------------------------
+# Compiled Job Description
+# -------------------------------------------------
+@dataclass(frozen=True)
+class JobProfile:
+    """
+    Everything about a job description that does not depend on the
+    resume, computed once per JD instead of once per candidate.
+
+    skill_weights: per-skill weight used for the skill score
+                   (uniform for now – a taxonomy can refine it)
+    skill_bits:    JD skills as a TERM_MATCHER bitset
+    """
+
+    jd_hash: str
+    text: str
+    skills: FrozenSet[str]
+    requires_experience: bool
+    skill_bits: int = 0
+    skill_weights: Dict[str, float] = field(default_factory=dict)
+    embedding: "Optional[np.ndarray]" = field(default=None, compare=False)
+
+    # (skill bit, weight) pairs, derived from skill_weights
+    bit_weights: Tuple[Tuple[int, float], ...] = field(
+        default=(), compare=False
+    )
+
+    @property
+    def total_weight(self) -> float:
+        return sum(self.skill_weights.values())
+
+    def matched_weight(self, skill_bits: int) -> float:
+        """
+        Weight of the JD skills present in a resume skill bitset.
+        """
+        return sum(
+            weight for bit, weight in self.bit_weights
+            if skill_bits & bit
+        )
+
+
+def jd_hash(job_description: str) -> str:
+    return hashlib.sha256(job_description.encode("utf-8")).hexdigest()
+
+
+def _compile(job_description: str, digest: str) -> JobProfile:
+    skills = frozenset(TERM_MATCHER.find(job_description))
+    skill_weights = {skill: 1.0 for skill in skills}
+
+    return JobProfile(
+        jd_hash=digest,
+        text=job_description,
+        skills=skills,
+        requires_experience=jd_requires_experience(job_description),
+        skill_bits=TERM_MATCHER.encode(skills),
+        skill_weights=skill_weights,
+        bit_weights=tuple(
+            (TERM_MATCHER.encode((skill,)), weight)
+            for skill, weight in sorted(skill_weights.items())
+        ),
+    )
+
+
+# -------------------------------------------------
+# Bounded LRU of compiled profiles (by JD hash)
+# -------------------------------------------------
+_profiles: "OrderedDict[str, JobProfile]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def compile_job_profile(
+    job_description: str,
+    with_embedding: bool = False
+) -> JobProfile:
+    """
+    Return the compiled profile for a JD (memoized by JD hash).
+    with_embedding=True also attaches the JD embedding vector.
+    """
+
+    digest = jd_hash(job_description)
+
+    with _lock:
+        profile = _profiles.get(digest)
+        if profile is not None:
+            _profiles.move_to_end(digest)
+
+    if profile is None:
+        profile = _compile(job_description, digest)
+
+    if with_embedding and profile.embedding is None:
+        vectors = get_embeddings([job_description])
+        if vectors.shape[1]:
+            profile = replace(profile, embedding=vectors[0])
+
+    with _lock:
+        _profiles[digest] = profile
+        _profiles.move_to_end(digest)
+
+        while len(_profiles) > get_settings().JOB_PROFILE_CACHE_SIZE:
+            _profiles.popitem(last=False)
+
+    return profile
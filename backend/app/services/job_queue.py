@@ -0,0 +1,435 @@
+import json
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import UploadFile
+
+from app.config import get_settings
+from app.services.embedding_service import text_hash
+from app.services.job_profile import compile_job_profile
+from app.services.llm_client import evaluate_blocking
+from app.services.pipeline import (
+    get_pdf_executor,
+    score_resume,
+    unreadable_result,
+)
+from app.services.resume_parser import parse_document_bytes, record_parse
+from app.services.text_cache import get_text_cache, hash_bytes
+from app.utils import metrics
+from app.utils.file_handler import delete_file, save_upload_file
+
+
+# -------------------------------------------------
+# Durable Bulk-Screening Queue
+# -------------------------------------------------
+class JobQueue:
+    """
+    SQLite-backed job queue for bulk screening.
+
+    submit()  -> uploads are written to `directory/files/<job_id>/`
+                 and one row per file is queued; returns immediately
+    workers   -> background threads claim queued files one at a time
+                 and run parse -> LLM (optional) -> final score
+    leases    -> a claim records its owner (pid + queue instance) and a
+                 lease deadline, renewed by a heartbeat thread; files
+                 whose lease expired (crashed worker) are claimed again,
+                 so accepted work is never lost and live claims held by
+                 other processes are left alone
+    """
+
+    POLL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        directory: str,
+        workers: int = 2,
+        lease_seconds: float = 60.0
+    ):
+        self.directory = directory
+        self.files_dir = os.path.join(directory, "files")
+        os.makedirs(self.files_dir, exist_ok=True)
+
+        self.workers = workers
+        self.lease_seconds = lease_seconds
+        self.owner = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(
+            os.path.join(directory, "jobs.sqlite3"),
+            check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " job_description TEXT NOT NULL,"
+            " total INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " finished_at REAL);"
+            "CREATE TABLE IF NOT EXISTS job_files ("
+            " job_id TEXT NOT NULL,"
+            " idx INTEGER NOT NULL,"
+            " filename TEXT NOT NULL,"
+            " path TEXT,"
+            " status TEXT NOT NULL,"
+            " result TEXT,"
+            " error TEXT,"
+            " owner TEXT,"
+            " lease_until REAL,"
+            " PRIMARY KEY (job_id, idx));"
+            "CREATE INDEX IF NOT EXISTS idx_job_files_status"
+            " ON job_files(status);"
+        )
+
+        # queues created before leases: their "running" rows have no
+        # lease and are reclaimed straight away
+        columns = {
+            row[1] for row in self._db.execute("PRAGMA table_info(job_files)")
+        }
+        for column, kind in (("owner", "TEXT"), ("lease_until", "REAL")):
+            if column not in columns:
+                self._db.execute(
+                    f"ALTER TABLE job_files ADD COLUMN {column} {kind}"
+                )
+        self._db.commit()
+
+    # ---------- lifecycle ----------
+    def start(self) -> None:
+        if self._threads:
+            return
+
+        self._stop.clear()
+        for n in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker_loop,
+                name=f"job-worker-{n}",
+                daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        heartbeat = threading.Thread(
+            target=self._heartbeat_loop, name="job-heartbeat", daemon=True
+        )
+        heartbeat.start()
+        self._threads.append(heartbeat)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wakeup.set()
+
+        for thread in self._threads:
+            thread.join(timeout=5)
+
+        self._threads = []
+
+        # hand unfinished claims back without waiting for the lease
+        with self._lock:
+            self._db.execute(
+                "UPDATE job_files"
+                " SET status = 'pending', owner = NULL, lease_until = NULL"
+                " WHERE status = 'running' AND owner = ?",
+                (self.owner,)
+            )
+            self._db.commit()
+
+    # ---------- submit ----------
+    def submit(
+        self,
+        job_description: str,
+        uploads: List[UploadFile]
+    ) -> str:
+        """
+        Persist uploads + queue rows (blocking – run in a thread).
+        Invalid files are recorded as failed straight away.
+        """
+
+        job_id = uuid.uuid4().hex
+        job_dir = os.path.join(self.files_dir, job_id)
+
+        rows = []
+        for idx, upload in enumerate(uploads):
+            filename = upload.filename or "Unknown Candidate"
+            path = save_upload_file(upload, directory=job_dir)
+
+            if path:
+                rows.append((job_id, idx, filename, path, "pending", None))
+            else:
+                rows.append((
+                    job_id, idx, filename, None, "failed",
+                    "Invalid, oversized or unsupported file"
+                ))
+
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (id, job_description, total, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                (job_id, job_description, len(rows), time.time())
+            )
+            self._db.executemany(
+                "INSERT INTO job_files"
+                " (job_id, idx, filename, path, status, error)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._db.commit()
+            self._finish_if_complete(job_id)
+
+        self._wakeup.set()
+        return job_id
+
+    # ---------- workers ----------
+    def _claim(self) -> Optional[Tuple[str, int, str, str, str]]:
+        """
+        Take the oldest pending file, or one whose lease expired.
+        The UPDATE re-checks the condition, so when another process
+        claims the same row first, this one moves on to the next.
+        """
+
+        with self._lock:
+            while True:
+                now = time.time()
+                row = self._db.execute(
+                    "SELECT f.job_id, f.idx, f.filename, f.path,"
+                    " j.job_description"
+                    " FROM job_files f JOIN jobs j ON j.id = f.job_id"
+                    " WHERE f.status = 'pending' OR (f.status = 'running'"
+                    " AND (f.lease_until IS NULL OR f.lease_until < ?))"
+                    " ORDER BY j.created_at, f.idx LIMIT 1",
+                    (now,)
+                ).fetchone()
+
+                if row is None:
+                    return None
+
+                claimed = self._db.execute(
+                    "UPDATE job_files"
+                    " SET status = 'running', owner = ?, lease_until = ?"
+                    " WHERE job_id = ? AND idx = ? AND (status = 'pending'"
+                    " OR (status = 'running'"
+                    " AND (lease_until IS NULL OR lease_until < ?)))",
+                    (self.owner, now + self.lease_seconds, row[0], row[1], now)
+                ).rowcount
+                self._db.commit()
+
+                if claimed:
+                    return row
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop.wait(self.lease_seconds / 3):
+            with self._lock:
+                self._db.execute(
+                    "UPDATE job_files SET lease_until = ?"
+                    " WHERE status = 'running' AND owner = ?",
+                    (time.time() + self.lease_seconds, self.owner)
+                )
+                self._db.commit()
+
+    def _complete(
+        self,
+        job_id: str,
+        idx: int,
+        result: Optional[Dict],
+        error: Optional[str]
+    ) -> bool:
+        """
+        Record the outcome; False (nothing written) when the claim was
+        lost to another worker in the meantime.
+        """
+
+        with self._lock:
+            updated = self._db.execute(
+                "UPDATE job_files SET status = ?, result = ?, error = ?,"
+                " owner = NULL, lease_until = NULL"
+                " WHERE job_id = ? AND idx = ? AND status = 'running'"
+                " AND owner = ?",
+                (
+                    "failed" if error else "done",
+                    json.dumps(result) if result is not None else None,
+                    error,
+                    job_id,
+                    idx,
+                    self.owner,
+                )
+            ).rowcount
+            self._db.commit()
+
+            if not updated:
+                print(f"[Job Queue] {job_id}/{idx}: claim lost, result dropped")
+                return False
+
+            self._finish_if_complete(job_id)
+            return True
+
+    def _finish_if_complete(self, job_id: str) -> None:
+        remaining = self._db.execute(
+            "SELECT COUNT(*) FROM job_files"
+            " WHERE job_id = ? AND status IN ('pending', 'running')",
+            (job_id,)
+        ).fetchone()[0]
+
+        if remaining == 0:
+            self._db.execute(
+                "UPDATE jobs SET finished_at = ?"
+                " WHERE id = ? AND finished_at IS NULL",
+                (time.time(), job_id)
+            )
+            self._db.commit()
+            shutil.rmtree(
+                os.path.join(self.files_dir, job_id), ignore_errors=True
+            )
+
+    def _process(self, filename: str, path: str, job_description: str) -> Dict:
+        """
+        parse (cache / extractor in the PDF process pool)
+        -> LLM evaluation (optional, as in /analyze) -> final score
+        """
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        cache = get_text_cache()
+        content_hash = hash_bytes(data)
+        resume_text = cache.get(content_hash) if cache else None
+
+        if resume_text is None:
+            with metrics.timer("extract_text_from_pdf"):
+                parsed = get_pdf_executor().submit(
+                    parse_document_bytes, data
+                ).result()
+
+            record_parse(parsed)
+            resume_text = parsed.text
+
+            if resume_text and cache:
+                cache.put(content_hash, resume_text)
+
+        if not resume_text or not resume_text.strip():
+            return unreadable_result(filename).to_dict()
+
+        # same LLM evaluator as /analyze (None → deterministic)
+        profile = compile_job_profile(job_description)
+        llm_result = evaluate_blocking(
+            profile, text_hash(resume_text), resume_text
+        )
+
+        with metrics.timer("analyze_resume"):
+            return score_resume(
+                filename,
+                resume_text,
+                job_description,
+                profile,
+                llm_result=llm_result
+            )
+
+    def _worker_loop(self) -> None:
+        while not self._stop.is_set():
+            claimed = self._claim()
+
+            if claimed is None:
+                self._wakeup.wait(self.POLL_SECONDS)
+                self._wakeup.clear()
+                continue
+
+            job_id, idx, filename, path, job_description = claimed
+
+            try:
+                result = self._process(filename, path, job_description)
+                error = None
+            except Exception as e:
+                if self._stop.is_set():
+                    # shutting down – stop() hands the claim back
+                    return
+                print(f"[Job Queue] {job_id}/{filename} failed: {e}")
+                result, error = None, str(e)
+
+            # a lost claim belongs to another worker now, file included
+            if self._complete(job_id, idx, result, error):
+                delete_file(path)
+
+    # ---------- queries ----------
+    def status(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._db.execute(
+                "SELECT total, created_at, finished_at FROM jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+
+            if job is None:
+                return None
+
+            counts = dict(self._db.execute(
+                "SELECT status, COUNT(*) FROM job_files"
+                " WHERE job_id = ? GROUP BY status",
+                (job_id,)
+            ).fetchall())
+
+        total, created_at, finished_at = job
+        finished = counts.get("done", 0) + counts.get("failed", 0)
+
+        if finished_at is not None:
+            state = "completed"
+        elif counts.get("running") or finished:
+            state = "running"
+        else:
+            state = "queued"
+
+        return {
+            "job_id": job_id,
+            "status": state,
+            "total": total,
+            "pending": counts.get("pending", 0),
+            "running": counts.get("running", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0),
+            "progress": round(finished / total, 4) if total else 1.0,
+            "created_at": created_at,
+            "finished_at": finished_at,
+        }
+
+    def results(self, job_id: str) -> Optional[Dict]:
+        status = self.status(job_id)
+        if status is None:
+            return None
+
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT filename, status, result, error FROM job_files"
+                " WHERE job_id = ? AND status IN ('done', 'failed')"
+                " ORDER BY idx",
+                (job_id,)
+            ).fetchall()
+
+        return {
+            **status,
+            "results": [
+                json.loads(result)
+                for _, state, result, _ in rows if state == "done"
+            ],
+            "failures": [
+                {"candidate_name": filename, "error": error}
+                for filename, state, _, error in rows if state == "failed"
+            ],
+        }
+
+
+# -------------------------------------------------
+# Singleton
+# -------------------------------------------------
+@lru_cache
+def get_job_queue() -> JobQueue:
+    settings = get_settings()
+    return JobQueue(
+        settings.JOB_STORE_DIR,
+        workers=settings.JOB_WORKERS,
+        lease_seconds=settings.JOB_LEASE_SECONDS
+    )
@@ -0,0 +1,458 @@
+import asyncio
+import json
+import os
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from app.config import get_settings
+from app.utils import metrics
+
+if TYPE_CHECKING:
+    from app.services.job_profile import JobProfile
+
+# Bump whenever the prompt or response parsing changes:
+# cached evaluations from older prompts are then ignored.
+PROMPT_VERSION = "v1"
+
+CacheKey = Tuple[str, str, str]     # (jd_hash, resume_hash, prompt version)
+
+
+# -------------------------------------------------
+# Gemini Client (optional, created on first use)
+# -------------------------------------------------
+@lru_cache
+def get_gemini_client():
+    """
+    google-genai client, or None if the SDK / key is missing.
+    Imported lazily so app startup does not pay for the SDK.
+    """
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        return None
+
+    try:
+        from google import genai
+        return genai.Client(api_key=api_key)
+    except Exception:
+        return None
+
+
+# -------------------------------------------------
+# Prompt / response handling
+# -------------------------------------------------
+PROMPT_TEMPLATE = """You are screening resumes for the job description below.
+Evaluate EVERY resume independently against the job description.
+
+Return ONLY a JSON array with one object per resume:
+[{{"id": "<resume id>", "match_score": <0-100>,
+  "strengths": ["..."], "gaps": ["..."], "summary": "<2 sentences>"}}]
+
+JOB DESCRIPTION:
+{job_description}
+
+{resumes}"""
+
+
+def build_prompt(job_description: str, items: List[Tuple[str, str]]) -> str:
+    max_chars = get_settings().LLM_MAX_RESUME_CHARS
+
+    resumes = "\n\n".join(
+        f"RESUME id={item_id}:\n{text[:max_chars]}"
+        for item_id, text in items
+    )
+    return PROMPT_TEMPLATE.format(
+        job_description=job_description, resumes=resumes
+    )
+
+
+def _clean_list(value) -> List[str]:
+    if not isinstance(value, list):
+        return []
+    return [str(v) for v in value if isinstance(v, (str, int, float))]
+
+
+def parse_response(text: str) -> Dict[str, Dict]:
+    """
+    JSON array of evaluations → {id: evaluation}.
+    Malformed entries are dropped (those resumes use the fallback).
+    """
+
+    # tolerate ```json fences around the payload
+    text = re.sub(r"^```(?:json)?\s*|\s*```$", "", (text or "").strip())
+
+    try:
+        payload = json.loads(text)
+    except (TypeError, ValueError):
+        return {}
+
+    if isinstance(payload, dict):
+        payload = payload.get("results", [payload])
+
+    parsed = {}
+    for item in payload if isinstance(payload, list) else []:
+        if not isinstance(item, dict) or "id" not in item:
+            continue
+
+        try:
+            score = int(float(item.get("match_score")))
+        except (TypeError, ValueError):
+            continue
+
+        parsed[str(item["id"])] = {
+            "match_score": max(0, min(100, score)),
+            "strengths": _clean_list(item.get("strengths")),
+            "gaps": _clean_list(item.get("gaps")),
+            "summary": str(item.get("summary") or "LLM-based evaluation completed."),
+        }
+
+    return parsed
+
+
+# -------------------------------------------------
+# Backends
+# -------------------------------------------------
+class LLMBackend:
+    """
+    Evaluates several resumes against one JD in a single round trip.
+
+    evaluate(job_description, [(id, resume_text), ...]) -> {id: evaluation}
+    Missing ids mean "no answer" for that resume.
+    """
+
+    name = "base"
+
+    async def evaluate(
+        self,
+        job_description: str,
+        items: List[Tuple[str, str]]
+    ) -> Dict[str, Dict]:
+        raise NotImplementedError
+
+
+class GeminiLLMBackend(LLMBackend):
+    name = "gemini"
+
+    def __init__(self, client, model: str):
+        self._client = client
+        self.model = model
+
+    async def evaluate(self, job_description, items):
+        response = await self._client.aio.models.generate_content(
+            model=self.model,
+            contents=build_prompt(job_description, items),
+            config={
+                "temperature": 0,
+                "response_mime_type": "application/json",
+            },
+        )
+        return parse_response(response.text)
+
+
+class FakeLLMBackend(LLMBackend):
+    """
+    Local stand-in: one simulated round trip per batch, answers
+    derived from the deterministic evaluator. No network, no key.
+    """
+
+    name = "fake"
+
+    def __init__(self, latency_seconds: float = 0.2):
+        self.latency_seconds = latency_seconds
+        self.calls = 0
+
+    async def evaluate(self, job_description, items):
+        from app.services.llm_explainer import _fallback_evaluation
+
+        self.calls += 1
+        await asyncio.sleep(self.latency_seconds)
+
+        results = {}
+        for item_id, text in items:
+            evaluation = _fallback_evaluation(job_description, text)
+            evaluation["summary"] = "[fake-llm] " + evaluation["summary"]
+            results[item_id] = evaluation
+
+        return results
+
+
+@lru_cache
+def get_llm_backend() -> Optional[LLMBackend]:
+    """
+    LLM_BACKEND:
+    - "none"   → deterministic evaluation only
+    - "gemini" → Gemini (needs GEMINI_API_KEY + google-genai)
+    - "fake"   → local fake backend
+    """
+
+    settings = get_settings()
+
+    if settings.LLM_BACKEND == "fake":
+        return FakeLLMBackend(settings.LLM_FAKE_LATENCY_MS / 1000)
+
+    if settings.LLM_BACKEND == "gemini":
+        client = get_gemini_client()
+        if client is None:
+            print("[LLM] Gemini unavailable, using deterministic evaluation")
+            return None
+        return GeminiLLMBackend(client, settings.LLM_MODEL)
+
+    return None
+
+
+# -------------------------------------------------
+# Response cache
+# -------------------------------------------------
+class LLMResponseCache:
+    """
+    Bounded LRU of normalized evaluations, shared by all event loops
+    in the process. Failed evaluations are never cached.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey) -> Optional[Dict]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: CacheKey, value: Dict) -> None:
+        if self.max_entries <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_cache = LLMResponseCache(get_settings().LLM_CACHE_SIZE)
+
+
+# -------------------------------------------------
+# Batching evaluator
+# -------------------------------------------------
+class LLMEvaluator:
+    """
+    Async front of an LLMBackend.
+
+    - identical (JD, resume, prompt version) requests hit the cache
+      or join the call already in flight
+    - resumes for the same JD are grouped into batches of up to
+      `batch_size`; a partial batch is sent after `batch_wait` seconds
+    - at most `max_concurrency` backend calls run at once
+    - a call that fails or exceeds `timeout` resolves to None,
+      so the caller falls back to the deterministic evaluation
+
+    Bound to the event loop it was created on (see get_llm_evaluator).
+    """
+
+    def __init__(
+        self,
+        backend: LLMBackend,
+        max_concurrency: int = 4,
+        batch_size: int = 5,
+        batch_wait: float = 0.05,
+        timeout: float = 30.0,
+        cache: Optional[LLMResponseCache] = None
+    ):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.timeout = timeout
+        self.cache = cache if cache is not None else _cache
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending: Dict[str, Tuple["JobProfile", List]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._in_flight: Dict[CacheKey, asyncio.Future] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def evaluate(
+        self,
+        profile: "JobProfile",
+        resume_hash: str,
+        resume_text: str
+    ) -> Optional[Dict]:
+        key = (profile.jd_hash, resume_hash, PROMPT_VERSION)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            metrics.inc("llm_cache_hits_total", help_text="LLM cache hits")
+            return dict(cached)
+
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight[key] = future
+            self._enqueue(profile, key, resume_text, future)
+
+        # shield: a cancelled request must not cancel a shared answer
+        result = await asyncio.shield(future)
+
+        if result is None:
+            metrics.inc(
+                "llm_fallbacks_total",
+                help_text="Resumes scored by the fallback after LLM failure"
+            )
+            return None
+
+        return dict(result)
+
+    # ---------- batching ----------
+    def _enqueue(self, profile, key, resume_text, future) -> None:
+        jd_hash = profile.jd_hash
+        _, batch = self._pending.setdefault(jd_hash, (profile, []))
+        batch.append((key, resume_text, future))
+
+        if len(batch) >= self.batch_size:
+            self._flush(jd_hash)
+        elif jd_hash not in self._timers:
+            self._timers[jd_hash] = asyncio.get_running_loop().call_later(
+                self.batch_wait, self._flush, jd_hash
+            )
+
+    def _flush(self, jd_hash: str) -> None:
+        timer = self._timers.pop(jd_hash, None)
+        if timer is not None:
+            timer.cancel()
+
+        pending = self._pending.pop(jd_hash, None)
+        if pending is None:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._run(*pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, profile: "JobProfile", batch: List) -> None:
+        items = [(str(i), text) for i, (_, text, _) in enumerate(batch)]
+        answers: Dict[str, Dict] = {}
+
+        try:
+            async with self._semaphore:
+                with metrics.timer("llm_call"):
+                    answers = await asyncio.wait_for(
+                        self.backend.evaluate(profile.text, items),
+                        self.timeout
+                    )
+        except asyncio.TimeoutError:
+            print(f"[LLM] Batch of {len(items)} timed out")
+            metrics.inc("llm_timeouts_total", help_text="LLM calls timed out")
+        except Exception as e:
+            print(f"[LLM] Batch of {len(items)} failed: {e}")
+            metrics.inc("llm_errors_total", help_text="LLM calls failed")
+        finally:
+            for i, (key, _, future) in enumerate(batch):
+                answer = answers.get(str(i))
+                if answer is not None:
+                    self.cache.put(key, answer)
+
+                self._in_flight.pop(key, None)
+                if not future.done():
+                    future.set_result(answer)
+
+
+_evaluators: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LLMEvaluator]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_llm_evaluator() -> Optional[LLMEvaluator]:
+    """
+    Evaluator for the running event loop, or None when no LLM
+    backend is configured. Must be called from a coroutine.
+    """
+
+    backend = get_llm_backend()
+    if backend is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    evaluator = _evaluators.get(loop)
+
+    if evaluator is None:
+        settings = get_settings()
+        evaluator = LLMEvaluator(
+            backend,
+            max_concurrency=settings.LLM_MAX_CONCURRENCY,
+            batch_size=settings.LLM_BATCH_SIZE,
+            batch_wait=settings.LLM_BATCH_WAIT_MS / 1000,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+        )
+        _evaluators[loop] = evaluator
+
+    return evaluator
+
+
+# -------------------------------------------------
+# Blocking access (worker threads, batch CLI)
+# -------------------------------------------------
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop on a daemon thread, started on first use, so callers
+    without a loop of their own share one evaluator (and its batching).
+    """
+    global _background_loop
+
+    with _background_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="llm-loop", daemon=True
+            ).start()
+            _background_loop = loop
+
+    return _background_loop
+
+
+async def _evaluate(
+    profile: "JobProfile",
+    resume_hash: str,
+    resume_text: str
+) -> Optional[Dict]:
+    evaluator = get_llm_evaluator()
+    if evaluator is None:
+        return None
+    return await evaluator.evaluate(profile, resume_hash, resume_text)
+
+
+def evaluate_blocking(
+    profile: "JobProfile",
+    resume_hash: str,
+    resume_text: str
+) -> Optional[Dict]:
+    """
+    LLMEvaluator.evaluate() for synchronous code (job queue workers,
+    batch_runner). None when no backend is configured or the call
+    failed, as with the async path.
+    """
+
+    if get_llm_backend() is None:
+        return None
+
+    return asyncio.run_coroutine_threadsafe(
+        _evaluate(profile, resume_hash, resume_text),
+        _get_background_loop()
+    ).result()
+
+
+def llm_cache_size() -> int:
+    return len(_cache)
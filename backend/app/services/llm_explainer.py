@@ -1,29 +1,15 @@
-import json
-import os
-import re
-from typing import Dict, Set
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Set, Tuple
 
-# -------------------------------------------------
-# Optional Gemini (safe)
-# -------------------------------------------------
-try:
-    from google import genai
-except ImportError:
-    genai = None
-
-
-# -------------------------------------------------
-# Gemini Client (optional)
-# -------------------------------------------------
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-client = None
-if genai and GEMINI_API_KEY:
-    try:
-        client = genai.Client(api_key=GEMINI_API_KEY)
-    except Exception:
-        client = None
+from app.services.scoring_engine import (
+    CandidateFeatures,
+    ScoringWeights,
+    evaluate_features,
+)
+from app.services.resume_sections import ResumeSections, segment_resume
+from app.services.skill_matcher import get_matcher
 
+if TYPE_CHECKING:
+    from app.services.job_profile import JobProfile
 
 # -------------------------------------------------
 # Skill & Model Dictionaries
@@ -43,24 +29,29 @@ MODELS: Set[str] = {
     "bert", "gpt", "yolo", "resnet"
 }
 
-EXPERIENCE_WORDS: Set[str] = {
-    "experience", "years", "worked", "company",
-    "organization", "role", "intern", "internship"
-}
+ALL_TERMS: Set[str] = SKILLS | MODELS
+
+# Compiled once at import, reused for every JD and resume
+TERM_MATCHER = get_matcher(frozenset(ALL_TERMS))
 
 
 # -------------------------------------------------
 # Helper Functions
 # -------------------------------------------------
-def extract_terms(text: str, dictionary: Set[str]) -> Set[str]:
-    text = text.lower()
-    found = set()
-
-    for term in dictionary:
-        if term in text:
-            found.add(term)
+def extract_terms(text: str, dictionary: Optional[Set[str]] = None) -> Set[str]:
+    """
+    Find dictionary terms in text (word-boundary aware, single pass).
+    dictionary defaults to SKILLS | MODELS; each dictionary's matcher
+    is compiled once (get_matcher), not per call.
+    """
+    if not text:
+        return set()
 
-    return found
+    matcher = (
+        TERM_MATCHER if dictionary is None
+        else get_matcher(frozenset(dictionary))
+    )
+    return matcher.find(text)
 
 
 def jd_requires_experience(jd: str) -> bool:
@@ -68,94 +59,108 @@ def jd_requires_experience(jd: str) -> bool:
     return any(word in jd for word in ["experience", "years", "senior", "worked"])
 
 
+def segment(
+    resume: str,
+    spans: Optional[Sequence[Tuple[str, int, int]]] = None
+) -> ResumeSections:
+    """
+    Sections, dated experience and positioned skills (one record).
+    `spans`: TERM_MATCHER matches of the resume, if already found.
+    """
+    return segment_resume(resume, TERM_MATCHER, spans=spans)
+
+
 def resume_has_experience(resume: str) -> bool:
-    resume = resume.lower()
-    return any(word in resume for word in EXPERIENCE_WORDS)
+    return segment(resume).has_experience
 
 
 def extract_years(resume: str) -> int:
-    matches = re.findall(r"(\d+)\s*\+?\s*year", resume.lower())
-    return max(map(int, matches)) if matches else 0
+    return segment(resume).years
 
 
 # -------------------------------------------------
 # ATS-Style Deterministic Evaluation
 # -------------------------------------------------
-def _fallback_evaluation(job_description: str, resume_text: str) -> Dict:
-    jd_skills = extract_terms(job_description, SKILLS | MODELS)
-    resume_skills = extract_terms(resume_text, SKILLS | MODELS)
-
-    matched_skills = sorted(jd_skills & resume_skills)
-    missing_skills = sorted(jd_skills - resume_skills)
-
-    # ---------- EXPERIENCE GATE ----------
-    if jd_requires_experience(job_description):
-        if not resume_has_experience(resume_text):
-            return {
-                "match_score": 0,
-                "strengths": [],
-                "gaps": list(jd_skills),
-                "summary": (
-                    "Candidate does not meet the required experience criteria "
-                    "mentioned in the job description."
-                )
-            }
-
-    # ---------- SKILL SCORE ----------
-    skill_score = (
-        int(len(matched_skills) / len(jd_skills) * 100)
-        if jd_skills else 0
+def skill_overlap(resume_bits: int, profile: "JobProfile") -> CandidateFeatures:
+    """
+    Features known from the resume's TERM_MATCHER bits alone: JD skill
+    overlap and has_terms. Experience, positions and similarity are
+    left empty (extract_features fills them in).
+    """
+    return CandidateFeatures(
+        matched_bits=profile.skill_bits & resume_bits,
+        missing_bits=profile.skill_bits & ~resume_bits,
+        matched_weight=profile.matched_weight(resume_bits),
+        total_weight=profile.total_weight,
+        has_terms=bool(resume_bits),
+        years=0,
+        has_experience=False,
+        requires_experience=profile.requires_experience,
     )
 
-    # ---------- PROJECT SCORE (implicit via tools/models) ----------
-    project_score = 20 if resume_skills else 0
-
-    # ---------- EXPERIENCE DEPTH ----------
-    years = extract_years(resume_text)
-    if jd_requires_experience(job_description):
-        if years >= 3:
-            exp_score = 25
-        elif years >= 1:
-            exp_score = 15
-        else:
-            exp_score = 5
-    else:
-        exp_score = 5 if resume_has_experience(resume_text) else 0
-
-    # ---------- FINAL SCORE ----------
-    final_score = min(skill_score * 0.5 + project_score + exp_score, 100)
-    final_score = int(final_score)
-
-    # ---------- FINAL SUMMARY ----------
-    if final_score >= 70:
-        verdict = "Suitable candidate with minor improvements required."
-    elif final_score >= 40:
-        verdict = "Partially suitable but requires skill and project improvement."
-    else:
-        verdict = "Currently not suitable for this role."
-
-    summary = (
-        f"{verdict} "
-        f"Matched skills: {', '.join(matched_skills) or 'None'}. "
-        f"Missing skills: {', '.join(missing_skills) or 'None'}."
+
+def extract_features(
+    resume_text: str,
+    profile: "JobProfile",
+    similarity: Optional[float] = None,
+    spans: Optional[Sequence[Tuple[str, int, int]]] = None
+) -> CandidateFeatures:
+    """
+    Everything the deterministic score needs from one resume.
+    JD side comes precompiled; the resume is segmented once and
+    skills, years, experience and match positions all come from
+    that record.
+    """
+
+    sections = segment(resume_text, spans)
+
+    return skill_overlap(sections.skill_bits, profile)._replace(
+        years=sections.years,
+        has_experience=sections.has_experience,
+        similarity=similarity,
+        evidenced_weight=profile.matched_weight(sections.evidenced_bits),
+        matched_spans=tuple(
+            span for span in sections.term_spans
+            if TERM_MATCHER.encode((span[0],)) & profile.skill_bits
+        ),
     )
 
-    return {
-        "match_score": final_score,
-        "strengths": matched_skills,
-        "gaps": missing_skills,
-        "summary": summary
-    }
+
+def _fallback_evaluation(
+    job_description: str,
+    resume_text: str,
+    profile: Optional["JobProfile"] = None,
+    weights: Optional[ScoringWeights] = None,
+    features: Optional[CandidateFeatures] = None
+) -> Dict:
+    if features is None:
+        if profile is None:
+            from app.services.job_profile import compile_job_profile
+            profile = compile_job_profile(job_description)
+
+        features = extract_features(resume_text, profile)
+
+    return evaluate_features(features, weights)
 
 
 # -------------------------------------------------
 # Main API Function
 # -------------------------------------------------
-def evaluate_candidate(job_description: str, resume_text: str) -> Dict:
+def evaluate_candidate(
+    job_description: str,
+    resume_text: str,
+    profile: Optional["JobProfile"] = None,
+    weights: Optional[ScoringWeights] = None,
+    features: Optional[CandidateFeatures] = None
+) -> Dict:
     """
     Experience-first → skills → projects → years → explanation.
-    Gemini optional, deterministic always works.
+    Deterministic; LLM verdicts come from llm_client.LLMEvaluator
+    (async, batched) and are applied in pipeline.analyze_resume.
+    Pass a compiled JobProfile to skip re-parsing the JD per resume,
+    or already extracted features to skip scanning the resume.
     """
 
-    # Gemini can be plugged later — deterministic is default
-    return _fallback_evaluation(job_description, resume_text)
\ No newline at end of file
+    return _fallback_evaluation(
+        job_description, resume_text, profile, weights, features
+    )
\ No newline at end of file
@@ -0,0 +1,214 @@
+import io
+import math
+from typing import List, NamedTuple, Optional, Tuple, Union
+
+from app.config import get_settings
+
+PdfSource = Union[str, bytes, bytearray]
+
+
+# ---------------------------
+# Options / Result types
+# ---------------------------
+class ExtractionOptions(NamedTuple):
+    """
+    mode:      "layout" → pdfplumber extract_text (word/line clustering)
+               "fast"   → extract_text_simple (no layout analysis)
+    max_pages: stop after this many pages (0 = no limit)
+    max_chars: stop once this much text is collected (0 = no limit)
+    """
+    mode: str = "layout"
+    max_pages: int = 0
+    max_chars: int = 0
+
+
+class ParsedPdf(NamedTuple):
+    """
+    Extraction output.
+
+    text:          None on failure / no text layer
+    pages:         pages whose text was extracted
+    total_pages:   pages in the document
+    skipped_pages: 1-based page numbers not read
+                   (image-only, unreadable, or over budget)
+    truncated:     True if the page/char budget cut extraction short
+    """
+    text: Optional[str]
+    pages: int = 0
+    total_pages: int = 0
+    skipped_pages: Tuple[int, ...] = ()
+    truncated: bool = False
+
+
+def default_options() -> ExtractionOptions:
+    settings = get_settings()
+    return ExtractionOptions(
+        mode=settings.PDF_TEXT_MODE,
+        max_pages=settings.PDF_MAX_PAGES,
+        max_chars=settings.PDF_MAX_CHARS,
+    )
+
+
+def _open(source: PdfSource):
+    # imported here so the API process only loads pdfplumber/pdfminer
+    # if it parses in-process; pool workers import it on first task
+    import pdfplumber
+
+    if isinstance(source, (bytes, bytearray)):
+        return pdfplumber.open(io.BytesIO(source))
+    return pdfplumber.open(source)
+
+
+# ---------------------------
+# Page-range extraction (picklable)
+# ---------------------------
+def parse_pdf_range(
+    source: PdfSource,
+    start: int = 0,
+    stop: Optional[int] = None,
+    options: ExtractionOptions = ExtractionOptions()
+) -> ParsedPdf:
+    """
+    Extract pages [start, stop) honouring the page/char budget.
+    Top-level (picklable) so ranges can be spread across a process pool.
+    """
+
+    chunks: List[str] = []
+    skipped: List[int] = []
+    parsed = 0
+    chars = 0
+    total = 0
+    truncated = False
+
+    try:
+        with _open(source) as pdf:
+            total = len(pdf.pages)
+            stop = total if stop is None else min(stop, total)
+
+            if options.max_pages:
+                stop = min(stop, options.max_pages)
+
+            for page_num in range(start, stop):
+                if options.max_chars and chars >= options.max_chars:
+                    truncated = True
+                    skipped.extend(range(page_num + 1, stop + 1))
+                    break
+
+                page = pdf.pages[page_num]
+                try:
+                    # image-only / scanned page → no text layer, skip
+                    if not page.chars:
+                        skipped.append(page_num + 1)
+                        continue
+
+                    page_text = (
+                        page.extract_text_simple()
+                        if options.mode == "fast"
+                        else page.extract_text()
+                    )
+                    parsed += 1
+
+                    if page_text:
+                        chunks.append(page_text)
+                        chars += len(page_text)
+                except Exception as e:
+                    skipped.append(page_num + 1)
+                    print(
+                        f"[Resume Parser] Failed reading page {page_num}: {e}"
+                    )
+                finally:
+                    # release per-page layout caches on long documents
+                    page.close()
+
+            if options.max_pages and total > options.max_pages:
+                truncated = True
+                skipped.extend(range(options.max_pages + 1, total + 1))
+
+    except Exception as e:
+        print(f"[Resume Parser] PDF parsing error: {e}")
+        return ParsedPdf(None, parsed, total, tuple(skipped), truncated)
+
+    text = "\n".join(chunks).strip()
+    if options.max_chars and len(text) > options.max_chars:
+        text = text[:options.max_chars].rstrip()
+        truncated = True
+
+    if not text:
+        print("[Resume Parser] PDF parsed but no text found")
+
+    return ParsedPdf(text or None, parsed, total, tuple(skipped), truncated)
+
+
+def count_pages(source: PdfSource) -> int:
+    """
+    Page count without extracting any text.
+    """
+    try:
+        with _open(source) as pdf:
+            return len(pdf.pages)
+    except Exception as e:
+        print(f"[Resume Parser] PDF parsing error: {e}")
+        return 0
+
+
+# ---------------------------
+# Page-parallel planning / merge
+# ---------------------------
+def plan_page_ranges(
+    total_pages: int,
+    workers: int,
+    options: ExtractionOptions
+) -> List[Tuple[int, int]]:
+    """
+    Split the (budgeted) page span into at most `workers` contiguous ranges.
+    """
+
+    span = total_pages
+    if options.max_pages:
+        span = min(span, options.max_pages)
+
+    if span <= 0:
+        return []
+
+    size = math.ceil(span / max(1, workers))
+    return [
+        (start, min(start + size, span))
+        for start in range(0, span, size)
+    ]
+
+
+def merge_parsed(
+    parts: List[ParsedPdf],
+    options: ExtractionOptions
+) -> ParsedPdf:
+    """
+    Join per-range results in page order, applying the char budget.
+    """
+
+    if not parts:
+        return ParsedPdf(None)
+
+    total = max(part.total_pages for part in parts)
+    skipped = sorted(
+        {page for part in parts for page in part.skipped_pages}
+    )
+    truncated = any(part.truncated for part in parts)
+
+    if options.max_pages and total > options.max_pages:
+        truncated = True
+        skipped = sorted(
+            set(skipped) | set(range(options.max_pages + 1, total + 1))
+        )
+
+    text = "\n".join(part.text for part in parts if part.text).strip()
+    if options.max_chars and len(text) > options.max_chars:
+        text = text[:options.max_chars].rstrip()
+        truncated = True
+
+    return ParsedPdf(
+        text or None,
+        sum(part.pages for part in parts),
+        total,
+        tuple(skipped),
+        truncated,
+    )
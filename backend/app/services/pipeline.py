@@ -0,0 +1,645 @@
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from fastapi import UploadFile
+
+from app.config import get_settings
+from app.services.extractors import read_head, sniff_format
+from app.services.job_profile import JobProfile, compile_job_profile
+from app.services.pdf_engine import (
+    ParsedPdf,
+    PdfSource,
+    count_pages,
+    default_options,
+    merge_parsed,
+    parse_pdf_range,
+    plan_page_ranges,
+)
+from app.services.resume_parser import (
+    IngestedUpload,
+    ingest_upload,
+    record_parse,
+)
+from app.services.dedup import BatchDeduplicator
+from app.services.embedding_service import (
+    cosine_similarity,
+    get_embeddings,
+    text_hash,
+)
+from app.services.llm_client import get_llm_evaluator
+from app.services.llm_explainer import (
+    TERM_MATCHER,
+    extract_features,
+    skill_overlap,
+)
+from app.services.scoring_engine import (
+    CandidateFeatures,
+    CandidateResult,
+    LLMEvaluation,
+    ScoringWeights,
+    default_weights,
+    feature_matrix,
+    final_score_bound,
+    score_breakdown,
+    score_candidate,
+    score_features_batch,
+)
+from app.services.ranking import TopKRanking, pruned_result, top_k_indices
+from app.services.text_cache import get_text_cache
+from app.utils import metrics
+from app.utils.file_handler import delete_file
+
+
+# -------------------------------------------------
+# Executors (created lazily, one per worker process)
+# -------------------------------------------------
+_pdf_executor: Optional[Executor] = None
+_scoring_executor: Optional[Executor] = None
+
+
+def new_process_pool(max_workers: int) -> Executor:
+    """
+    Process pool using "spawn" (safe next to the event loop threads).
+    Falls back to a thread pool where processes are unavailable.
+    Also used by callers that need a pool of their own (batch_runner).
+    """
+    try:
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    except Exception as e:
+        print(f"[Pipeline] Process pool unavailable, using threads: {e}")
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def get_pdf_executor() -> Executor:
+    global _pdf_executor
+
+    if _pdf_executor is None:
+        _pdf_executor = new_process_pool(pdf_workers())
+
+    return _pdf_executor
+
+
+def get_scoring_executor() -> Executor:
+    global _scoring_executor
+
+    if _scoring_executor is None:
+        settings = get_settings()
+        if settings.SCORING_EXECUTOR == "process":
+            _scoring_executor = new_process_pool(settings.SCORING_WORKERS)
+        else:
+            _scoring_executor = ThreadPoolExecutor(
+                max_workers=settings.SCORING_WORKERS,
+                thread_name_prefix="scoring"
+            )
+
+    return _scoring_executor
+
+
+def shutdown_executors() -> None:
+    """
+    Stop worker pools (called on app shutdown).
+    """
+    global _pdf_executor, _scoring_executor
+
+    for executor in (_pdf_executor, _scoring_executor):
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    _pdf_executor = None
+    _scoring_executor = None
+
+
+# -------------------------------------------------
+# Result Builders
+# -------------------------------------------------
+UNREADABLE_EXPLANATION = "Resume text could not be extracted from the file."
+
+
+def unreadable_result(candidate_name: str) -> CandidateResult:
+    """
+    Hard safety fallback when no text could be extracted.
+    """
+    return CandidateResult(
+        candidate_name=candidate_name,
+        final_score=0,
+        verdict="Poor Match",
+        explanation=UNREADABLE_EXPLANATION
+    )
+
+
+def _similarity(resume_text: str, profile: JobProfile) -> Optional[float]:
+    if profile.embedding is None:
+        return None
+
+    vector = get_embeddings([resume_text])[0]
+    if not vector.size:
+        return None
+
+    return max(0.0, cosine_similarity(vector, profile.embedding))
+
+
+def _normalize_evaluation(evaluation: Dict) -> LLMEvaluation:
+    # 🔒 Normalize LLM output (VERY IMPORTANT)
+    strengths = evaluation.get("strengths")
+    gaps = evaluation.get("gaps")
+    summary = evaluation.get("summary")
+
+    return LLMEvaluation(
+        match_score=int(max(0, min(100, evaluation.get("match_score", 0)))),
+        strengths=tuple(strengths) if isinstance(strengths, list) else (),
+        gaps=tuple(gaps) if isinstance(gaps, list) else (),
+        summary=(
+            summary if isinstance(summary, str)
+            else "LLM-based evaluation completed."
+        )
+    )
+
+
+def analyze_resume(
+    candidate_name: str,
+    resume_text: str,
+    job_description: str,
+    profile: Optional[JobProfile] = None,
+    weights: Optional[ScoringWeights] = None,
+    llm_result: Optional[Dict] = None,
+    cutoff: Optional[int] = None
+) -> Tuple[CandidateResult, Optional[CandidateFeatures]]:
+    """
+    LLM/fallback evaluation + deterministic scoring for one resume.
+    Also returns the extracted features so the result can be
+    re-scored later without the resume.
+    Top-level (picklable) so it can run in a thread or process pool.
+
+    With a ranking `cutoff`, a candidate whose final score (known from
+    the features alone) is below it gets a pruned_result() instead:
+    no strengths, gaps or explanation are built. Without an LLM
+    verdict, the JD skill overlap is checked first: if even its
+    final_score_bound() is below the cutoff, the resume is neither
+    segmented nor embedded and no features are returned (None), so
+    partial features are never stored for re-scoring.
+    """
+
+    weights = weights or default_weights()
+    profile = profile or compile_job_profile(job_description)
+
+    spans = None
+    if cutoff is not None and llm_result is None:
+        # one matcher pass, reused by segmentation if the candidate stays
+        spans = tuple(TERM_MATCHER.finditer(resume_text))
+        overlap = skill_overlap(
+            TERM_MATCHER.encode(term for term, _, _ in spans), profile
+        )
+        bound = final_score_bound(overlap, weights)
+        if bound < cutoff:
+            return pruned_result(candidate_name, bound), None
+
+    similarity = (
+        _similarity(resume_text, profile)
+        if weights.similarity_points else None
+    )
+    features = extract_features(resume_text, profile, similarity, spans)
+
+    if llm_result is not None:
+        # the LLM verdict replaces the deterministic evaluation and is
+        # kept with the features so re-scoring reproduces it
+        features = features._replace(llm=_normalize_evaluation(llm_result))
+
+    # Deterministic scoring engine (final authority)
+    breakdown = score_breakdown(features, weights)
+    if cutoff is not None and breakdown.final_score < cutoff:
+        return pruned_result(candidate_name, breakdown.final_score), features
+
+    result = score_candidate(candidate_name, features, weights, breakdown)
+    return result, features
+
+
+def score_resume(
+    candidate_name: str,
+    resume_text: str,
+    job_description: str,
+    profile: Optional[JobProfile] = None,
+    weights: Optional[ScoringWeights] = None,
+    llm_result: Optional[Dict] = None
+) -> Dict:
+    """
+    analyze_resume() without the features, as a response dict.
+    """
+    return analyze_resume(
+        candidate_name, resume_text, job_description, profile, weights,
+        llm_result
+    )[0].to_dict()
+
+
+def rescore_results(
+    names: List[str],
+    features: List[Optional[CandidateFeatures]],
+    weights: ScoringWeights,
+    top_k: Optional[int] = None,
+    min_score: Optional[int] = None
+) -> List[CandidateResult]:
+    """
+    Re-score stored features with new weights (no resume text needed).
+
+    Without top_k / min_score every candidate is scored, in upload
+    order. With them, final scores for the whole set are computed in
+    one vectorized pass first, and only the best candidates are
+    scored in full (ranked).
+    """
+
+    if top_k is None and min_score is None:
+        selected = range(len(names))
+    else:
+        _, final_scores, _ = score_features_batch(
+            feature_matrix(features), weights
+        )
+        selected = top_k_indices(final_scores, top_k, min_score)
+
+    return [
+        unreadable_result(names[i]) if features[i] is None
+        else score_candidate(names[i], features[i], weights)
+        for i in selected
+    ]
+
+
+# -------------------------------------------------
+# Staged Pipeline
+# -------------------------------------------------
+def pdf_workers() -> int:
+    """
+    Size of the PDF process pool (PDF_WORKERS, 0 = CPU count).
+    """
+    return get_settings().PDF_WORKERS or os.cpu_count() or 1
+
+
+async def parse_pdf_source(source: PdfSource, size: int) -> ParsedPdf:
+    """
+    Parse a PDF (bytes or path) in the PDF process pool.
+
+    Large documents (>= PDF_PARALLEL_MIN_BYTES and
+    >= PDF_PARALLEL_MIN_PAGES pages) are split into page ranges
+    parsed by several workers at once, then merged in page order.
+    The page/char budget applies in both modes.
+    """
+
+    loop = asyncio.get_running_loop()
+    settings = get_settings()
+    executor = get_pdf_executor()
+    options = default_options()
+
+    split = (
+        settings.PDF_PAGE_PARALLEL
+        and size >= settings.PDF_PARALLEL_MIN_BYTES
+        and pdf_workers() > 1
+    )
+
+    if split:
+        total = await loop.run_in_executor(executor, count_pages, source)
+
+        if total >= settings.PDF_PARALLEL_MIN_PAGES:
+            ranges = plan_page_ranges(total, pdf_workers(), options)
+            parts = await asyncio.gather(*(
+                loop.run_in_executor(
+                    executor, parse_pdf_range, source, start, stop, options
+                )
+                for start, stop in ranges
+            ))
+            return merge_parsed(list(parts), options)
+
+    return await loop.run_in_executor(
+        executor, parse_pdf_range, source, 0, None, options
+    )
+
+
+async def parse_resume_source(source: PdfSource, size: int) -> ParsedPdf:
+    """
+    Sniff the format and parse with the matching extractor.
+
+    PDFs go through parse_pdf_source (page splitting); other
+    CPU-heavy formats (DOCX, HTML) run in the PDF process pool, so a
+    hostile document cannot hold the GIL; plain text in a thread.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    if isinstance(source, (bytes, bytearray)):
+        head = read_head(source)
+    else:
+        head = await loop.run_in_executor(None, read_head, source)
+    extractor = sniff_format(head)
+
+    if extractor is None:
+        print("[Pipeline] Unsupported document format")
+        return ParsedPdf(None)
+
+    metrics.inc(
+        f"documents_{extractor.name}_total",
+        help_text=f"{extractor.name.upper()} resumes parsed"
+    )
+
+    if extractor.name == "pdf":
+        return await parse_pdf_source(source, size)
+
+    executor = get_pdf_executor() if extractor.use_process_pool else None
+    return await loop.run_in_executor(
+        executor, extractor.extract, source, default_options()
+    )
+
+
+async def extract_resume(
+    resume: UploadFile
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    ingest (thread) -> cache hit? -> text
+                    -> extract bytes / temp file (process pool) -> cache
+
+    Returns (content_hash, resume_text); text is None on failure.
+    """
+
+    loop = asyncio.get_running_loop()
+    candidate_name = resume.filename or "Unknown Candidate"
+
+    upload = await loop.run_in_executor(None, ingest_upload, resume)
+    return await _extract_ingested(upload, candidate_name)
+
+
+async def _discard_ingested(upload: IngestedUpload) -> None:
+    if upload.file_path:
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, delete_file, upload.file_path)
+
+
+async def _extract_ingested(
+    upload: IngestedUpload,
+    candidate_name: str
+) -> Tuple[Optional[str], Optional[str]]:
+    loop = asyncio.get_running_loop()
+
+    if upload.cached_text is not None:
+        return upload.content_hash, upload.cached_text
+
+    if upload.data is not None:
+        source, size = upload.data, len(upload.data)
+    elif upload.file_path:
+        source, size = upload.file_path, os.path.getsize(upload.file_path)
+    else:
+        print("[Pipeline] Invalid or unsupported file")
+        metrics.inc("extraction_failures_total", help_text="Resumes without text")
+        return upload.content_hash, None
+
+    try:
+        with metrics.timer("extract_text_from_pdf"):
+            parsed = await parse_resume_source(source, size)
+    except Exception as e:
+        print(f"[Pipeline] Extraction failed for {candidate_name}: {e}")
+        metrics.inc("extraction_failures_total", help_text="Resumes without text")
+        return upload.content_hash, None
+    finally:
+        await _discard_ingested(upload)
+
+    record_parse(parsed)
+    resume_text = parsed.text
+
+    cache = get_text_cache()
+    if resume_text and cache and upload.content_hash:
+        await loop.run_in_executor(
+            None, cache.put, upload.content_hash, resume_text
+        )
+
+    return upload.content_hash, resume_text
+
+
+def _duplicate_result(
+    candidate_name: str,
+    leader_result: CandidateResult
+) -> CandidateResult:
+    return replace(
+        leader_result,
+        candidate_name=candidate_name,
+        duplicate_of=leader_result.candidate_name
+    )
+
+
+async def _score_text(
+    candidate_name: str,
+    resume_text: str,
+    profile: JobProfile,
+    weights: ScoringWeights,
+    ranking: Optional[TopKRanking] = None
+) -> Tuple[CandidateResult, Optional[CandidateFeatures]]:
+    """
+    LLM (batched, optional) -> score (scoring pool)
+
+    With a ranking, its current cutoff is passed along so
+    candidates that cannot make it are pruned while scoring.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    llm_result = None
+    evaluator = get_llm_evaluator()
+    if evaluator is not None:
+        llm_result = await evaluator.evaluate(
+            profile, text_hash(resume_text), resume_text
+        )
+
+    # timed here, not inside analyze_resume: with
+    # SCORING_EXECUTOR=process it runs in a child process
+    with metrics.timer("analyze_resume"):
+        result, features = await loop.run_in_executor(
+            get_scoring_executor(),
+            analyze_resume,
+            candidate_name,
+            resume_text,
+            profile.text,
+            profile,
+            weights,
+            llm_result,
+            ranking.cutoff() if ranking else None
+        )
+
+    if result.pruned:
+        metrics.inc(
+            "candidates_pruned_total",
+            help_text="Candidates below a top-K / min-score cutoff"
+        )
+
+    return result, features
+
+
+async def _process_resume(
+    index: int,
+    resume: UploadFile,
+    profile: JobProfile,
+    weights: ScoringWeights,
+    dedup: Optional[BatchDeduplicator] = None,
+    ranking: Optional[TopKRanking] = None
+) -> Tuple[int, CandidateResult, Optional[CandidateFeatures]]:
+    """
+    ingest -> exact duplicate? -> extract (cached / process pool)
+    -> near duplicate? -> LLM + score
+
+    Duplicates skip the remaining stages and reuse the result of
+    the first copy (their leader).
+    """
+
+    loop = asyncio.get_running_loop()
+    candidate_name = resume.filename or "Unknown Candidate"
+
+    if dedup is None:
+        _, resume_text = await extract_resume(resume)
+
+        # 🔒 Hard safety fallback
+        if not resume_text or not resume_text.strip():
+            return index, unreadable_result(candidate_name), None
+
+        result, features = await _score_text(
+            candidate_name, resume_text, profile, weights, ranking
+        )
+        return index, result, features
+
+    resume_text = None
+
+    try:
+        upload = await loop.run_in_executor(None, ingest_upload, resume)
+
+        leader = dedup.claim_exact(index, candidate_name, upload.content_hash)
+        if leader is None:
+            _, resume_text = await _extract_ingested(upload, candidate_name)
+
+            if resume_text and resume_text.strip():
+                leader = dedup.claim_near(index, resume_text)
+        else:
+            await _discard_ingested(upload)
+
+        if leader is not None:
+            metrics.inc(
+                "duplicates_collapsed_total",
+                help_text="Resumes reusing the result of an earlier copy"
+            )
+            leader_result, features = await dedup.wait(leader)
+            outcome = (
+                _duplicate_result(candidate_name, leader_result),
+                features
+            )
+        elif not resume_text or not resume_text.strip():
+            # 🔒 Hard safety fallback
+            outcome = (unreadable_result(candidate_name), None)
+        else:
+            outcome = await _score_text(
+                candidate_name, resume_text, profile, weights, ranking
+            )
+
+    except BaseException as e:
+        dedup.fail(index, e)
+        raise
+
+    dedup.resolve(index, outcome)
+    return (index, *outcome)
+
+
+async def iter_analysis(
+    job_description: str,
+    resumes: Iterable[UploadFile],
+    weights: Optional[ScoringWeights] = None,
+    dedup: Optional[BatchDeduplicator] = None,
+    ranking: Optional[TopKRanking] = None
+) -> AsyncIterator[
+    Tuple[int, CandidateResult, Optional[CandidateFeatures]]
+]:
+    """
+    Yield (upload_index, result, features) as soon as each resume
+    finishes (features is None for unreadable resumes).
+
+    With a BatchDeduplicator, duplicate uploads are yielded too, with
+    their leader's result and duplicate_of set.
+
+    With a TopKRanking, every result is offered to it before being
+    yielded; candidates below its cutoff yield a pruned_result().
+
+    At most MAX_CONCURRENT_RESUMES resumes are in flight; the next
+    one is started only when a slot frees up, so nothing is buffered
+    beyond that window.
+    """
+
+    window = get_settings().MAX_CONCURRENT_RESUMES
+    queued = enumerate(resumes)
+
+    weights = weights or default_weights()
+
+    # JD is parsed (and embedded, if similarity counts) once per batch
+    profile = compile_job_profile(
+        job_description, with_embedding=bool(weights.similarity_points)
+    )
+    in_flight: Set[asyncio.Task] = set()
+
+    def fill_window() -> None:
+        while len(in_flight) < window:
+            item = next(queued, None)
+            if item is None:
+                return
+            index, resume = item
+            in_flight.add(asyncio.create_task(
+                _process_resume(
+                    index, resume, profile, weights, dedup, ranking
+                )
+            ))
+
+    fill_window()
+
+    try:
+        while in_flight:
+            done, _ = await asyncio.wait(
+                in_flight, return_when=asyncio.FIRST_COMPLETED
+            )
+            in_flight.difference_update(done)
+
+            for task in done:
+                index, result, features = task.result()
+                if ranking is not None:
+                    ranking.offer(index, result)
+                yield index, result, features
+
+            fill_window()
+
+    finally:
+        # client went away / generator closed early
+        for task in in_flight:
+            task.cancel()
+
+
+async def analyze_batch(
+    job_description: str,
+    resumes: Iterable[UploadFile],
+    weights: Optional[ScoringWeights] = None,
+    dedup: Optional[BatchDeduplicator] = None,
+    ranking: Optional[TopKRanking] = None
+) -> Tuple[List[CandidateResult], List[Optional[CandidateFeatures]]]:
+    """
+    Analyze resumes concurrently without blocking the event loop.
+    `resumes` may be a lazy iterable (e.g. archive entries); it is
+    consumed as window slots free up.
+    Results (and their features) are returned in the original
+    upload order; duplicates have duplicate_of set (see iter_analysis).
+
+    With a ranking, results below its cutoff are pruned placeholders;
+    read the ranked top results from ranking.ranked().
+    """
+
+    results: Dict[int, CandidateResult] = {}
+    features: Dict[int, Optional[CandidateFeatures]] = {}
+
+    async for index, result, extracted in iter_analysis(
+        job_description, resumes, weights, dedup, ranking
+    ):
+        results[index] = result
+        features[index] = extracted
+
+    order = sorted(results)
+    return [results[i] for i in order], [features[i] for i in order]
@@ -0,0 +1,128 @@
+import heapq
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from app.services.scoring_engine import CandidateResult
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# -------------------------------------------------
+# Top-K collection (streaming, bounded heap)
+# -------------------------------------------------
+class TopKRanking:
+    """
+    Keeps the best `top_k` results of a batch as they complete,
+    optionally only those scoring at least `min_score`.
+
+    Order: final_score descending, then upload index ascending
+    (so ties do not depend on completion order).
+
+    cutoff() is the lowest score that can still make the ranking;
+    scorers use it to skip building results for candidates below it.
+    It only ever rises, so a cutoff read earlier is always safe.
+
+    Duplicate results (duplicate_of set) are ignored unless
+    `include_duplicates` is set.
+    """
+
+    def __init__(
+        self,
+        top_k: Optional[int] = None,
+        min_score: Optional[int] = None,
+        include_duplicates: bool = False
+    ):
+        self.top_k = top_k
+        self.min_score = min_score
+        self.include_duplicates = include_duplicates
+        self.pruned = 0
+
+        # min-heap of (score, -index, result): heap[0] is the worst kept
+        self._heap: List[Tuple[int, int, CandidateResult]] = []
+
+    def _full(self) -> bool:
+        return self.top_k is not None and len(self._heap) >= self.top_k
+
+    def cutoff(self) -> Optional[int]:
+        cutoff = self.min_score
+        if self._full():
+            worst = self._heap[0][0]
+            cutoff = worst if cutoff is None else max(cutoff, worst)
+        return cutoff
+
+    def offer(self, index: int, result: CandidateResult) -> bool:
+        """
+        Add a finished result; returns False if it did not make the cut.
+        """
+
+        if result.duplicate_of is not None and not self.include_duplicates:
+            return False
+
+        score = result.final_score
+
+        if result.pruned or (
+            self.min_score is not None and score < self.min_score
+        ):
+            self.pruned += 1
+            return False
+
+        entry = (score, -index, result)
+
+        if not self._full():
+            heapq.heappush(self._heap, entry)
+            return True
+
+        self.pruned += 1
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+
+        return False
+
+    def ranked(self) -> List[CandidateResult]:
+        return [
+            result for _, _, result in sorted(
+                self._heap, key=lambda entry: entry[:2], reverse=True
+            )
+        ]
+
+
+def pruned_result(candidate_name: str, final_score: int) -> CandidateResult:
+    """
+    Placeholder for a candidate below the ranking cutoff:
+    score only, never returned to clients.
+    """
+    return CandidateResult(candidate_name, final_score, pruned=True)
+
+
+# -------------------------------------------------
+# Top-K selection over precomputed scores
+# -------------------------------------------------
+def top_k_indices(
+    scores: "np.ndarray",
+    top_k: Optional[int] = None,
+    min_score: Optional[int] = None
+) -> "np.ndarray":
+    """
+    Row indices of the best scores (descending, ties by row order),
+    same order as TopKRanking.
+    """
+
+    import numpy as np
+
+    candidates = np.arange(len(scores))
+    if min_score is not None:
+        candidates = candidates[scores >= min_score]
+
+    if top_k is not None and top_k < len(candidates):
+        # O(N) partition for the K-th best score, then keep everything
+        # above it plus the earliest rows tied with it
+        values = scores[candidates]
+        kth = np.partition(values, len(values) - top_k)[len(values) - top_k]
+
+        above = candidates[values > kth]
+        tied = candidates[values == kth]
+        candidates = np.concatenate([above, tied[:top_k - len(above)]])
+
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
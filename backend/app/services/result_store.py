@@ -0,0 +1,249 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.config import get_settings
+from app.services.llm_explainer import TERM_MATCHER
+from app.services.scoring_engine import CandidateFeatures, LLMEvaluation
+
+
+class ResultSet(NamedTuple):
+    result_set_id: str
+    job_description: str
+    weights: Dict
+    names: List[str]
+    features: List[Optional[CandidateFeatures]]    # None = unreadable
+
+
+# -------------------------------------------------
+# Persisted scoring features (per analysis run)
+# -------------------------------------------------
+class ResultStore:
+    """
+    Keeps the intermediate features of every analyzed candidate,
+    grouped into result sets (one per /analyze call), so a weight or
+    threshold change is a re-score of stored numbers – no upload,
+    no PDF parsing, no skill matching.
+
+    Skills are stored by name (not as bitsets), so stored sets stay
+    valid when the skill vocabulary changes.
+
+    Only the newest `max_sets` result sets are kept.
+    """
+
+    def __init__(self, directory: str, max_sets: int = 1000):
+        os.makedirs(directory, exist_ok=True)
+
+        self.max_sets = max_sets
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(
+            os.path.join(directory, "results.sqlite3"),
+            check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            "CREATE TABLE IF NOT EXISTS result_sets ("
+            " id TEXT PRIMARY KEY,"
+            " job_description TEXT NOT NULL,"
+            " weights TEXT NOT NULL,"
+            " total INTEGER NOT NULL,"
+            " created_at REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS candidate_features ("
+            " set_id TEXT NOT NULL,"
+            " idx INTEGER NOT NULL,"
+            " candidate_name TEXT NOT NULL,"
+            " readable INTEGER NOT NULL,"
+            " matched TEXT NOT NULL,"
+            " missing TEXT NOT NULL,"
+            " matched_weight REAL NOT NULL,"
+            " total_weight REAL NOT NULL,"
+            " has_terms INTEGER NOT NULL,"
+            " years INTEGER NOT NULL,"
+            " has_experience INTEGER NOT NULL,"
+            " requires_experience INTEGER NOT NULL,"
+            " similarity REAL,"
+            " llm TEXT,"
+            " evidenced_weight REAL,"
+            " matched_spans TEXT,"
+            " PRIMARY KEY (set_id, idx));"
+            "CREATE INDEX IF NOT EXISTS idx_result_sets_created"
+            " ON result_sets(created_at);"
+        )
+
+        # stores created before LLM evaluations / section-aware skill
+        # weights / match positions were persisted
+        columns = {
+            row[1] for row in self._db.execute(
+                "PRAGMA table_info(candidate_features)"
+            )
+        }
+        for column, sql_type in (
+            ("llm", "TEXT"),
+            ("evidenced_weight", "REAL"),
+            ("matched_spans", "TEXT"),
+        ):
+            if column not in columns:
+                self._db.execute(
+                    f"ALTER TABLE candidate_features"
+                    f" ADD COLUMN {column} {sql_type}"
+                )
+
+        self._db.commit()
+
+    def save(
+        self,
+        job_description: str,
+        weights: Dict,
+        candidates: Sequence[Tuple[str, Optional[CandidateFeatures]]]
+    ) -> str:
+        """
+        Store (candidate_name, features) rows in upload order.
+        Returns the new result set id.
+        """
+
+        set_id = uuid.uuid4().hex
+        rows = []
+
+        for idx, (name, f) in enumerate(candidates):
+            if f is None:
+                rows.append((
+                    set_id, idx, name, 0, "[]", "[]",
+                    0.0, 0.0, 0, 0, 0, 0, None, None, None, None
+                ))
+                continue
+
+            rows.append((
+                set_id,
+                idx,
+                name,
+                1,
+                json.dumps(list(f.matched)),
+                json.dumps(list(f.missing)),
+                f.matched_weight,
+                f.total_weight,
+                int(f.has_terms),
+                f.years,
+                int(f.has_experience),
+                int(f.requires_experience),
+                f.similarity,
+                json.dumps(f.llm._asdict()) if f.llm else None,
+                f.evidenced_weight,
+                json.dumps(f.matched_spans) if f.matched_spans else None,
+            ))
+
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO result_sets"
+                " (id, job_description, weights, total, created_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (set_id, job_description, json.dumps(weights),
+                 len(rows), time.time())
+            )
+            self._db.executemany(
+                "INSERT INTO candidate_features"
+                " (set_id, idx, candidate_name, readable, matched, missing,"
+                " matched_weight, total_weight, has_terms, years,"
+                " has_experience, requires_experience, similarity, llm,"
+                " evidenced_weight, matched_spans)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._prune()
+            self._db.commit()
+
+        return set_id
+
+    def _prune(self) -> None:
+        stale = [
+            row[0] for row in self._db.execute(
+                "SELECT id FROM result_sets"
+                " ORDER BY created_at DESC LIMIT -1 OFFSET ?",
+                (self.max_sets,)
+            )
+        ]
+
+        for set_id in stale:
+            self._db.execute(
+                "DELETE FROM candidate_features WHERE set_id = ?", (set_id,)
+            )
+            self._db.execute("DELETE FROM result_sets WHERE id = ?", (set_id,))
+
+    def load(self, set_id: str) -> Optional[ResultSet]:
+        with self._lock:
+            header = self._db.execute(
+                "SELECT job_description, weights FROM result_sets WHERE id = ?",
+                (set_id,)
+            ).fetchone()
+
+            if header is None:
+                return None
+
+            rows = self._db.execute(
+                "SELECT candidate_name, readable, matched, missing,"
+                " matched_weight, total_weight, has_terms, years,"
+                " has_experience, requires_experience, similarity, llm,"
+                " evidenced_weight, matched_spans"
+                " FROM candidate_features WHERE set_id = ? ORDER BY idx",
+                (set_id,)
+            ).fetchall()
+
+        names, features = [], []
+        for name, readable, matched, missing, *numbers in rows:
+            names.append(name)
+
+            if not readable:
+                features.append(None)
+                continue
+
+            (matched_weight, total_weight, has_terms, years,
+             has_experience, requires_experience, similarity, llm,
+             evidenced_weight, matched_spans) = numbers
+
+            if llm:
+                llm = json.loads(llm)
+                llm = LLMEvaluation(
+                    llm["match_score"],
+                    tuple(llm["strengths"]),
+                    tuple(llm["gaps"]),
+                    llm["summary"],
+                )
+
+            features.append(CandidateFeatures(
+                matched_bits=TERM_MATCHER.encode(json.loads(matched)),
+                missing_bits=TERM_MATCHER.encode(json.loads(missing)),
+                matched_weight=matched_weight,
+                total_weight=total_weight,
+                has_terms=bool(has_terms),
+                years=years,
+                has_experience=bool(has_experience),
+                requires_experience=bool(requires_experience),
+                similarity=similarity,
+                llm=llm or None,
+                evidenced_weight=evidenced_weight,
+                matched_spans=tuple(
+                    tuple(span) for span in json.loads(matched_spans or "[]")
+                ),
+            ))
+
+        job_description, weights = header
+        return ResultSet(
+            set_id, job_description, json.loads(weights), names, features
+        )
+
+
+# -------------------------------------------------
+# Singleton
+# -------------------------------------------------
+@lru_cache
+def get_result_store() -> ResultStore:
+    settings = get_settings()
+    return ResultStore(
+        settings.RESULT_STORE_DIR,
+        max_sets=settings.RESULT_STORE_MAX_SETS
+    )
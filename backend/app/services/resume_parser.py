@@ -1,59 +1,192 @@
-import pdfplumber
-from typing import Optional
+from typing import NamedTuple, Optional
 from fastapi import UploadFile
 
-from app.utils.file_handler import save_upload_file, delete_file
+from app.services.extractors import extract_document
+from app.services.pdf_engine import ExtractionOptions, ParsedPdf
+from app.services.text_cache import get_text_cache, hash_bytes
+from app.utils import metrics
+from app.utils.file_handler import (
+    check_upload,
+    save_upload_file,
+    delete_file,
+    hash_upload_file,
+    read_upload_bytes,
+    should_spool_to_disk,
+)
 
 
-def extract_text_from_pdf(upload_file: UploadFile) -> Optional[str]:
+# ---------------------------
+# Text extraction (format sniffed, see extractors)
+# ---------------------------
+def parse_document_path(
+    file_path: str,
+    options: Optional[ExtractionOptions] = None
+) -> ParsedPdf:
+    """
+    Parse a resume file (PDF, DOCX, HTML or text) on disk.
+    Top-level (picklable) so it can run inside a process pool.
     """
-    Extract text from an uploaded PDF resume safely.
+    return extract_document(file_path, options)
 
-    Flow:
-    UploadFile -> temp file -> pdfplumber -> text -> cleanup
+
+def parse_document_bytes(
+    data: bytes,
+    options: Optional[ExtractionOptions] = None
+) -> ParsedPdf:
+    """
+    Parse an in-memory resume (no temp file).
+    Top-level (picklable) so it can run inside a process pool.
+    """
+    if not data:
+        return ParsedPdf(None)
+
+    return extract_document(data, options)
+
+
+def extract_text_from_path(file_path: str) -> Optional[str]:
+    """
+    Extract text from a resume file on disk.
 
     Returns:
     - Extracted text (str) if successful
     - None if extraction fails
     """
+    return parse_document_path(file_path).text
 
-    # ---------------------------
-    # Save PDF temporarily
-    # ---------------------------
-    file_path = save_upload_file(upload_file)
 
-    if not file_path:
-        print("[Resume Parser] Invalid or unsupported file")
-        return None
+def extract_text_from_bytes(data: bytes) -> Optional[str]:
+    """
+    Extract text from in-memory resume bytes (no temp file).
+    """
+    return parse_document_bytes(data).text
+
+
+# ---------------------------
+# Upload ingestion
+# ---------------------------
+class IngestedUpload(NamedTuple):
+    """
+    Result of reading an upload.
+
+    Exactly one of (cached_text, data, file_path) is set
+    when the upload is valid; all are None otherwise.
+    """
+    content_hash: Optional[str] = None
+    cached_text: Optional[str] = None
+    data: Optional[bytearray] = None
+    file_path: Optional[str] = None
+
+
+def ingest_upload(upload_file: UploadFile) -> IngestedUpload:
+    """
+    Read an upload for parsing (blocking – run in a thread).
+
+    memory path: stream into bytes (size/type checked) -> hash -> cache
+    disk path:   size/type check -> hash -> cache -> copy to temp file
+    """
+
+    cache = get_text_cache()
+
+    # ---------- Disk fallback (large uploads / INGEST_MODE=disk) ----------
+    if should_spool_to_disk(upload_file):
+        # validated before the cache, so a cached copy of an oversized
+        # or unsupported upload is never returned
+        if not check_upload(upload_file):
+            return IngestedUpload()
 
-    text_chunks = []
+        content_hash = hash_upload_file(upload_file)
 
-    try:
-        with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_chunks.append(page_text)
-                except Exception as e:
-                    print(
-                        f"[Resume Parser] Failed reading page {page_num}: {e}"
-                    )
+        if cache and content_hash:
+            cached_text = cache.get(content_hash)
+            if cached_text is not None:
+                return IngestedUpload(content_hash, cached_text=cached_text)
 
-        full_text = "\n".join(text_chunks).strip()
+        metrics.inc(
+            "bytes_ingested_total",
+            getattr(upload_file, "size", None) or 0,
+            help_text="Upload bytes read"
+        )
+        return IngestedUpload(
+            content_hash, file_path=save_upload_file(upload_file)
+        )
 
-        if not full_text:
-            print("[Resume Parser] PDF parsed but no text found")
-            return None
+    # ---------- Zero-temp-file path ----------
+    data = read_upload_bytes(upload_file)
+    if not data:
+        return IngestedUpload()
 
-        return full_text
+    metrics.inc(
+        "bytes_ingested_total", len(data), help_text="Upload bytes read"
+    )
 
-    except Exception as e:
-        print(f"[Resume Parser] PDF parsing error: {e}")
+    content_hash = hash_bytes(data)
+
+    if cache:
+        cached_text = cache.get(content_hash)
+        if cached_text is not None:
+            return IngestedUpload(content_hash, cached_text=cached_text)
+
+    return IngestedUpload(content_hash, data=data)
+
+
+def record_parse(parsed: ParsedPdf) -> None:
+    """
+    Update extraction counters (parsing may run in another process,
+    so this is called by the caller with the returned ParsedPdf).
+    """
+    metrics.inc("pages_parsed_total", parsed.pages, help_text="PDF pages parsed")
+    if parsed.skipped_pages:
+        metrics.inc(
+            "pages_skipped_total",
+            len(parsed.skipped_pages),
+            help_text="PDF pages skipped (no text layer or over budget)"
+        )
+    if not parsed.text:
+        metrics.inc("extraction_failures_total", help_text="Resumes without text")
+
+
+def extract_text_from_pdf(upload_file: UploadFile) -> Optional[str]:
+    """
+    Extract text from an uploaded resume safely.
+    The name is historical: DOCX, HTML and plain text are handled
+    too, picked by magic bytes (see extractors).
+
+    Flow:
+    UploadFile -> bytes -> hash -> cache hit? -> text
+                                -> sniff -> extractor -> text
+    (large uploads go through a temp file instead of memory)
+
+    Returns:
+    - Extracted text (str) if successful
+    - None if extraction fails
+    """
+
+    upload = ingest_upload(upload_file)
+
+    if upload.cached_text is not None:
+        return upload.cached_text
+
+    if upload.data is not None:
+        parsed = parse_document_bytes(upload.data)
+
+    elif upload.file_path:
+        try:
+            parsed = parse_document_path(upload.file_path)
+        finally:
+            # ---------------------------
+            # Always cleanup temp file
+            # ---------------------------
+            delete_file(upload.file_path)
+
+    else:
+        print("[Resume Parser] Invalid or unsupported file")
+        metrics.inc("extraction_failures_total", help_text="Resumes without text")
         return None
 
-    finally:
-        # ---------------------------
-        # Always cleanup temp file
-        # ---------------------------
-        delete_file(file_path)
\ No newline at end of file
+    record_parse(parsed)
+
+    cache = get_text_cache()
+    if parsed.text and cache and upload.content_hash:
+        cache.put(upload.content_hash, parsed.text)
+
+    return parsed.text
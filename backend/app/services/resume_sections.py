@@ -0,0 +1,337 @@
+import re
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.services.skill_matcher import SkillMatcher
+
+# -------------------------------------------------
+# Section headings
+# -------------------------------------------------
+EXPERIENCE = "experience"
+EDUCATION = "education"
+SKILLS = "skills"
+PROJECTS = "projects"
+SUMMARY = "summary"
+OTHER = "other"
+
+_HEADINGS: Dict[str, Tuple[str, ...]] = {
+    EXPERIENCE: (
+        "experience", "work experience", "professional experience",
+        "relevant experience", "employment", "employment history",
+        "work history", "career history", "internship", "internships",
+    ),
+    EDUCATION: (
+        "education", "academic background", "qualifications",
+        "education and training", "academics",
+    ),
+    SKILLS: (
+        "skills", "technical skills", "core skills", "key skills",
+        "skills and tools", "technologies", "tools", "tech stack",
+        "competencies", "core competencies",
+    ),
+    PROJECTS: (
+        "projects", "personal projects", "academic projects",
+        "key projects", "side projects", "selected projects",
+    ),
+    SUMMARY: (
+        "summary", "profile", "objective", "about me",
+        "professional summary", "career objective",
+    ),
+    OTHER: (
+        "certifications", "certificates", "awards", "achievements",
+        "publications", "languages", "interests", "hobbies",
+        "references", "volunteering", "activities",
+    ),
+}
+
+HEADING_KINDS: Dict[str, str] = {
+    heading: kind
+    for kind, headings in _HEADINGS.items()
+    for heading in headings
+}
+
+# headings are short; "Experience: 4 years at Acme" starts a section too
+MAX_HEADING_CHARS = 40
+_HEADING = re.compile(r"^\W*([a-z][a-z &/]*?)\s*(?::\s*(.*))?$")
+
+# where a skill counts as used, not just listed
+EVIDENCE_SECTIONS = frozenset({EXPERIENCE, PROJECTS})
+
+
+# -------------------------------------------------
+# Dates and experience claims
+# -------------------------------------------------
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+_DATE = (
+    r"(?:(?P<{p}mon>jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)"
+    r"[a-z]*\.?\s+|(?P<{p}num>0?[1-9]|1[0-2])\s*[/.-]\s*)?"
+    r"(?P<{p}year>(?:19|20)\d{{2}})"
+)
+DATE_RANGE = re.compile(
+    r"\b" + _DATE.format(p="s")
+    + r"\s*(?:-|–|—|to|until|till)\s*"
+    r"(?:(?P<now>present|current|now|today|ongoing|date)\b|"
+    + _DATE.format(p="e") + r"\b)"
+)
+
+# "5+ years of (professional) experience" anywhere;
+# "4 years at Acme" only inside an experience / summary section,
+# or anywhere in a resume without section headings
+_CLAIM = r"\b(?P<n>\d{1,2})(?:\.\d)?\s*\+?\s*(?:years?|yrs?)\b"
+STATED_YEARS = re.compile(_CLAIM + r"(?:\s+of)?(?:\s+[a-z-]+)?\s+experience\b")
+LOOSE_YEARS = re.compile(_CLAIM)
+
+_DIGIT = re.compile(r"\d")
+
+# resumes without section headings: any of these words (substring,
+# as before sections were tracked) counts as some experience
+EXPERIENCE_WORDS = (
+    "experience", "years", "worked", "company",
+    "organization", "role", "intern", "internship",
+)
+
+MAX_YEARS = 50
+EARLIEST_YEAR = 1950
+
+
+class DateRange(NamedTuple):
+    """
+    Months since year 0; end is exclusive.
+    """
+    start: int
+    end: int
+
+
+def _month(year: str, mon: Optional[str], num: Optional[str]) -> Tuple[int, bool]:
+    if mon:
+        return int(year) * 12 + _MONTHS[mon] - 1, True
+    if num:
+        return int(year) * 12 + int(num) - 1, True
+    return int(year) * 12, False
+
+
+def parse_date_range(match: "re.Match", today: date) -> Optional[DateRange]:
+    start, _ = _month(match["syear"], match["smon"], match["snum"])
+    current = today.year * 12 + today.month
+
+    if match["now"]:
+        end = current
+    else:
+        end, has_month = _month(match["eyear"], match["emon"], match["enum"])
+        # "Jan 2020 - Dec 2020" is 12 months; "2014 - 2024" is 10 years
+        if has_month:
+            end += 1
+
+    if start < EARLIEST_YEAR * 12 or end > current or end <= start:
+        return None
+    return DateRange(start, end)
+
+
+def merged_months(ranges: List[DateRange]) -> int:
+    """
+    Total months covered, overlapping jobs counted once.
+    """
+    total = 0
+    covered = None
+
+    for start, end in sorted(ranges):
+        if covered is None or start > covered:
+            total += end - start
+            covered = end
+        elif end > covered:
+            total += end - covered
+            covered = end
+
+    return total
+
+
+# -------------------------------------------------
+# Segmented resume (one structured record)
+# -------------------------------------------------
+class ResumeSections(NamedTuple):
+    """
+    Everything scoring needs from a resume's text, in one record.
+
+    skill_bits:        known terms anywhere (matcher bitset)
+    evidenced_bits:    terms used in experience / projects sections
+                       (all terms when the resume has no headings)
+    sections:          section kinds in document order
+    date_ranges:       employment ranges counted as experience
+    experience_months: date_ranges merged (overlaps counted once)
+    stated_years:      largest "N years of experience" claim
+    experience_lines:  non-empty lines under experience headings
+    mentions_work:     no headings, but EXPERIENCE_WORDS appear
+    term_spans:        (term, start, end) of every term match,
+                       character offsets into the original text
+    """
+    skill_bits: int = 0
+    evidenced_bits: int = 0
+    sections: Tuple[str, ...] = ()
+    date_ranges: Tuple[DateRange, ...] = ()
+    experience_months: int = 0
+    stated_years: int = 0
+    experience_lines: int = 0
+    mentions_work: bool = False
+    term_spans: Tuple[Tuple[str, int, int], ...] = ()
+
+    @property
+    def years(self) -> int:
+        """
+        Dated employment wins; the claim is the fallback.
+        """
+        if self.experience_months:
+            return self.experience_months // 12
+        return self.stated_years
+
+    @property
+    def has_experience(self) -> bool:
+        return bool(
+            self.experience_months
+            or self.stated_years
+            or self.experience_lines
+            or self.mentions_work
+        )
+
+
+def heading_kind(line: str) -> Tuple[Optional[str], str]:
+    """
+    (section kind, rest of the line) for a heading line,
+    (None, line) otherwise. `line` is lowercased and stripped.
+    """
+
+    if len(line) > MAX_HEADING_CHARS and ":" not in line[:MAX_HEADING_CHARS]:
+        return None, line
+
+    match = _HEADING.match(line)
+    if match is None:
+        return None, line
+
+    kind = HEADING_KINDS.get(match.group(1))
+    if kind is None:
+        return None, line
+    return kind, match.group(2) or ""
+
+
+def segment_resume(
+    text: str,
+    matcher: SkillMatcher,
+    today: Optional[date] = None,
+    spans: Optional[Sequence[Tuple[str, int, int]]] = None
+) -> ResumeSections:
+    """
+    Split resume text into sections and pull out experience facts
+    in one pass over its lines, then map the matcher's term offsets
+    onto the sections.
+
+    Ranges are counted from the experience section; a resume without
+    one counts every range outside education.
+
+    A resume without any headings falls back to the unsectioned rules:
+    "N years" claims count anywhere and EXPERIENCE_WORDS mark it as
+    having experience.
+
+    `spans` are the matcher's (term, start, end) matches of `text`
+    when a caller already has them (one matcher pass per resume).
+    """
+
+    if not text:
+        return ResumeSections()
+
+    today = today or date.today()
+
+    # (start offset, kind) of each section; None = before any heading
+    boundaries: List[Tuple[int, Optional[str]]] = [(0, None)]
+    ranges: Dict[Optional[str], List[DateRange]] = {}
+    stated = 0
+    unsectioned = 0     # loose claims before the first heading
+    experience_lines = 0
+
+    kind: Optional[str] = None
+    offset = 0
+
+    # offsets are taken on the original text, where the matcher's spans
+    # point: lowercasing can change length ("İ" → "i̇")
+    for raw in text.splitlines(keepends=True):
+        line_start = offset
+        offset += len(raw)
+
+        line = raw.strip().lower()
+        if not line:
+            continue
+
+        heading, line = heading_kind(line)
+        if heading is not None:
+            kind = heading
+            boundaries.append((line_start, kind))
+            if not line:
+                continue
+
+        if kind == EXPERIENCE:
+            experience_lines += 1
+
+        if kind == EDUCATION or not _DIGIT.search(line):
+            continue
+
+        for match in DATE_RANGE.finditer(line):
+            found = parse_date_range(match, today)
+            if found is not None:
+                ranges.setdefault(kind, []).append(found)
+
+        if "y" in line:
+            loose = kind in (EXPERIENCE, SUMMARY) or kind is None
+            claims = LOOSE_YEARS if loose else STATED_YEARS
+            for match in claims.finditer(line):
+                years = int(match["n"])
+                if years > MAX_YEARS:
+                    continue
+                if kind is None and STATED_YEARS.match(line, match.start()) is None:
+                    unsectioned = max(unsectioned, years)
+                else:
+                    stated = max(stated, years)
+
+    if EXPERIENCE in ranges:
+        counted = ranges[EXPERIENCE]
+    elif any(kind == EXPERIENCE for _, kind in boundaries):
+        counted = []
+    else:
+        counted = [r for found in ranges.values() for r in found]
+
+    structured = len(boundaries) > 1
+    mentions_work = False
+    if not structured:
+        stated = max(stated, unsectioned)
+        lowered = text.lower()
+        mentions_work = any(word in lowered for word in EXPERIENCE_WORDS)
+
+    # ---------- skills, positioned by section ----------
+    skill_bits = evidenced_bits = 0
+    starts = [start for start, _ in boundaries]
+    section = 0
+    if spans is None:
+        spans = tuple(matcher.finditer(text))
+
+    for term, start, end in spans:
+        bit = matcher.encode((term,))
+        skill_bits |= bit
+
+        # matches arrive in text order, so the section index only advances
+        while section + 1 < len(starts) and starts[section + 1] <= start:
+            section += 1
+        if not structured or boundaries[section][1] in EVIDENCE_SECTIONS:
+            evidenced_bits |= bit
+
+    return ResumeSections(
+        skill_bits=skill_bits,
+        evidenced_bits=evidenced_bits,
+        sections=tuple(kind for _, kind in boundaries[1:]),
+        date_ranges=tuple(counted),
+        experience_months=merged_months(counted),
+        stated_years=stated,
+        experience_lines=experience_lines,
+        mentions_work=mentions_work,
+        term_spans=tuple(spans),
+    )
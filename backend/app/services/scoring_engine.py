@@ -1,4 +1,260 @@
-from typing import Dict, List
+import math
+from dataclasses import asdict, dataclass, field, fields, replace
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from app.config import get_settings
+from app.utils.metrics import timed
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# -------------------------------
+# Scoring weights / thresholds
+# -------------------------------
+@dataclass(frozen=True)
+class ScoringWeights:
+    """
+    Every tunable number in the scoring path.
+
+    Defaults reproduce the original hardcoded scoring; bonus/penalty
+    and verdict thresholds can be changed in Settings, and any field
+    can be overridden per request.
+    """
+
+    skill_weight: float = 0.5               # × weighted skill match (0–100)
+    listed_skill_weight: float = 0.75       # skill only listed, not used in
+                                            # experience / projects sections
+    project_points: float = 20              # resume mentions any known term
+    senior_experience_points: float = 25    # JD asks for experience, 3+ years
+    mid_experience_points: float = 15       # JD asks for experience, 1–2 years
+    junior_experience_points: float = 5     # JD asks for experience, < 1 year
+    general_experience_points: float = 5    # JD does not ask, resume shows some
+    similarity_points: float = 0            # × embedding similarity (0–1)
+    experience_gate: bool = True            # required experience missing → 0
+
+    strength_bonus: float = 2
+    max_bonus: float = 10
+    gap_penalty: float = 3
+    max_penalty: float = 15
+
+    strong_threshold: int = 80
+    moderate_threshold: int = 60
+    weak_threshold: int = 40
+
+    def __post_init__(self):
+        if not (
+            self.strong_threshold
+            >= self.moderate_threshold
+            >= self.weak_threshold
+        ):
+            raise ValueError(
+                "Thresholds must satisfy strong >= moderate >= weak"
+            )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ScoringWeights":
+        """
+        Stored weights (e.g. a result set's) → ScoringWeights.
+        Keys that are not fields here are ignored; missing fields keep
+        the class defaults (the scoring they were stored without).
+        """
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    def with_overrides(self, overrides: Optional[Dict]) -> "ScoringWeights":
+        return replace(self, **overrides) if overrides else self
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def default_weights() -> ScoringWeights:
+    settings = get_settings()
+    return ScoringWeights(
+        strength_bonus=settings.SCORE_STRENGTH_BONUS,
+        max_bonus=settings.SCORE_MAX_BONUS,
+        gap_penalty=settings.SCORE_GAP_PENALTY,
+        max_penalty=settings.SCORE_MAX_PENALTY,
+        strong_threshold=settings.STRONG_MATCH_THRESHOLD,
+        moderate_threshold=settings.MODERATE_MATCH_THRESHOLD,
+        weak_threshold=settings.WEAK_MATCH_THRESHOLD,
+    )
+
+
+# -------------------------------
+# Per-candidate features
+# -------------------------------
+class LLMEvaluation(NamedTuple):
+    """
+    Normalized LLM verdict; when present it replaces the
+    deterministic base score, strengths, gaps and summary.
+    """
+    match_score: int
+    strengths: Tuple[str, ...]
+    gaps: Tuple[str, ...]
+    summary: str
+
+
+def _vocabulary():
+    # llm_explainer imports this module, so resolve the matcher lazily
+    from app.services.llm_explainer import TERM_MATCHER
+    return TERM_MATCHER
+
+
+class CandidateFeatures(NamedTuple):
+    """
+    Everything the deterministic score depends on, extracted once
+    per (resume, JD). Persisted so weights can change without
+    re-parsing the PDF.
+
+    Skills are TERM_MATCHER bitsets; names are decoded on demand.
+    evidenced_weight: part of matched_weight from skills used in
+    experience / projects sections (see resume_sections);
+    None for features stored before sections were tracked.
+    matched_spans: (term, start, end) of every JD skill match,
+    offsets into the extracted resume text.
+    """
+    matched_bits: int
+    missing_bits: int
+    matched_weight: float
+    total_weight: float
+    has_terms: bool             # any known skill/model in the resume
+    years: int
+    has_experience: bool
+    requires_experience: bool
+    similarity: Optional[float] = None
+    llm: Optional[LLMEvaluation] = None
+    evidenced_weight: Optional[float] = None
+    matched_spans: Tuple[Tuple[str, int, int], ...] = ()
+
+    @property
+    def matched(self) -> Tuple[str, ...]:
+        return _vocabulary().decode(self.matched_bits)
+
+    @property
+    def missing(self) -> Tuple[str, ...]:
+        return _vocabulary().decode(self.missing_bits)
+
+
+# -------------------------------
+# Score breakdown
+# -------------------------------
+# share of the JD skill weight used in experience / projects sections
+PROJECT_RELEVANCE_HIGH = 0.5
+
+
+class ScoreBreakdown(NamedTuple):
+    """
+    How a final score was put together, recorded while scoring.
+
+    skill_match:       weighted skill match (0–100)
+    *_points:          contributions to the base score
+    base_score:        their sum capped at 100; 0 when gated; the
+                       LLM's match score when llm is True (the points
+                       are then the deterministic view, for reference)
+    bonus / penalty:   strengths bonus and gaps penalty
+    experience_match:  JD experience requirement met
+                       (None: the JD does not ask for experience)
+    project_relevance: High / Medium / Low (None: no JD skills)
+    matched_positions: (term, start, end) of matched JD skills
+    """
+    skill_match: int
+    skill_points: float
+    project_points: float
+    experience_points: float
+    similarity_points: float
+    base_score: int
+    bonus: float
+    penalty: float
+    final_score: int
+    gated: bool
+    llm: bool
+    experience_match: Optional[bool]
+    project_relevance: Optional[str]
+    matched_positions: Tuple[Tuple[str, int, int], ...] = ()
+
+    def to_dict(self) -> Dict:
+        positions: Dict[str, List[List[int]]] = {}
+        for term, start, end in self.matched_positions:
+            positions.setdefault(term, []).append([start, end])
+
+        return {
+            "skill_match": self.skill_match,
+            "skill_points": self.skill_points,
+            "project_points": self.project_points,
+            "experience_points": self.experience_points,
+            "similarity_points": self.similarity_points,
+            "base_score": self.base_score,
+            "bonus": self.bonus,
+            "penalty": self.penalty,
+            "final_score": self.final_score,
+            "gated": self.gated,
+            "llm": self.llm,
+            "matched_positions": positions,
+        }
+
+
+# -------------------------------
+# Scored candidate
+# -------------------------------
+@dataclass(frozen=True, slots=True)
+class CandidateResult:
+    """
+    One scored candidate inside the pipeline. Turned into the
+    CandidateEvaluation-shaped dict only at the response boundary.
+
+    explanation: fixed text (LLM summary, unreadable resume);
+    None = rendered from the breakdown only when asked for (explain()).
+    pruned: below a ranking cutoff – score only, never returned.
+    weights: what it was scored with (the explanation's cutoffs).
+    """
+
+    candidate_name: str
+    final_score: int
+    verdict: str = "Poor Match"
+    strengths: Tuple[str, ...] = ()
+    gaps: Tuple[str, ...] = ()
+    explanation: Optional[str] = None
+    duplicate_of: Optional[str] = None
+    pruned: bool = False
+    breakdown: Optional[ScoreBreakdown] = None
+    weights: Optional[ScoringWeights] = field(default=None, compare=False)
+
+    def explain(self) -> str:
+        if self.explanation is not None:
+            return self.explanation
+        if self.breakdown is None:
+            return ""
+        return render_explanation(
+            self.breakdown, self.strengths, self.gaps, self.weights
+        )
+
+    def to_dict(self, explain: bool = True) -> Dict:
+        result = {
+            "candidate_name": self.candidate_name,
+            "final_score": self.final_score,
+            "verdict": self.verdict,
+            "strengths": list(self.strengths),
+            "gaps": list(self.gaps),
+        }
+        if explain:
+            result["explanation"] = self.explain()
+        if self.duplicate_of is not None:
+            result["duplicate_of"] = self.duplicate_of
+        if self.breakdown is not None:
+            result["experience_match"] = self.breakdown.experience_match
+            result["project_relevance"] = self.breakdown.project_relevance
+            result["breakdown"] = self.breakdown.to_dict()
+        return result
 
 
 # -------------------------------
@@ -15,43 +271,286 @@ def clamp_score(score: float) -> int:
 # -------------------------------
 # Helper: confidence label
 # -------------------------------
-def confidence_label(score: int) -> str:
-    if score >= 80:
+def confidence_label(
+    score: int,
+    weights: Optional[ScoringWeights] = None
+) -> str:
+    weights = weights or default_weights()
+
+    if score >= weights.strong_threshold:
         return "Strong Match"
-    elif score >= 60:
+    elif score >= weights.moderate_threshold:
         return "Moderate Match"
-    elif score >= 40:
+    elif score >= weights.weak_threshold:
         return "Weak Match"
     else:
         return "Poor Match"
 
 
+# -------------------------------
+# Deterministic evaluation (features → base score)
+# -------------------------------
+def _is_gated(features: CandidateFeatures, weights: ScoringWeights) -> bool:
+    return (
+        weights.experience_gate
+        and features.requires_experience
+        and not features.has_experience
+    )
+
+
+def _positional_weight(
+    features: CandidateFeatures,
+    weights: ScoringWeights
+) -> float:
+    """
+    Matched skill weight, with skills that are only listed (not used
+    in experience / projects) scaled by listed_skill_weight.
+    """
+    evidenced = features.evidenced_weight
+    if evidenced is None:
+        evidenced = features.matched_weight
+
+    listed = features.matched_weight - evidenced
+    return evidenced + listed * weights.listed_skill_weight
+
+
+def _components(
+    features: CandidateFeatures,
+    weights: ScoringWeights
+) -> Tuple[int, float, float, float, float]:
+    """
+    (skill match 0–100, skill points, project points,
+    experience points, similarity points).
+    """
+
+    skill_match = (
+        int(_positional_weight(features, weights) / features.total_weight * 100)
+        if features.total_weight else 0
+    )
+
+    project_points = weights.project_points if features.has_terms else 0
+
+    if features.requires_experience:
+        if features.years >= 3:
+            exp_points = weights.senior_experience_points
+        elif features.years >= 1:
+            exp_points = weights.mid_experience_points
+        else:
+            exp_points = weights.junior_experience_points
+    else:
+        exp_points = (
+            weights.general_experience_points
+            if features.has_experience else 0
+        )
+
+    similarity_points = (
+        features.similarity * weights.similarity_points
+        if weights.similarity_points and features.similarity is not None
+        else 0
+    )
+
+    return (
+        skill_match,
+        skill_match * weights.skill_weight,
+        project_points,
+        exp_points,
+        similarity_points,
+    )
+
+
+def _base_score(points: Sequence[float]) -> int:
+    skill, project, experience, similarity = points
+    return int(min(skill + project + experience + similarity, 100))
+
+
+def base_match_score(
+    features: CandidateFeatures,
+    weights: ScoringWeights
+) -> int:
+    """
+    skills → projects → experience depth (→ similarity), capped at 100.
+    """
+
+    if _is_gated(features, weights):
+        return 0
+
+    return _base_score(_components(features, weights)[1:])
+
+
+def _project_relevance(features: CandidateFeatures) -> Optional[str]:
+    if not features.total_weight:
+        return None
+
+    evidenced = features.evidenced_weight
+    if evidenced is None:
+        evidenced = features.matched_weight
+
+    share = evidenced / features.total_weight
+    if share >= PROJECT_RELEVANCE_HIGH:
+        return "High"
+    if share > 0:
+        return "Medium"
+    return "Low"
+
+
+def score_breakdown(
+    features: CandidateFeatures,
+    weights: ScoringWeights
+) -> ScoreBreakdown:
+    """
+    Base score, its components, bonus / penalty and final score in
+    one pass over the features. No strings are built.
+    """
+
+    skill_match, *points = _components(features, weights)
+    gated = _is_gated(features, weights)
+
+    if features.llm is not None:
+        base = features.llm.match_score
+        n_strengths = len(features.llm.strengths)
+        n_gaps = len(features.llm.gaps)
+    elif gated:
+        base = 0
+        n_strengths = 0
+        n_gaps = (features.matched_bits | features.missing_bits).bit_count()
+    else:
+        base = _base_score(points)
+        n_strengths = features.matched_bits.bit_count()
+        n_gaps = features.missing_bits.bit_count()
+
+    bonus, penalty = _adjustments(n_strengths, n_gaps, weights)
+
+    return ScoreBreakdown(
+        skill_match,
+        *points,
+        base_score=base,
+        bonus=bonus,
+        penalty=penalty,
+        final_score=clamp_score(base + bonus - penalty),
+        gated=gated,
+        llm=features.llm is not None,
+        experience_match=(
+            features.has_experience if features.requires_experience else None
+        ),
+        project_relevance=_project_relevance(features),
+        matched_positions=features.matched_spans,
+    )
+
+
+GATED_EXPLANATION = (
+    "Candidate does not meet the required experience criteria "
+    "mentioned in the job description."
+)
+
+
+def render_explanation(
+    breakdown: ScoreBreakdown,
+    strengths: Sequence[str],
+    gaps: Sequence[str],
+    weights: Optional[ScoringWeights] = None
+) -> str:
+    """
+    Recruiter-facing summary of a deterministic evaluation.
+    The base score is graded with the strong / moderate thresholds.
+    """
+
+    if breakdown.gated:
+        return GATED_EXPLANATION
+
+    weights = weights or default_weights()
+
+    if breakdown.base_score >= weights.strong_threshold:
+        verdict = "Suitable candidate with minor improvements required."
+    elif breakdown.base_score >= weights.moderate_threshold:
+        verdict = "Partially suitable but requires skill and project improvement."
+    else:
+        verdict = "Currently not suitable for this role."
+
+    return (
+        f"{verdict} "
+        f"Matched skills: {', '.join(strengths) or 'None'}. "
+        f"Missing skills: {', '.join(gaps) or 'None'}."
+    )
+
+
+def _skill_lists(
+    features: CandidateFeatures,
+    breakdown: ScoreBreakdown
+) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    (strengths, gaps) of a deterministic evaluation.
+    """
+    if breakdown.gated:
+        return (), _vocabulary().decode(
+            features.matched_bits | features.missing_bits
+        )
+    return features.matched, features.missing
+
+
+def _evaluate(
+    features: CandidateFeatures,
+    weights: ScoringWeights
+) -> LLMEvaluation:
+    """
+    Deterministic evaluation, same shape as a normalized LLM verdict.
+    The LLM verdict wins when present.
+    """
+
+    if features.llm is not None:
+        return features.llm
+
+    breakdown = score_breakdown(features, weights)
+    strengths, gaps = _skill_lists(features, breakdown)
+
+    return LLMEvaluation(
+        breakdown.base_score,
+        strengths,
+        gaps,
+        render_explanation(breakdown, strengths, gaps, weights)
+    )
+
+
+def evaluate_features(
+    features: CandidateFeatures,
+    weights: Optional[ScoringWeights] = None
+) -> Dict:
+    """
+    Same shape as an LLM evaluation:
+    match_score, strengths, gaps, summary.
+    """
+
+    evaluation = _evaluate(features, weights or default_weights())
+
+    return {
+        "match_score": evaluation.match_score,
+        "strengths": list(evaluation.strengths),
+        "gaps": list(evaluation.gaps),
+        "summary": evaluation.summary
+    }
+
+
 # -------------------------------
 # Core Scoring Engine
 # -------------------------------
 def calculate_final_score(
     gemini_result: Dict,
     resume_text: str,
-    job_description: str
+    job_description: str,
+    weights: Optional[ScoringWeights] = None
 ) -> Dict:
     """
     Takes Gemini evaluation and produces a stable, explainable score
     """
 
+    weights = weights or default_weights()
+
     base_score = gemini_result.get("match_score", 0)
     strengths: List[str] = gemini_result.get("strengths", [])
     gaps: List[str] = gemini_result.get("gaps", [])
 
-    # -------------------------------
-    # Adjustments (transparent logic)
-    # -------------------------------
-    bonus = min(len(strengths) * 2, 10)      # max +10
-    penalty = min(len(gaps) * 3, 15)         # max -15
+    final_score = _final_score(base_score, len(strengths), len(gaps), weights)
 
-    adjusted_score = base_score + bonus - penalty
-    final_score = clamp_score(adjusted_score)
-
-    verdict = confidence_label(final_score)
+    verdict = confidence_label(final_score, weights)
 
     return {
         "final_score": final_score,
@@ -62,4 +561,286 @@ def calculate_final_score(
             "summary",
             "Candidate evaluated based on resume and job description."
         )
-    }
\ No newline at end of file
+    }
+
+
+def _adjustments(
+    n_strengths: int,
+    n_gaps: int,
+    weights: ScoringWeights
+) -> Tuple[float, float]:
+    # -------------------------------
+    # Adjustments (transparent logic)
+    # -------------------------------
+    bonus = min(n_strengths * weights.strength_bonus, weights.max_bonus)
+    penalty = min(n_gaps * weights.gap_penalty, weights.max_penalty)
+
+    return bonus, penalty
+
+
+def _final_score(
+    base_score: int,
+    n_strengths: int,
+    n_gaps: int,
+    weights: ScoringWeights
+) -> int:
+    bonus, penalty = _adjustments(n_strengths, n_gaps, weights)
+    return clamp_score(base_score + bonus - penalty)
+
+
+@timed("score_candidate")
+def score_candidate(
+    candidate_name: str,
+    features: CandidateFeatures,
+    weights: ScoringWeights,
+    breakdown: Optional[ScoreBreakdown] = None
+) -> CandidateResult:
+    """
+    Features (+ LLM verdict, if any) → scored candidate, in one step:
+    the compact counterpart of evaluate_features + calculate_final_score.
+
+    The breakdown is recorded in the same pass (pass it in if already
+    computed); the explanation of a deterministic evaluation is only
+    rendered if the result is serialized with explain=True.
+    """
+
+    breakdown = breakdown or score_breakdown(features, weights)
+
+    if features.llm is not None:
+        strengths, gaps = features.llm.strengths, features.llm.gaps
+        explanation = features.llm.summary
+    else:
+        strengths, gaps = _skill_lists(features, breakdown)
+        explanation = None
+
+    return CandidateResult(
+        candidate_name=candidate_name,
+        final_score=breakdown.final_score,
+        verdict=confidence_label(breakdown.final_score, weights),
+        strengths=strengths,
+        gaps=gaps,
+        explanation=explanation,
+        breakdown=breakdown,
+        weights=weights,
+    )
+
+
+def features_final_score(
+    features: CandidateFeatures,
+    weights: ScoringWeights
+) -> int:
+    """
+    The final score calculate_final_score() would give, from the
+    features alone: no strengths/gaps lists, no explanation text.
+    Used to prune candidates that cannot reach a ranking cutoff.
+    """
+    return score_breakdown(features, weights).final_score
+
+
+def final_score_bound(
+    features: CandidateFeatures,
+    weights: ScoringWeights
+) -> int:
+    """
+    Highest final score features_final_score() can give a resume with
+    this JD skill overlap, whatever its sections, experience and
+    similarity turn out to be. Only the skill fields and has_terms are
+    read, so it works on skill_overlap() before features are extracted.
+
+    An LLM verdict can set any base score: with one the bound is 100.
+    """
+
+    if features.llm is not None:
+        return 100
+
+    # every matched skill at its best position (evidenced or listed);
+    # rounded up, so float noise cannot lift the real score past it
+    skill_match = (
+        math.ceil(
+            features.matched_weight * max(1.0, weights.listed_skill_weight)
+            / features.total_weight * 100
+        )
+        if features.total_weight else 0
+    )
+
+    if features.requires_experience:
+        experience = max(
+            weights.senior_experience_points,
+            weights.mid_experience_points,
+            weights.junior_experience_points,
+        )
+    else:
+        experience = max(weights.general_experience_points, 0)
+
+    points = (
+        max(skill_match * weights.skill_weight, 0)
+        + (max(weights.project_points, 0) if features.has_terms else 0)
+        + experience
+        + max(weights.similarity_points, 0)
+    )
+    bound = _final_score(
+        min(math.ceil(points), 100),
+        features.matched_bits.bit_count(),
+        features.missing_bits.bit_count(),
+        weights
+    )
+
+    if weights.experience_gate and features.requires_experience:
+        # a gated candidate scores on its gaps alone
+        gaps = (features.matched_bits | features.missing_bits).bit_count()
+        bound = max(bound, _final_score(0, 0, gaps, weights))
+
+    return bound
+
+
+# -------------------------------
+# Vectorized re-scoring
+# -------------------------------
+VERDICTS = ("Strong Match", "Moderate Match", "Weak Match", "Poor Match")
+
+
+class FeatureMatrix(NamedTuple):
+    """
+    Column-wise CandidateFeatures for a whole result set.
+    Rows whose features are None (unreadable resumes) have readable=False.
+    """
+    readable: "np.ndarray"
+    matched_weight: "np.ndarray"
+    evidenced_weight: "np.ndarray"   # matched_weight where not tracked
+    total_weight: "np.ndarray"
+    has_terms: "np.ndarray"
+    years: "np.ndarray"
+    has_experience: "np.ndarray"
+    requires_experience: "np.ndarray"
+    similarity: "np.ndarray"
+    n_matched: "np.ndarray"
+    n_missing: "np.ndarray"
+    llm_score: "np.ndarray"       # NaN where no LLM evaluation
+    n_llm_strengths: "np.ndarray"
+    n_llm_gaps: "np.ndarray"
+
+
+def feature_matrix(
+    features: Sequence[Optional[CandidateFeatures]]
+) -> FeatureMatrix:
+    import numpy as np
+
+    empty = CandidateFeatures(0, 0, 0.0, 0.0, False, 0, False, False)
+    rows = [f or empty for f in features]
+
+    def column(getter, dtype):
+        return np.fromiter(
+            (getter(f) for f in rows), dtype=dtype, count=len(rows)
+        )
+
+    return FeatureMatrix(
+        readable=np.fromiter(
+            (f is not None for f in features), dtype=bool, count=len(rows)
+        ),
+        matched_weight=column(lambda f: f.matched_weight, np.float64),
+        evidenced_weight=column(
+            lambda f: (
+                f.matched_weight if f.evidenced_weight is None
+                else f.evidenced_weight
+            ),
+            np.float64
+        ),
+        total_weight=column(lambda f: f.total_weight, np.float64),
+        has_terms=column(lambda f: f.has_terms, bool),
+        years=column(lambda f: f.years, np.int64),
+        has_experience=column(lambda f: f.has_experience, bool),
+        requires_experience=column(lambda f: f.requires_experience, bool),
+        similarity=column(
+            lambda f: np.nan if f.similarity is None else f.similarity,
+            np.float64
+        ),
+        n_matched=column(lambda f: f.matched_bits.bit_count(), np.int64),
+        n_missing=column(lambda f: f.missing_bits.bit_count(), np.int64),
+        llm_score=column(
+            lambda f: np.nan if f.llm is None else f.llm.match_score,
+            np.float64
+        ),
+        n_llm_strengths=column(
+            lambda f: len(f.llm.strengths) if f.llm else 0, np.int64
+        ),
+        n_llm_gaps=column(lambda f: len(f.llm.gaps) if f.llm else 0, np.int64),
+    )
+
+
+@timed("score_features_batch")
+def score_features_batch(
+    matrix: FeatureMatrix,
+    weights: ScoringWeights
+) -> "Tuple[np.ndarray, np.ndarray, np.ndarray]":
+    """
+    base_match_score + calculate_final_score for every row at once.
+    Same arithmetic (and truncation) as the scalar path.
+
+    Returns (base_scores, final_scores, verdicts).
+    """
+
+    import numpy as np
+
+    m = matrix
+    total = m.total_weight
+
+    positional = (
+        m.evidenced_weight
+        + (m.matched_weight - m.evidenced_weight) * weights.listed_skill_weight
+    )
+    skill = np.where(
+        total > 0,
+        np.floor(positional / np.where(total > 0, total, 1) * 100),
+        0.0
+    )
+    project = np.where(m.has_terms, weights.project_points, 0)
+    experience = np.where(
+        m.requires_experience,
+        np.select(
+            [m.years >= 3, m.years >= 1],
+            [weights.senior_experience_points, weights.mid_experience_points],
+            weights.junior_experience_points
+        ),
+        np.where(m.has_experience, weights.general_experience_points, 0)
+    )
+
+    score = skill * weights.skill_weight + project + experience
+    if weights.similarity_points:
+        score = score + np.nan_to_num(m.similarity) * weights.similarity_points
+
+    base = np.floor(np.minimum(score, 100))
+
+    gated = (
+        m.requires_experience & ~m.has_experience
+        if weights.experience_gate
+        else np.zeros_like(m.readable)
+    )
+    base[gated] = 0
+
+    n_strengths = np.where(gated, 0, m.n_matched)
+    n_gaps = np.where(gated, m.n_matched + m.n_missing, m.n_missing)
+
+    # LLM-evaluated rows: the LLM verdict is the base, weights only
+    # change bonus/penalty and thresholds
+    has_llm = ~np.isnan(m.llm_score)
+    base = np.where(has_llm, m.llm_score, base)
+    n_strengths = np.where(has_llm, m.n_llm_strengths, n_strengths)
+    n_gaps = np.where(has_llm, m.n_llm_gaps, n_gaps)
+
+    bonus = np.minimum(n_strengths * weights.strength_bonus, weights.max_bonus)
+    penalty = np.minimum(n_gaps * weights.gap_penalty, weights.max_penalty)
+
+    final = np.floor(np.clip(base + bonus - penalty, 0, 100))
+    final[~m.readable] = 0
+
+    verdicts = np.array(VERDICTS)[np.select(
+        [
+            final >= weights.strong_threshold,
+            final >= weights.moderate_threshold,
+            final >= weights.weak_threshold,
+        ],
+        [0, 1, 2],
+        3
+    )]
+
+    return base.astype(np.int64), final.astype(np.int64), verdicts
@@ -0,0 +1,156 @@
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
+
+# -------------------------------------------------
+# Tokenizer
+# -------------------------------------------------
+# Words are runs of letters/digits, optionally followed by "+" or "#"
+# so that terms like "c++" and "c#" survive tokenization.
+# Hyphens, dots, slashes etc. act as separators, which means
+# "scikit-learn" and "scikit learn" both become ["scikit", "learn"].
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+[+#]*")
+
+# Same tokens, matched on text that has not been lowercased
+_TOKEN_ANY_CASE = re.compile(r"[A-Za-z0-9]+[+#]*")
+
+# Trie node key marking the end of a dictionary term
+_TERM_KEY = "\0"
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+# -------------------------------------------------
+# Compiled Matcher
+# -------------------------------------------------
+class SkillMatcher:
+    """
+    Word-boundary aware multi-term matcher.
+
+    All dictionary terms are compiled once into a token trie,
+    so matching a document is a single pass over its tokens.
+    Cost depends on text length (and the longest phrase),
+    NOT on dictionary size.
+
+    "ai" will not match inside "maintain" and "git" will not
+    match inside "digital", because matching is token based.
+
+    The sorted terms also form a bitset vocabulary: term i is bit
+    1 << i, so a set of terms is one int and matched / missing
+    skills are & / & ~ instead of set operations. Decoding yields
+    terms in sorted order.
+    """
+
+    __slots__ = ("_root", "_max_phrase_len", "_bits", "terms", "vocabulary")
+
+    def __init__(self, terms: Iterable[str]):
+        self._root: Dict = {}
+        self._max_phrase_len = 0
+        self.terms: FrozenSet[str] = frozenset(terms)
+        self.vocabulary: Tuple[str, ...] = tuple(sorted(self.terms))
+        self._bits: Dict[str, int] = {
+            term: 1 << i for i, term in enumerate(self.vocabulary)
+        }
+
+        for term in self.terms:
+            tokens = tokenize(term)
+            if not tokens:
+                continue
+
+            node = self._root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[_TERM_KEY] = term
+
+            self._max_phrase_len = max(self._max_phrase_len, len(tokens))
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """
+        Yield (term, start, end) for every match in text.
+        Offsets are character positions in the original text.
+        Overlapping matches are all reported
+        (e.g. both "learning" and "machine learning").
+        """
+
+        if not text or not self._root:
+            return
+
+        if text.isascii():
+            # lowercasing ASCII keeps every offset
+            spans = [
+                (m.group(), m.start(), m.end())
+                for m in TOKEN_PATTERN.finditer(text.lower())
+            ]
+        else:
+            # some characters change length when lowercased
+            # ("İ" → "i̇"): match the original, lowercase each token
+            spans = [
+                (m.group().lower(), m.start(), m.end())
+                for m in _TOKEN_ANY_CASE.finditer(text)
+            ]
+
+        for i, (token, start, _) in enumerate(spans):
+            node = self._root.get(token)
+            j = i
+
+            while node is not None:
+                term = node.get(_TERM_KEY)
+                if term is not None:
+                    yield term, start, spans[j][2]
+
+                j += 1
+                if j >= len(spans) or j - i >= self._max_phrase_len:
+                    break
+                node = node.get(spans[j][0])
+
+    def find(self, text: str) -> Set[str]:
+        """
+        Return the set of dictionary terms present in text.
+        """
+        return {term for term, _, _ in self.finditer(text)}
+
+    def find_bits(self, text: str) -> int:
+        """
+        Terms present in text, as a bitset.
+        """
+        bits = 0
+        for term, _, _ in self.finditer(text):
+            bits |= self._bits[term]
+        return bits
+
+    # ---------- bitset vocabulary ----------
+    def encode(self, terms: Iterable[str]) -> int:
+        """
+        Terms → bitset (terms outside the vocabulary are ignored).
+        """
+        bits = 0
+        for term in terms:
+            bits |= self._bits.get(term, 0)
+        return bits
+
+    def decode(self, bits: int) -> Tuple[str, ...]:
+        """
+        Bitset → terms, sorted.
+        """
+        terms = []
+        while bits:
+            low = bits & -bits
+            terms.append(self.vocabulary[low.bit_length() - 1])
+            bits ^= low
+        return tuple(terms)
+
+
+# -------------------------------------------------
+# Matcher Cache
+# -------------------------------------------------
+@lru_cache(maxsize=32)
+def get_matcher(terms: FrozenSet[str]) -> SkillMatcher:
+    """
+    Compile (once) and return a matcher for a term dictionary.
+    """
+    return SkillMatcher(terms)
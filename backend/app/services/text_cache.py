@@ -0,0 +1,275 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from app.config import get_settings
+
+
+# -------------------------------------------------
+# Content hashing
+# -------------------------------------------------
+def hash_bytes(data: bytes) -> str:
+    """
+    SHA-256 hex digest used as the cache key.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+# -------------------------------------------------
+# Two-tier text cache (memory LRU + optional SQLite)
+# -------------------------------------------------
+class TextCache:
+    """
+    Content-addressed cache of extracted resume text.
+
+    Key   -> SHA-256 of the raw file bytes
+    Value -> extracted text
+
+    Tier 1: in-memory LRU, bounded by total text size
+    Tier 2: optional SQLite file, bounded by total text size
+            (least recently accessed rows are evicted first)
+
+    The disk tier keeps a running byte total (summed once on open) and
+    only re-counts the table when that total says it is over budget,
+    so writes from other workers sharing the file are seen before
+    evicting. Access times of disk hits are queued and written in
+    batches of TOUCH_BATCH (and before any eviction), not per hit.
+
+    NEVER crashes – disk errors degrade to memory-only.
+    """
+
+    TOUCH_BATCH = 64
+
+    def __init__(
+        self,
+        max_memory_bytes: int,
+        cache_dir: Optional[str] = None,
+        max_disk_bytes: int = 0
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+
+        # key -> (text, size in bytes)
+        self._memory: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        # key -> last access time not yet written to the disk tier
+        self._touched: Dict[str, float] = {}
+
+        if cache_dir and max_disk_bytes > 0:
+            self._db = self._open_db(cache_dir)
+
+        if self._db is not None:
+            try:
+                self._disk_bytes = self._disk_total()
+            except Exception as e:
+                print(f"[Text Cache] Disk tier disabled: {e}")
+                self._db = None
+
+    # ---------- disk tier ----------
+    @staticmethod
+    def _open_db(cache_dir: str) -> Optional[sqlite3.Connection]:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            db = sqlite3.connect(
+                os.path.join(cache_dir, "text_cache.sqlite3"),
+                check_same_thread=False
+            )
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " text TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_entries_access "
+                "ON entries(last_access)"
+            )
+            db.commit()
+            return db
+        except Exception as e:
+            print(f"[Text Cache] Disk tier disabled: {e}")
+            return None
+
+    def _disk_total(self) -> int:
+        return self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()[0]
+
+    def _flush_touched(self) -> None:
+        if not self._touched:
+            return
+
+        self._db.executemany(
+            "UPDATE entries SET last_access = ? WHERE key = ?",
+            [(at, key) for key, at in self._touched.items()]
+        )
+        self._touched.clear()
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT text FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        self._touched[key] = time.time()
+        if len(self._touched) >= self.TOUCH_BATCH:
+            self._flush_touched()
+            self._db.commit()
+
+        return row[0]
+
+    def _disk_put(self, key: str, text: str, size: int) -> None:
+        self._touched.pop(key, None)
+
+        old = self._db.execute(
+            "SELECT size FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries (key, text, size, last_access) "
+            "VALUES (?, ?, ?, ?)",
+            (key, text, size, time.time())
+        )
+        self._disk_bytes += size - (old[0] if old else 0)
+
+        if self._disk_bytes > self.max_disk_bytes:
+            # exact count (other workers may share the file) and
+            # current access times before choosing what to evict
+            self._flush_touched()
+            total = self._disk_total()
+
+            if total > self.max_disk_bytes:
+                rows = self._db.execute(
+                    "SELECT key, size FROM entries ORDER BY last_access"
+                )
+                stale = []
+                for old_key, old_size in rows:
+                    if total <= self.max_disk_bytes:
+                        break
+                    stale.append((old_key,))
+                    total -= old_size
+
+                self._db.executemany(
+                    "DELETE FROM entries WHERE key = ?", stale
+                )
+                self.evictions += len(stale)
+
+            self._disk_bytes = total
+
+        self._db.commit()
+
+    # ---------- memory tier ----------
+    def _memory_put(self, key: str, text: str, size: int) -> None:
+        if size > self.max_memory_bytes:
+            return
+
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key)[1]
+
+        self._memory[key] = (text, size)
+        self._memory_bytes += size
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, (_, old_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= old_size
+            self.evictions += 1
+
+    # ---------- public API ----------
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return entry[0]
+
+            text = None
+
+            if self._db is not None:
+                try:
+                    text = self._disk_get(key)
+                except Exception as e:
+                    print(f"[Text Cache] Disk read failed: {e}")
+
+                if text is not None:
+                    self.disk_hits += 1
+                    self._memory_put(key, text, len(text.encode("utf-8")))
+                    return text
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, text: str) -> None:
+        if not key or not text:
+            return
+
+        size = len(text.encode("utf-8"))
+
+        with self._lock:
+            self._memory_put(key, text, size)
+
+            if self._db is not None:
+                try:
+                    self._disk_put(key, text, size)
+                except Exception as e:
+                    print(f"[Text Cache] Disk write failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+            if self._db is not None:
+                self._touched.clear()
+                self._db.execute("DELETE FROM entries")
+                self._db.commit()
+                self._disk_bytes = 0
+
+
+# -------------------------------------------------
+# Singleton
+# -------------------------------------------------
+@lru_cache
+def get_text_cache() -> Optional[TextCache]:
+    """
+    Shared text cache, or None when caching is disabled.
+    """
+    settings = get_settings()
+
+    if not settings.TEXT_CACHE_ENABLED:
+        return None
+
+    return TextCache(
+        max_memory_bytes=settings.TEXT_CACHE_MEMORY_MB * 1024 * 1024,
+        cache_dir=settings.TEXT_CACHE_DIR,
+        max_disk_bytes=settings.TEXT_CACHE_DISK_MB * 1024 * 1024
+    )
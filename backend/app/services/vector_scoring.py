@@ -0,0 +1,65 @@
+from typing import TYPE_CHECKING, Sequence
+
+from app.services.embedding_service import get_embeddings
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# ---------------------------------------------
+# Normalized float32 matrices
+# ---------------------------------------------
+def normalize_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """
+    Return a C-contiguous float32 copy with unit-length rows.
+    Zero rows (failed embeddings) stay zero.
+    """
+
+    import numpy as np
+
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if matrix.ndim != 2 or matrix.size == 0:
+        return matrix
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class VectorMatrix:
+    """
+    Row-normalized float32 matrix of resume (or JD) vectors.
+
+    Normalizing once at build time means every similarity
+    query afterwards is a single matmul. Pass normalized=True for
+    rows that are already unit length (e.g. the candidate store's
+    memmap) to use them without a copy.
+    """
+
+    __slots__ = ("vectors",)
+
+    def __init__(self, vectors: "np.ndarray", normalized: bool = False):
+        self.vectors = vectors if normalized else normalize_rows(vectors)
+
+    @classmethod
+    def from_texts(cls, texts: Sequence[str]) -> "VectorMatrix":
+        return cls(get_embeddings(list(texts)))
+
+    def __len__(self) -> int:
+        return self.vectors.shape[0]
+
+    @property
+    def dim(self) -> int:
+        return self.vectors.shape[1] if self.vectors.ndim == 2 else 0
+
+    def similarity(self, other: "VectorMatrix") -> "np.ndarray":
+        """
+        (len(self), len(other)) cosine similarity matrix.
+        """
+
+        import numpy as np
+
+        if not self.dim or self.dim != other.dim:
+            return np.zeros((len(self), len(other)), dtype=np.float32)
+
+        return self.vectors @ other.vectors.T
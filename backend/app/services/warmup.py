@@ -0,0 +1,193 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.config import get_settings
+
+
+# -------------------------------------------------
+# Readiness state
+# -------------------------------------------------
+class WarmupState:
+    """
+    Progress of the startup warm-up, reported by GET /ready.
+    """
+
+    def __init__(self):
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.steps: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.finished_at is not None
+
+    def record(self, step: str, seconds: float, error: Optional[str] = None):
+        with self._lock:
+            self.steps[step] = round(seconds, 6)
+            if error:
+                self.errors[step] = error
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            elapsed = None
+            if self.started_at is not None:
+                end = self.finished_at or time.perf_counter()
+                elapsed = round(end - self.started_at, 6)
+
+            return {
+                "ready": self.ready,
+                "warmup_seconds": elapsed,
+                "steps": dict(self.steps),
+                "errors": dict(self.errors),
+            }
+
+
+STATE = WarmupState()
+
+
+# -------------------------------------------------
+# Worker preload (runs inside pool processes)
+# -------------------------------------------------
+def preload_worker() -> int:
+    """
+    Import the PDF stack and build the skill matcher in a pool worker.
+    Top-level (picklable); returns the worker pid.
+    """
+    import pdfplumber  # noqa: F401
+    import pdfminer.layout  # noqa: F401
+
+    from app.services.llm_explainer import TERM_MATCHER
+
+    TERM_MATCHER.find("python")
+    return os.getpid()
+
+
+def _prespawn(executor: Executor, workers: int) -> int:
+    """
+    Submit one preload per worker so every process is started
+    (and has its imports done) before the first request.
+    """
+    if not isinstance(executor, ProcessPoolExecutor):
+        return 0
+
+    futures = [executor.submit(preload_worker) for _ in range(workers)]
+    return len({future.result() for future in futures})
+
+
+# -------------------------------------------------
+# Steps
+# -------------------------------------------------
+def _warm_skill_matcher() -> None:
+    from app.services.llm_explainer import TERM_MATCHER
+
+    TERM_MATCHER.find("python fastapi machine learning")
+
+
+def _warm_pdf_parser() -> None:
+    # in-process parsing (sync endpoint paths, thread fallback)
+    import pdfplumber  # noqa: F401
+    import pdfminer.layout  # noqa: F401
+
+
+def _warm_numpy() -> None:
+    # imported on first use by scoring, ranking, dedup and embeddings,
+    # so importing the app does not pay for it
+    import numpy  # noqa: F401
+
+
+def _warm_embedding_backend() -> None:
+    from app.services.embedding_backends import get_embedding_backend
+
+    backend = get_embedding_backend()
+
+    # local backends build their internals on first call; network
+    # backends are only constructed so no quota is spent here
+    if backend is not None and backend.name == "local":
+        backend.embed(["warm up"])
+
+
+def _warm_llm_backend() -> None:
+    # imports the LLM SDK / builds the client; no request is sent
+    from app.services.llm_client import get_llm_backend
+
+    get_llm_backend()
+
+
+def _warm_text_cache() -> None:
+    from app.services.text_cache import get_text_cache
+
+    get_text_cache()
+
+
+def _warm_pdf_pool() -> None:
+    from app.services.pipeline import get_pdf_executor, pdf_workers
+
+    _prespawn(get_pdf_executor(), pdf_workers())
+
+
+def _warm_scoring_pool() -> None:
+    from app.services.pipeline import get_scoring_executor
+
+    settings = get_settings()
+    _prespawn(get_scoring_executor(), settings.SCORING_WORKERS)
+
+
+STEPS: List[Tuple[str, Callable[[], None]]] = [
+    ("skill_matcher", _warm_skill_matcher),
+    ("pdf_parser", _warm_pdf_parser),
+    ("numpy", _warm_numpy),
+    ("embedding_backend", _warm_embedding_backend),
+    ("llm_backend", _warm_llm_backend),
+    ("text_cache", _warm_text_cache),
+    ("pdf_pool", _warm_pdf_pool),
+    ("scoring_pool", _warm_scoring_pool),
+]
+
+
+# -------------------------------------------------
+# Entry points
+# -------------------------------------------------
+def run_warmup(state: WarmupState = STATE) -> WarmupState:
+    """
+    Run every warm-up step once. A failing step is recorded and
+    skipped – the feature it preloads falls back to lazy loading.
+    """
+
+    state.started_at = time.perf_counter()
+
+    for name, step in STEPS:
+        started = time.perf_counter()
+        try:
+            step()
+            state.record(name, time.perf_counter() - started)
+        except Exception as e:
+            print(f"[Warmup] {name} failed: {e}")
+            state.record(name, time.perf_counter() - started, str(e))
+
+    state.finished_at = time.perf_counter()
+    print(
+        f"[Warmup] Ready in {state.finished_at - state.started_at:.2f}s"
+    )
+    return state
+
+
+async def warm_up(state: WarmupState = STATE) -> WarmupState:
+    """
+    Run the warm-up off the event loop so the server can answer
+    health/readiness probes meanwhile.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, run_warmup, state)
+
+
+def mark_ready(state: WarmupState = STATE) -> None:
+    """
+    Warm-up disabled: everything loads lazily, report ready at once.
+    """
+    state.started_at = state.finished_at = time.perf_counter()
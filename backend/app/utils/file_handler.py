@@ -1,44 +1,216 @@
+import hashlib
 import os
-import shutil
 import uuid
 from fastapi import UploadFile
 from typing import Optional
 
+from app.config import get_settings
+from app.services.extractors import HEAD_BYTES, sniff_format
+
 # ===============================
 # Base upload directory
 # ===============================
 UPLOAD_DIR = "tmp/uploads"
 
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# Streaming chunk size for reads / copies / hashing
+CHUNK_SIZE = 1024 * 1024
+HASH_CHUNK_SIZE = CHUNK_SIZE
+
+
+# ===============================
+# Validation helpers
+# ===============================
+def max_upload_bytes() -> int:
+    """
+    Per-file size limit (MAX_FILE_SIZE_MB) in bytes.
+    """
+    return get_settings().MAX_FILE_SIZE_MB * 1024 * 1024
+
+
+def is_supported_document(head: bytes) -> bool:
+    """
+    Magic-byte check against the extractor registry
+    (PDF, DOCX, HTML, text – see services/extractors).
+    The file name is not trusted.
+    """
+    return sniff_format(head) is not None
+
+
+def check_upload(
+    upload_file: UploadFile,
+    max_bytes: Optional[int] = None
+) -> bool:
+    """
+    Size and format check of an upload without reading it all
+    (size from the end of the spooled file, format from its head).
+    The file position is rewound.
+    """
+
+    if not upload_file or not upload_file.file:
+        return False
+
+    max_bytes = max_upload_bytes() if max_bytes is None else max_bytes
+
+    try:
+        upload_file.file.seek(0, os.SEEK_END)
+        size = upload_file.file.tell()
+        upload_file.file.seek(0)
+
+        if not size or size > max_bytes:
+            print(f"[File Check] Empty or too large: {upload_file.filename}")
+            return False
+
+        head = upload_file.file.read(HEAD_BYTES)
+        upload_file.file.seek(0)
+
+        if not is_supported_document(head):
+            print(f"[File Check] Unsupported format: {upload_file.filename}")
+            return False
+
+        return True
+
+    except Exception as e:
+        print(f"[File Check Error] {e}")
+        return False
+
+
+def should_spool_to_disk(upload_file: UploadFile) -> bool:
+    """
+    Decide the ingestion path for an upload.
+
+    memory -> parse straight from the upload buffer (no temp file)
+    disk   -> copy to tmp/uploads (INGEST_MODE="disk", or the
+              upload is larger than INGEST_MEMORY_LIMIT_MB, which
+              must stay below MAX_FILE_SIZE_MB to ever apply)
+    """
+    settings = get_settings()
+
+    if settings.INGEST_MODE == "disk":
+        return True
+
+    size = getattr(upload_file, "size", None)
+    limit = settings.INGEST_MEMORY_LIMIT_MB * 1024 * 1024
+
+    return size is not None and size > limit
+
+
+# ===============================
+# Read upload into memory (no disk copy)
+# ===============================
+def read_upload_bytes(
+    upload_file: UploadFile,
+    max_bytes: Optional[int] = None
+) -> Optional[bytearray]:
+    """
+    Stream an upload into memory, enforcing the format check on the
+    head of the first chunk and the size limit while reading.
+    The buffer is returned as is (no bytes() copy of the upload).
+    Returns None if the file is invalid or too large.
+    """
+
+    if not upload_file or not upload_file.file:
+        return None
+
+    max_bytes = max_upload_bytes() if max_bytes is None else max_bytes
+    buffer = bytearray()
+
+    try:
+        upload_file.file.seek(0)
+
+        for chunk in iter(lambda: upload_file.file.read(CHUNK_SIZE), b""):
+            if not buffer and not is_supported_document(chunk[:HEAD_BYTES]):
+                print(f"[File Read] Unsupported format: {upload_file.filename}")
+                return None
+
+            buffer += chunk
+
+            if len(buffer) > max_bytes:
+                print(f"[File Read] File too large: {upload_file.filename}")
+                return None
+
+        return buffer if buffer else None
+
+    except Exception as e:
+        print(f"[File Read Error] {e}")
+        return None
 
 
 # ===============================
 # Save uploaded file safely
 # ===============================
-def save_upload_file(upload_file: UploadFile) -> Optional[str]:
+def save_upload_file(
+    upload_file: UploadFile,
+    max_bytes: Optional[int] = None,
+    directory: str = UPLOAD_DIR
+) -> Optional[str]:
     """
     Save an uploaded file to disk safely and return file path.
+    Size and format are checked while streaming, so an invalid
+    or oversized upload is never fully written.
     Returns None if file is invalid.
     """
 
     if not upload_file or not upload_file.filename:
         return None
 
-    # Only allow PDFs (basic safety)
-    if not upload_file.filename.lower().endswith(".pdf"):
-        return None
+    max_bytes = max_upload_bytes() if max_bytes is None else max_bytes
 
-    unique_name = f"{uuid.uuid4().hex}_{upload_file.filename}"
-    file_path = os.path.join(UPLOAD_DIR, unique_name)
+    unique_name = (
+        f"{uuid.uuid4().hex}_{os.path.basename(upload_file.filename)}"
+    )
+    file_path = os.path.join(directory, unique_name)
 
     try:
+        os.makedirs(directory, exist_ok=True)
+        upload_file.file.seek(0)
+
+        written = 0
         with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(upload_file.file, buffer)
+            for chunk in iter(lambda: upload_file.file.read(CHUNK_SIZE), b""):
+                if written == 0 and not is_supported_document(
+                    chunk[:HEAD_BYTES]
+                ):
+                    raise ValueError("Unsupported format")
+
+                written += len(chunk)
+                if written > max_bytes:
+                    raise ValueError("File too large")
+
+                buffer.write(chunk)
+
+        return file_path if written else None
+
+    except Exception as e:
+        print(f"[File Save Error] {upload_file.filename}: {e}")
+        delete_file(file_path)
+        return None
+
+
+# ===============================
+# Content hash of an upload
+# ===============================
+def hash_upload_file(upload_file: UploadFile) -> Optional[str]:
+    """
+    SHA-256 of the uploaded bytes (used as a content-addressed key).
+    The file position is rewound so the upload can still be saved/parsed.
+    Returns None if the file cannot be read.
+    """
+
+    if not upload_file or not upload_file.file:
+        return None
+
+    digest = hashlib.sha256()
+
+    try:
+        upload_file.file.seek(0)
+        for chunk in iter(lambda: upload_file.file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        upload_file.file.seek(0)
 
-        return file_path
+        return digest.hexdigest()
 
     except Exception as e:
-        print(f"[File Save Error] {e}")
+        print(f"[File Hash Error] {e}")
         return None
 
 
@@ -53,4 +225,4 @@ def delete_file(file_path: str) -> None:
         if file_path and os.path.exists(file_path):
             os.remove(file_path)
     except Exception as e:
-        print(f"[File Delete Error] {e}")
\ No newline at end of file
+        print(f"[File Delete Error] {e}")
@@ -0,0 +1,246 @@
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.config import get_settings
+
+# ===============================
+# Global switch
+# ===============================
+# Read once at import: when disabled, decorators return the original
+# function and timers are a shared no-op, so the cost is ~zero.
+ENABLED: bool = get_settings().METRICS_ENABLED
+
+# The registry is per process. Work submitted to the process pools
+# (document extraction, and analyze_resume with SCORING_EXECUTOR=process)
+# records into the child's registry, which /metrics never sees, so
+# those stages are timed in the parent around the pool call instead
+# ("extract_text_from_pdf", "analyze_resume"). Decorated stages called
+# from inside them (score_candidate, get_embeddings for resume
+# similarity) only count calls made in the API process.
+
+PREFIX = "resume_screener_"
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+# ===============================
+# Metric types
+# ===============================
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def samples(self) -> List[Tuple[str, float]]:
+        return [(self.name, self.value)]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def samples(self) -> List[Tuple[str, float]]:
+        with self._lock:
+            counts, total, count = list(self.counts), self.sum, self.count
+
+        lines, cumulative = [], 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            lines.append((f'{self.name}_bucket{{le="{bound}"}}', cumulative))
+        lines.append((f'{self.name}_bucket{{le="+Inf"}}', count))
+        lines.append((f"{self.name}_sum", total))
+        lines.append((f"{self.name}_count", count))
+        return lines
+
+
+# ===============================
+# Registry
+# ===============================
+class MetricsRegistry:
+    """
+    Process-local metric registry rendered in Prometheus text format.
+
+    Collectors are callables evaluated at scrape time, returning
+    (name, kind, help, value) tuples – used to expose counters that
+    other components (e.g. caches) already keep.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], List[Tuple[str, str, str, float]]]] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, help_text: str, **kwargs):
+        full_name = PREFIX + name
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = cls(full_name, help_text, **kwargs)
+                self._metrics[full_name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        return self._get_or_create(Counter, name, help_text)
+
+    def gauge(self, name: str, help_text: str = "") -> Gauge:
+        return self._get_or_create(Gauge, name, help_text)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str = "",
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, buckets=buckets)
+
+    def add_collector(
+        self,
+        collector: Callable[[], List[Tuple[str, str, str, float]]]
+    ) -> None:
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        lines: List[str] = []
+
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(f"{name} {value}" for name, value in metric.samples())
+
+        for collector in self._collectors:
+            try:
+                for name, kind, help_text, value in collector():
+                    full_name = PREFIX + name
+                    lines.append(f"# HELP {full_name} {help_text}")
+                    lines.append(f"# TYPE {full_name} {kind}")
+                    lines.append(f"{full_name} {value}")
+            except Exception as e:
+                print(f"[Metrics] Collector failed: {e}")
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+# ===============================
+# Instrumentation helpers
+# ===============================
+def inc(name: str, amount: float = 1.0, help_text: str = "") -> None:
+    """
+    Increment a counter (no-op when metrics are disabled).
+    """
+    if ENABLED:
+        REGISTRY.counter(name, help_text).inc(amount)
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+@contextmanager
+def _stage_timer(stage: str) -> Iterator[None]:
+    histogram = REGISTRY.histogram(
+        f"{stage}_seconds", f"Time spent in {stage}"
+    )
+    in_flight = REGISTRY.gauge(
+        f"{stage}_in_flight", f"{stage} calls currently running"
+    )
+
+    in_flight.inc()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - started)
+        in_flight.dec()
+
+
+def timer(stage: str):
+    """
+    Context manager timing a stage into `<stage>_seconds`
+    and tracking `<stage>_in_flight`.
+    """
+    return _stage_timer(stage) if ENABLED else _NULL_TIMER
+
+
+def timed(stage: Optional[str] = None):
+    """
+    Decorator version of timer(); returns the function untouched
+    when metrics are disabled.
+    """
+
+    def decorate(fn: Callable) -> Callable:
+        if not ENABLED:
+            return fn
+
+        name = stage or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with _stage_timer(name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
@@ -0,0 +1,275 @@
+"""
+Synthetic resume / job-description corpus for benchmarks.
+
+PDFs are written by a tiny dependency-free PDF writer
+(Helvetica text only), so the corpus can be generated anywhere
+pdfplumber can read it back. DOCX, HTML and text variants of the
+same resumes are written with the stdlib only.
+"""
+
+import html
+import io
+import random
+import zipfile
+from typing import Callable, Dict, List, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from app.services.llm_explainer import MODELS, SKILLS
+
+FILLER_WORDS = (
+    "delivered designed built improved led migrated maintained "
+    "scalable reliable internal customer platform service pipeline "
+    "dashboard reporting team stakeholders quarterly metrics latency "
+    "throughput cost automation testing deployment monitoring"
+).split()
+
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella", "Hooli", "Stark"]
+ROLES = ["Software Engineer", "Data Scientist", "ML Engineer", "Developer"]
+
+LINES_PER_PAGE = 48
+CHARS_PER_LINE = 90
+
+
+# -------------------------------------------------
+# Minimal PDF writer
+# -------------------------------------------------
+def _escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: Sequence[Sequence[str]]) -> bytes:
+    """
+    Build a text-only PDF: one list of lines per page.
+    """
+
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in below
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_refs = []
+
+    for lines in pages:
+        content = "BT /F1 10 Tf 40 800 Td 14 TL " + " ".join(
+            f"({_escape(line)}) Tj T*" for line in lines
+        ) + " ET"
+
+        objects.append(
+            f"<< /Length {len(content)} >>\nstream\n{content}\nendstream"
+        )
+        content_ref = len(objects)
+
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842]"
+            f" /Contents {content_ref} 0 R"
+            " /Resources << /Font << /F1 3 0 R >> >> >>"
+        )
+        page_refs.append(f"{len(objects)} 0 R")
+
+    objects[1] = (
+        f"<< /Type /Pages /Kids [{' '.join(page_refs)}]"
+        f" /Count {len(page_refs)} >>"
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+
+    return bytes(out)
+
+
+# -------------------------------------------------
+# Other resume formats (same lines as the PDF)
+# -------------------------------------------------
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels"'
+    ' ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/officeDocument"'
+    ' Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def make_docx(pages: Sequence[Sequence[str]]) -> bytes:
+    """
+    Minimal WordprocessingML document: one paragraph per line,
+    a page break between pages.
+    """
+
+    body = []
+    for number, lines in enumerate(pages):
+        if number:
+            body.append('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+        body.extend(
+            f'<w:p><w:r><w:t xml:space="preserve">{escape(line)}</w:t></w:r></w:p>'
+            for line in lines
+        )
+
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+        'wordprocessingml/2006/main"><w:body>'
+        + "".join(body)
+        + '</w:body></w:document>'
+    )
+
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        docx.writestr("_rels/.rels", _DOCX_RELS)
+        docx.writestr("word/document.xml", document)
+
+    return out.getvalue()
+
+
+def make_html(pages: Sequence[Sequence[str]]) -> bytes:
+    paragraphs = "\n".join(
+        f"<p>{html.escape(line)}</p>" for lines in pages for line in lines
+    )
+    return (
+        "<!DOCTYPE html>\n<html><head><meta charset=\"utf-8\">"
+        "<title>Resume</title><style>p { margin: 0 }</style></head>\n"
+        f"<body>\n<div class=\"resume\">\n{paragraphs}\n</div>\n</body></html>\n"
+    ).encode("utf-8")
+
+
+def make_text(pages: Sequence[Sequence[str]]) -> bytes:
+    return "\n\f".join("\n".join(lines) for lines in pages).encode("utf-8")
+
+
+FORMAT_WRITERS: Dict[str, Tuple[str, Callable[[Sequence[Sequence[str]]], bytes]]] = {
+    "pdf": (".pdf", make_pdf),
+    "docx": (".docx", make_docx),
+    "html": (".html", make_html),
+    "text": (".txt", make_text),
+}
+
+
+# -------------------------------------------------
+# Text generators
+# -------------------------------------------------
+def _sentence(rng: random.Random, vocabulary: List[str], skill_density: float) -> str:
+    words = []
+    while len(" ".join(words)) < CHARS_PER_LINE - 12:
+        if rng.random() < skill_density:
+            words.append(rng.choice(vocabulary))
+        else:
+            words.append(rng.choice(FILLER_WORDS))
+    return " ".join(words)
+
+
+def resume_lines(
+    rng: random.Random,
+    pages: int = 1,
+    skill_density: float = 0.1
+) -> List[List[str]]:
+    """
+    Lines of a synthetic resume, split into pages.
+    skill_density = probability that a word is a dictionary skill.
+    """
+
+    vocabulary = sorted(SKILLS | MODELS)
+    years = rng.randint(0, 12)
+
+    header = [
+        f"Candidate {rng.randint(1000, 9999)}",
+        f"{rng.choice(ROLES)} with {years} years of experience",
+        "EXPERIENCE",
+        f"{rng.choice(ROLES)} at {rng.choice(COMPANIES)} company "
+        f"{2024 - years} - 2024",
+    ]
+
+    total_lines = pages * LINES_PER_PAGE
+    body = [
+        _sentence(rng, vocabulary, skill_density)
+        for _ in range(total_lines - len(header))
+    ]
+
+    lines = header + body
+    return [
+        lines[i:i + LINES_PER_PAGE]
+        for i in range(0, len(lines), LINES_PER_PAGE)
+    ]
+
+
+def job_description(rng: random.Random, n_skills: int = 8) -> str:
+    vocabulary = sorted(SKILLS | MODELS)
+    skills = rng.sample(vocabulary, min(n_skills, len(vocabulary)))
+    seniority = rng.choice(["", "Senior ", "Lead "])
+
+    return (
+        f"We are hiring a {seniority}{rng.choice(ROLES)}. "
+        f"Required: {', '.join(skills)}. "
+        f"{rng.randint(1, 6)}+ years of experience preferred."
+    )
+
+
+def build_corpus(
+    n_resumes: int,
+    pages: int = 1,
+    skill_density: float = 0.1,
+    n_jds: int = 3,
+    seed: int = 42
+) -> Tuple[List[Tuple[str, bytes]], List[str]]:
+    """
+    Returns ([(filename, pdf_bytes), ...], [job_description, ...]).
+    Deterministic for a given seed.
+    """
+
+    rng = random.Random(seed)
+
+    resumes = [
+        (
+            f"resume_{i:05d}.pdf",
+            make_pdf(resume_lines(rng, pages, skill_density))
+        )
+        for i in range(n_resumes)
+    ]
+    jds = [job_description(rng) for _ in range(n_jds)]
+
+    return resumes, jds
+
+
+def build_format_corpus(
+    n_resumes: int,
+    pages: int = 1,
+    skill_density: float = 0.1,
+    seed: int = 42
+) -> Dict[str, List[Tuple[str, bytes]]]:
+    """
+    The same resumes written in every format:
+    {"pdf": [(filename, bytes), ...], "docx": [...], ...}.
+    """
+
+    rng = random.Random(seed)
+    documents = [resume_lines(rng, pages, skill_density) for _ in range(n_resumes)]
+
+    return {
+        fmt: [
+            (f"resume_{i:05d}{suffix}", writer(lines))
+            for i, lines in enumerate(documents)
+        ]
+        for fmt, (suffix, writer) in FORMAT_WRITERS.items()
+    }
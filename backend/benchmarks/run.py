@@ -0,0 +1,340 @@
+"""
+Screening pipeline benchmark.
+
+Times each stage separately on a synthetic corpus and prints a
+machine-readable JSON report (throughput + p50/p95/p99 latency).
+
+Usage (from backend/):
+    python -m benchmarks.run --resumes 200 --pages 2 --output bench.json
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import platform
+import sys
+import time
+from typing import Callable, Dict, List, Sequence
+
+from fastapi import UploadFile
+
+from app.services.job_profile import compile_job_profile
+from app.services.llm_explainer import TERM_MATCHER, segment
+from app.services.pipeline import score_resume
+from app.services.resume_parser import extract_text_from_bytes
+from app.utils.file_handler import delete_file, save_upload_file
+from benchmarks.corpus import build_corpus, build_format_corpus
+
+
+# -------------------------------------------------
+# Stats helpers
+# -------------------------------------------------
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return 0.0
+
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: List[float], wall_seconds: float, items: int) -> Dict:
+    ordered = sorted(latencies)
+
+    return {
+        "items": items,
+        "wall_seconds": round(wall_seconds, 6),
+        "throughput_per_s": round(items / wall_seconds, 3) if wall_seconds else None,
+        "latency_ms": {
+            "mean": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+            "p50": round(percentile(ordered, 50) * 1000, 3),
+            "p95": round(percentile(ordered, 95) * 1000, 3),
+            "p99": round(percentile(ordered, 99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        },
+    }
+
+
+def time_each(fn: Callable, inputs: Sequence) -> Dict:
+    latencies = []
+    started = time.perf_counter()
+
+    for item in inputs:
+        t0 = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t0)
+
+    return summarize(latencies, time.perf_counter() - started, len(inputs))
+
+
+# -------------------------------------------------
+# Stages
+# -------------------------------------------------
+def bench_upload_save(resumes) -> Dict:
+    def run(item):
+        name, data = item
+        path = save_upload_file(UploadFile(file=io.BytesIO(data), filename=name))
+        delete_file(path)
+
+    return time_each(run, resumes)
+
+
+def bench_extraction(resumes) -> Dict:
+    return time_each(lambda item: extract_text_from_bytes(item[1]), resumes)
+
+
+def bench_format_extraction(corpus: Dict[str, List]) -> Dict:
+    """
+    Sniff + extract for the same resumes in every supported format.
+    """
+
+    report = {}
+    for fmt, documents in corpus.items():
+        stage = time_each(lambda item: extract_text_from_bytes(item[1]), documents)
+        stage["avg_bytes"] = int(
+            sum(len(d) for _, d in documents) / max(len(documents), 1)
+        )
+        stage["mb_per_s"] = (
+            round(
+                sum(len(d) for _, d in documents)
+                / stage["wall_seconds"] / (1024 * 1024), 3
+            )
+            if stage["wall_seconds"] else None
+        )
+        report[fmt] = stage
+
+    return report
+
+
+def bench_term_extraction(texts) -> Dict:
+    return time_each(TERM_MATCHER.find, texts)
+
+
+def bench_segmentation(texts) -> Dict:
+    """
+    Sections + dated experience + positioned skills, one record each.
+    """
+    return time_each(segment, texts)
+
+
+def bench_scoring(texts, jd: str) -> Dict:
+    profile = compile_job_profile(jd)
+    return time_each(
+        lambda text: score_resume("bench.pdf", text, jd, profile),
+        texts
+    )
+
+
+def bench_llm(
+    texts,
+    jd: str,
+    latency_ms: int,
+    batch_size: int,
+    concurrency: int
+) -> Dict:
+    """
+    LLM evaluation layer against the fake backend (fixed latency per
+    call): one-resume-per-call sequential vs batched + concurrent.
+    Caching is disabled so every resume needs an answer.
+    """
+
+    from app.services.llm_client import (
+        FakeLLMBackend,
+        LLMEvaluator,
+        LLMResponseCache,
+    )
+
+    profile = compile_job_profile(jd)
+
+    async def run(size: int, limit: int) -> Dict:
+        backend = FakeLLMBackend(latency_ms / 1000)
+        evaluator = LLMEvaluator(
+            backend,
+            max_concurrency=limit,
+            batch_size=size,
+            batch_wait=0.01,
+            cache=LLMResponseCache(0),
+        )
+        latencies = []
+
+        async def one(i: int, text: str) -> None:
+            t0 = time.perf_counter()
+            await evaluator.evaluate(profile, str(i), text)
+            latencies.append(time.perf_counter() - t0)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i, t) for i, t in enumerate(texts)))
+
+        report = summarize(latencies, time.perf_counter() - started, len(texts))
+        report["backend_calls"] = backend.calls
+        report["batch_size"] = size
+        report["concurrency"] = limit
+        return report
+
+    return {
+        "latency_ms": latency_ms,
+        "sequential": asyncio.run(run(1, 1)),
+        "batched": asyncio.run(run(batch_size, concurrency)),
+    }
+
+
+def bench_analyze(resumes, jd: str, batch_size: int, repeat: int) -> Dict:
+    """
+    Full POST /analyze through the ASGI app (no network).
+    One latency sample per request of `batch_size` resumes.
+    """
+
+    try:
+        import httpx
+    except ImportError:
+        return {"skipped": "httpx is not installed"}
+
+    from app.main import app
+    from app.services.pipeline import shutdown_executors
+
+    async def run() -> Dict:
+        latencies = []
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None
+        ) as client:
+            started = time.perf_counter()
+
+            for r in range(repeat):
+                batch = [
+                    resumes[(r * batch_size + i) % len(resumes)]
+                    for i in range(batch_size)
+                ]
+                files = [
+                    ("resumes", (name, data, "application/pdf"))
+                    for name, data in batch
+                ]
+
+                t0 = time.perf_counter()
+                response = await client.post(
+                    "/analyze",
+                    data={"job_description": jd},
+                    files=files
+                )
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - t0)
+
+            wall = time.perf_counter() - started
+
+        report = summarize(latencies, wall, repeat)
+        report["batch_size"] = batch_size
+        report["resumes_per_s"] = (
+            round(repeat * batch_size / wall, 3) if wall else None
+        )
+        return report
+
+    try:
+        return asyncio.run(run())
+    finally:
+        shutdown_executors()
+
+
+# -------------------------------------------------
+# Entry point
+# -------------------------------------------------
+def main(argv=None) -> Dict:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--pages", type=int, default=1)
+    parser.add_argument("--skill-density", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--analyze-batch", type=int, default=20)
+    parser.add_argument("--analyze-repeat", type=int, default=5)
+    parser.add_argument("--llm-resumes", type=int, default=50)
+    parser.add_argument("--llm-latency-ms", type=int, default=200)
+    parser.add_argument("--llm-batch", type=int, default=5)
+    parser.add_argument("--llm-concurrency", type=int, default=4)
+    parser.add_argument(
+        "--skip",
+        nargs="*",
+        default=[],
+        choices=["upload_save", "pdf_extraction", "format_extraction",
+                 "term_extraction", "segmentation", "scoring", "llm",
+                 "analyze"],
+    )
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    resumes, jds = build_corpus(
+        args.resumes, args.pages, args.skill_density, seed=args.seed
+    )
+    jd = jds[0]
+
+    # text for the downstream stages is extracted once, outside any timing
+    texts = [extract_text_from_bytes(data) or "" for _, data in resumes]
+
+    stages = {}
+    if "upload_save" not in args.skip:
+        stages["upload_save"] = bench_upload_save(resumes)
+    if "pdf_extraction" not in args.skip:
+        stages["pdf_extraction"] = bench_extraction(resumes)
+    if "format_extraction" not in args.skip:
+        stages["format_extraction"] = bench_format_extraction(
+            build_format_corpus(
+                args.resumes, args.pages, args.skill_density, seed=args.seed
+            )
+        )
+    if "term_extraction" not in args.skip:
+        stages["term_extraction"] = bench_term_extraction(texts)
+    if "segmentation" not in args.skip:
+        stages["segmentation"] = bench_segmentation(texts)
+    if "scoring" not in args.skip:
+        stages["scoring"] = bench_scoring(texts, jd)
+    if "llm" not in args.skip:
+        stages["llm"] = bench_llm(
+            texts[:args.llm_resumes],
+            jd,
+            args.llm_latency_ms,
+            args.llm_batch,
+            args.llm_concurrency,
+        )
+    if "analyze" not in args.skip:
+        stages["analyze"] = bench_analyze(
+            resumes, jd, args.analyze_batch, args.analyze_repeat
+        )
+
+    report = {
+        "benchmark": "screening_pipeline",
+        "timestamp": time.time(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "corpus": {
+            "resumes": args.resumes,
+            "pages": args.pages,
+            "skill_density": args.skill_density,
+            "seed": args.seed,
+            "avg_pdf_bytes": int(
+                sum(len(d) for _, d in resumes) / max(len(resumes), 1)
+            ),
+            "avg_text_chars": int(
+                sum(len(t) for t in texts) / max(len(texts), 1)
+            ),
+        },
+        "stages": stages,
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
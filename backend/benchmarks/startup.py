@@ -0,0 +1,182 @@
+"""
+Cold-start benchmark.
+
+Starts fresh interpreters and measures, for warm-up on and off:
+app import time, lifespan startup, time until /ready, and the latency
+of the first and second POST /analyze. Prints a JSON report.
+
+numpy_import_seconds is what `import numpy` still costs right after
+the app import: the time the app no longer spends importing it
+(0 if the app imported it itself).
+
+Usage (from backend/):
+    python -m benchmarks.startup --runs 3 --output startup.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+FIELDS = (
+    "process_seconds",
+    "import_seconds",
+    "numpy_import_seconds",
+    "startup_seconds",
+    "ready_seconds",
+    "first_request_ms",
+    "second_request_ms",
+)
+
+
+# -------------------------------------------------
+# Child (one fresh interpreter per sample)
+# -------------------------------------------------
+def child(pages: int) -> Dict:
+    t0 = time.perf_counter()
+
+    from app.main import app
+    from app.services import warmup
+    from app.services.pipeline import shutdown_executors
+
+    imported = time.perf_counter()
+
+    import numpy  # noqa: F401
+
+    numpy_imported = time.perf_counter()
+
+    import httpx
+
+    from benchmarks.corpus import build_corpus
+
+    resumes, jds = build_corpus(2, pages)
+
+    async def post(client, name: str, data: bytes) -> float:
+        started = time.perf_counter()
+        response = await client.post(
+            "/analyze",
+            data={"job_description": jds[0]},
+            files=[("resumes", (name, data, "application/pdf"))]
+        )
+        response.raise_for_status()
+        return (time.perf_counter() - started) * 1000
+
+    async def run() -> Dict:
+        t1 = time.perf_counter()
+
+        async with app.router.lifespan_context(app):
+            started = time.perf_counter()
+
+            while not warmup.STATE.ready:
+                await asyncio.sleep(0.005)
+            ready = time.perf_counter()
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://bench", timeout=None
+            ) as client:
+                # different bytes each time so the text cache never hits
+                first = await post(client, *resumes[0])
+                second = await post(client, *resumes[1])
+
+        return {
+            "import_seconds": imported - t0,
+            "numpy_import_seconds": numpy_imported - imported,
+            "startup_seconds": started - t1,
+            "ready_seconds": ready - t1,
+            "first_request_ms": first,
+            "second_request_ms": second,
+            "warmup_steps": warmup.STATE.snapshot()["steps"],
+        }
+
+    try:
+        return asyncio.run(run())
+    finally:
+        shutdown_executors()
+
+
+# -------------------------------------------------
+# Parent
+# -------------------------------------------------
+def sample(warm: bool, pages: int) -> Dict:
+    env = dict(
+        os.environ,
+        WARMUP_ON_STARTUP="true" if warm else "false",
+        TEXT_CACHE_DIR="",
+    )
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.startup",
+         "--child", "--pages", str(pages)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - started
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["process_seconds"] = elapsed
+    return result
+
+
+def aggregate(samples: List[Dict]) -> Dict:
+    report = {
+        field: round(statistics.median(s[field] for s in samples), 6)
+        for field in FIELDS
+    }
+    report["runs"] = len(samples)
+    report["warmup_steps"] = samples[-1].get("warmup_steps", {})
+    return report
+
+
+def main(argv=None) -> Dict:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=1)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help="Write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    if args.child:
+        # the app prints progress; the result is always the last line
+        result = child(args.pages)
+        sys.stdout.write(json.dumps(result) + "\n")
+        return result
+
+    report = {
+        "benchmark": "startup",
+        "timestamp": time.time(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "pages": args.pages,
+        "modes": {
+            mode: aggregate([
+                sample(mode == "warmup", args.pages) for _ in range(args.runs)
+            ])
+            for mode in ("lazy", "warmup")
+        },
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+    return report
+
+
+if __name__ == "__main__":
+    main()
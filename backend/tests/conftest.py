@@ -0,0 +1,16 @@
+import os
+import sys
+import tempfile
+
+# run from backend/: `python -m pytest tests`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# keep test stores out of data/ and skip network backends; set before
+# app.config is imported (get_settings() is cached)
+_DATA = tempfile.mkdtemp(prefix="resume-screener-tests-")
+os.environ.setdefault("CANDIDATE_STORE_DIR", os.path.join(_DATA, "candidates"))
+os.environ.setdefault("JOB_STORE_DIR", os.path.join(_DATA, "jobs"))
+os.environ.setdefault("RESULT_STORE_DIR", os.path.join(_DATA, "results"))
+os.environ.setdefault("WARMUP_ON_STARTUP", "false")
+os.environ.setdefault("LLM_BACKEND", "none")
+os.environ.setdefault("EMBEDDING_BACKEND", "local")
@@ -0,0 +1,191 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.admission import (
+    AdmissionController,
+    AdmissionMiddleware,
+    AdmissionRejected,
+)
+
+
+def controller(**overrides) -> AdmissionController:
+    options = dict(
+        capacity=100,
+        tenant_max_active=2,
+        tenant_max_waiting=4,
+        max_waiting=16,
+        queue_timeout=5.0,
+    )
+    options.update(overrides)
+    return AdmissionController(**options)
+
+
+# ---------- controller ----------
+def test_waiting_tenants_are_admitted_round_robin():
+    async def scenario():
+        admission = controller(capacity=100, tenant_max_active=10)
+        order = []
+
+        async def request(tenant, n):
+            await admission.acquire(tenant, 50)
+            order.append(f"{tenant}{n}")
+
+        # A fills the budget, then queues a burst; B and C arrive later
+        await admission.acquire("A", 50)
+        await admission.acquire("A", 50)
+        waiters = [asyncio.create_task(request("A", n)) for n in range(3)]
+        await asyncio.sleep(0)
+        waiters += [asyncio.create_task(request(t, 0)) for t in "BC"]
+        await asyncio.sleep(0)
+
+        for _ in range(5):
+            admission.release("A", 50)
+            await asyncio.sleep(0)
+        await asyncio.gather(*waiters)
+        return order
+
+    # the burst does not run ahead of the other tenants
+    assert asyncio.run(scenario()) == ["A0", "B0", "C0", "A1", "A2"]
+
+
+def test_tenant_over_its_queue_gets_429_with_retry_after():
+    async def scenario():
+        admission = controller(tenant_max_active=1, tenant_max_waiting=1)
+        await admission.acquire("A", 10)
+        queued = asyncio.create_task(admission.acquire("A", 10))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await admission.acquire("A", 10)
+
+        # another tenant is not affected
+        await admission.acquire("B", 10)
+
+        admission.release("A", 10)
+        await queued
+        return rejected.value
+
+    error = asyncio.run(scenario())
+    assert error.status_code == 429
+    assert error.retry_after >= 1
+
+
+def test_queue_timeout_gives_503_and_frees_the_slot():
+    async def scenario():
+        admission = controller(capacity=10, queue_timeout=0.05)
+        await admission.acquire("A", 10)
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await admission.acquire("B", 10)
+
+        admission.release("A", 10)
+        return rejected.value, admission.stats()
+
+    error, stats = asyncio.run(scenario())
+    assert error.status_code == 503
+    assert error.retry_after >= 1
+    assert stats["in_use_bytes"] == 0
+    assert stats["waiting"] == 0
+
+
+def test_full_global_queue_gives_503():
+    async def scenario():
+        admission = controller(capacity=10, max_waiting=1)
+        await admission.acquire("A", 10)
+        queued = asyncio.create_task(admission.acquire("B", 10))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected) as rejected:
+            await admission.acquire("C", 10)
+
+        queued.cancel()
+        return rejected.value
+
+    assert asyncio.run(scenario()).status_code == 503
+
+
+# ---------- middleware ----------
+async def slow_app(scope, receive, send):
+    while (await receive()).get("more_body"):
+        pass
+    await asyncio.sleep(0.2)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def middleware(admission: AdmissionController) -> AdmissionMiddleware:
+    app = AdmissionMiddleware(slow_app, admission)
+    app.paths = ("/analyze", "/jobs")
+    app.request_bytes = 1000
+    app.job_bytes = 10_000
+    return app
+
+
+async def post_all(app, requests):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        return await asyncio.gather(*(
+            client.post(path, content=body, headers=headers)
+            for path, body, headers in requests
+        ))
+
+
+def test_spoofed_api_keys_share_the_client_limit():
+    admission = controller(tenant_max_active=1, tenant_max_waiting=0)
+    app = middleware(admission)
+
+    responses = asyncio.run(post_all(app, [
+        ("/analyze", b"x", {"x-api-key": f"key-{n}"}) for n in range(3)
+    ]))
+
+    statuses = sorted(r.status_code for r in responses)
+    assert statuses == [200, 429, 429]
+    assert all(
+        r.headers["retry-after"].isdigit()
+        for r in responses if r.status_code == 429
+    )
+
+
+def test_configured_api_keys_are_separate_clients():
+    admission = controller(tenant_max_active=1, tenant_max_waiting=0)
+    app = middleware(admission)
+    app.api_keys = frozenset({b"team-a", b"team-b"})
+
+    responses = asyncio.run(post_all(app, [
+        ("/analyze", b"x", {"x-api-key": key}) for key in ("team-a", "team-b")
+    ]))
+
+    assert [r.status_code for r in responses] == [200, 200]
+
+
+def test_body_limits_per_path():
+    app = middleware(controller(capacity=100_000))
+
+    analyze_big, jobs_ok, jobs_big = asyncio.run(post_all(app, [
+        ("/analyze", b"x" * 2000, {}),
+        ("/jobs", b"x" * 2000, {}),
+        ("/jobs", b"x" * 20_000, {}),
+    ]))
+
+    assert analyze_big.status_code == 413
+    assert jobs_ok.status_code == 200
+    assert jobs_big.status_code == 413
+
+
+def test_chunked_body_is_cut_off_at_the_limit():
+    app = middleware(controller())
+
+    async def body():
+        for _ in range(10):
+            yield b"x" * 500
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+            return await client.post("/analyze", content=body())
+
+    response = asyncio.run(scenario())
+    assert response.status_code == 413
+    assert response.json() == {"detail": "Request body exceeds 0 MB"}
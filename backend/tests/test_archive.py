@@ -0,0 +1,108 @@
+import io
+import os
+import zipfile
+
+import pytest
+from fastapi import UploadFile
+
+from app.services import resume_parser
+from app.services.archive import ArchiveError, ArchiveLimits, ResumeArchive
+from app.utils.file_handler import save_upload_file
+
+RESUME = b"Jane Doe\nExperience\nBuilt FastAPI services in Python\n"
+LIMITS = ArchiveLimits(
+    max_entries=10,
+    max_entry_bytes=1024 * 1024,
+    max_total_bytes=4 * 1024 * 1024,
+    max_ratio=100,
+)
+
+
+def make_zip(entries, compression=zipfile.ZIP_DEFLATED):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as archive:
+        for name, data in entries:
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def open_archive(data, limits=LIMITS):
+    return ResumeArchive(UploadFile(io.BytesIO(data), filename="cv.zip"), limits)
+
+
+def test_valid_archive_yields_its_members():
+    data = make_zip([
+        ("a.txt", RESUME),
+        ("nested/b.txt", RESUME.replace(b"Jane", b"John")),
+        ("__MACOSX/._a.txt", b"\0\1"),
+        (".hidden.txt", RESUME),
+    ])
+
+    archive = open_archive(data)
+    uploads = list(archive.uploads())
+
+    assert [u.filename for u in uploads] == ["a.txt", "nested/b.txt"]
+    assert uploads[0].file.read() == RESUME
+    assert archive.summary()["skipped"] == [
+        {"name": ".hidden.txt", "reason": "hidden file"}
+    ]
+
+
+def test_high_compression_ratio_entry_is_skipped_before_decompression():
+    bomb = b"\0" * (512 * 1024)         # deflates ~1000:1
+    archive = open_archive(make_zip([("bomb.txt", bomb), ("a.txt", RESUME)]))
+
+    assert [info.filename for info in archive.entries] == ["a.txt"]
+    assert archive.skipped[0].reason == "compression ratio too high"
+
+
+def test_total_uncompressed_size_is_capped():
+    limits = LIMITS._replace(max_total_bytes=2 * len(RESUME))
+    data = make_zip(
+        [(f"{i}.txt", RESUME) for i in range(3)], zipfile.ZIP_STORED
+    )
+
+    with pytest.raises(ArchiveError) as error:
+        open_archive(data, limits)
+    assert error.value.status_code == 413
+
+
+def test_entry_count_is_capped():
+    data = make_zip([(f"{i}.txt", RESUME) for i in range(LIMITS.max_entries + 1)])
+
+    with pytest.raises(ArchiveError) as error:
+        open_archive(data)
+    assert error.value.status_code == 413
+
+
+def test_nested_archive_is_not_expanded():
+    inner = make_zip([("inner.txt", RESUME)])
+    archive = open_archive(make_zip([("inner.zip", inner)], zipfile.ZIP_STORED))
+
+    [upload] = archive.uploads()
+    assert upload.filename == "inner.zip"
+
+    # a ZIP that is not a Word document is no resume format:
+    # it is refused, never opened as another archive
+    assert resume_parser.ingest_upload(upload) == resume_parser.IngestedUpload()
+
+
+def test_path_traversal_names_never_leave_the_upload_directory(tmp_path):
+    data = make_zip([("../../evil.txt", RESUME), ("/abs/evil2.txt", RESUME)])
+    directory = tmp_path / "uploads"
+
+    for upload in open_archive(data).uploads():
+        path = save_upload_file(upload, directory=str(directory))
+        assert path is not None
+        assert os.path.dirname(os.path.abspath(path)) == str(directory)
+
+    assert sorted(p.name.split("_", 1)[1] for p in directory.iterdir()) == [
+        "evil.txt", "evil2.txt"
+    ]
+    assert not (tmp_path.parent / "evil.txt").exists()
+
+
+def test_non_zip_upload_is_refused():
+    with pytest.raises(ArchiveError) as error:
+        open_archive(RESUME)
+    assert error.value.status_code == 422
@@ -0,0 +1,103 @@
+import csv
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services import batch_runner
+from app.services.batch_runner import (
+    JobDescription,
+    expand_inputs,
+    run_batch,
+    screen_file,
+)
+from app.services.scoring_engine import default_weights
+
+JOBS = (
+    JobDescription("backend", "Backend engineer: Python, FastAPI, Docker"),
+    JobDescription("data", "Data scientist: pandas, machine learning"),
+)
+
+
+@pytest.fixture
+def resumes(tmp_path, monkeypatch):
+    # threads instead of spawned processes keep the test fast
+    monkeypatch.setattr(
+        batch_runner, "new_process_pool",
+        lambda workers: ThreadPoolExecutor(max_workers=workers)
+    )
+
+    directory = tmp_path / "resumes"
+    directory.mkdir()
+    for i in range(7):
+        (directory / f"r{i}.txt").write_text(
+            f"Candidate {i}\nSkills: Python, Docker, pandas\n{i} years at Acme"
+        )
+    return directory
+
+
+def read_rows(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.DictReader(f))
+
+
+def test_interrupted_run_resumes_without_repeats_or_gaps(resumes):
+    output = str(resumes / "results.csv")      # inside the input directory
+    calls = []
+
+    def interrupt_after_first_flush(done, total):
+        calls.append(done)
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        run_batch(
+            [str(resumes)], JOBS, output, default_weights(),
+            workers=1, flush_every=3, progress=interrupt_after_first_flush
+        )
+
+    [committed] = calls
+    first = read_rows(output)
+    assert 3 <= committed < 7 and len(first) == committed * len(JOBS)
+
+    summary = run_batch(
+        [str(resumes)], JOBS, output, default_weights(),
+        workers=1, flush_every=3
+    )
+
+    rows = read_rows(output)
+    pairs = [(row["candidate_name"], row["job"]) for row in rows]
+    expected = {(f"r{i}.txt", job.name) for i in range(7) for job in JOBS}
+
+    assert summary.skipped == committed
+    assert summary.screened == 7 - committed
+    assert len(pairs) == len(set(pairs)) and set(pairs) == expected
+    assert rows[:len(first)] == first
+
+
+def test_output_and_checkpoint_are_not_inputs(resumes):
+    output = resumes / "results.csv"
+    for name in ("results.csv", "results.csv.checkpoint",
+                 "results.csv.checkpoint-wal"):
+        (resumes / name).write_text("job,candidate_name\n")
+    (resumes / "out.parquet").mkdir()
+    (resumes / "out.parquet" / "part-00000.parquet").write_text("x")
+
+    paths = expand_inputs(
+        [str(resumes)],
+        exclude=[str(output), str(output) + ".checkpoint",
+                 str(output) + ".checkpoint-wal", str(resumes / "out.parquet")]
+    )
+
+    assert [p.rsplit("/", 1)[1] for p in paths] == [
+        f"r{i}.txt" for i in range(7)
+    ]
+
+
+def test_files_over_the_size_limit_are_unreadable(resumes, monkeypatch):
+    monkeypatch.setattr(batch_runner, "max_upload_bytes", lambda: 16)
+
+    [row] = screen_file(
+        str(resumes / "r1.txt"), "r1.txt", JOBS[:1], default_weights()
+    )
+
+    assert row["final_score"] == 0
+    assert row["explanation"] == batch_runner.UNREADABLE_EXPLANATION
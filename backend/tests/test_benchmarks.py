@@ -0,0 +1,48 @@
+import json
+
+from app.services.pdf_engine import count_pages
+from app.services.resume_parser import extract_text_from_bytes
+from benchmarks import run
+from benchmarks.corpus import build_corpus
+
+
+def test_corpus_is_deterministic_and_has_the_requested_shape():
+    resumes, jds = build_corpus(3, pages=2, skill_density=0.5, seed=7)
+
+    assert [name for name, _ in resumes] == [
+        "resume_00000.pdf", "resume_00001.pdf", "resume_00002.pdf"
+    ]
+    assert len(jds) == 3
+    assert build_corpus(3, pages=2, skill_density=0.5, seed=7) == (resumes, jds)
+
+    _, data = resumes[0]
+    assert count_pages(data) == 2
+    text = extract_text_from_bytes(data)
+    assert "EXPERIENCE" in text
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+
+    assert run.percentile(values, 50) == 50.0
+    assert run.percentile(values, 99) == 99.0
+    assert run.percentile([], 95) == 0.0
+
+
+def test_report_is_json_with_latency_percentiles(tmp_path):
+    output = tmp_path / "bench.json"
+    report = run.main([
+        "--resumes", "2",
+        "--skip", "upload_save", "format_extraction", "segmentation",
+        "llm", "analyze",
+        "--output", str(output),
+    ])
+
+    assert json.loads(output.read_text()) == json.loads(json.dumps(report))
+    assert report["corpus"]["resumes"] == 2
+    assert set(report["stages"]) == {
+        "pdf_extraction", "term_extraction", "scoring"
+    }
+    for stage in report["stages"].values():
+        assert stage["items"] == 2
+        assert {"p50", "p95", "p99"} <= set(stage["latency_ms"])
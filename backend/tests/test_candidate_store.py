@@ -0,0 +1,96 @@
+import numpy as np
+
+from app.services import candidate_store
+from app.services.candidate_store import CandidateStore
+
+TEXTS = [
+    "Python developer, Django and SQL, 4 years of experience at Acme",
+    "Java engineer building Spring services and Kafka pipelines",
+    "Data scientist: machine learning, pandas and TensorFlow models",
+]
+
+
+def fake_embeddings(dim):
+    def embed(texts):
+        # one deterministic direction per text
+        return np.stack([
+            np.roll(np.eye(dim, dtype=np.float32)[0], len(text) % dim)
+            for text in texts
+        ]) if texts else np.zeros((0, dim), dtype=np.float32)
+    return embed
+
+
+def test_embedding_size_change_rebuilds_the_vector_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(candidate_store, "get_embeddings", fake_embeddings(4))
+    store = CandidateStore(str(tmp_path))
+    store.add_many([("a", "h0", TEXTS[0]), ("b", "h1", TEXTS[1])])
+    assert store._dim == 4
+
+    monkeypatch.setattr(candidate_store, "get_embeddings", fake_embeddings(16))
+    assert store.add_many([("c", "h2", TEXTS[2])])["added"] == 1
+
+    # every row, old ones included, now has a vector of the new size
+    assert store._dim == 16 and store._vectors.shape[1] == 16
+    assert np.allclose(np.linalg.norm(store._vectors[:3], axis=1), 1)
+
+    reopened = CandidateStore(str(tmp_path))
+    assert reopened._dim == 16
+    results = reopened.search(TEXTS[0], top_k=3, min_skill_overlap=0)
+    assert [r["candidate_name"] for r in results][0] == "a"
+    assert results[0]["similarity"] == 100
+
+
+def test_search_many_matches_brute_force_cosine(tmp_path, monkeypatch):
+    rng = np.random.default_rng(0)
+    texts = [f"{TEXTS[i % 3]} candidate {i}" for i in range(40)]
+    jds = ["Python and SQL backend role", "Machine learning with pandas"]
+    table = {t: rng.normal(size=8).astype(np.float32) for t in texts + jds}
+    monkeypatch.setattr(
+        candidate_store, "get_embeddings",
+        lambda batch: np.stack([table[t] for t in batch])
+    )
+
+    store = CandidateStore(str(tmp_path), max_distance=0)
+    store.add_many([(f"c{i}", f"h{i}", t) for i, t in enumerate(texts)])
+    assert len(store) == len(texts)
+
+    batched = store.search_many(jds, top_k=5, min_skill_overlap=0)
+    assert len(batched) == len(jds)
+
+    pool = np.stack([table[t] for t in texts])
+    pool /= np.linalg.norm(pool, axis=1, keepdims=True)
+    for jd, results in zip(jds, batched):
+        query = table[jd] / np.linalg.norm(table[jd])
+        expected = np.argsort(-(pool @ query), kind="stable")[:5]
+        assert [r["candidate_id"] for r in results] == expected.tolist()
+        assert results == store.search(jd, top_k=5, min_skill_overlap=0)
+
+    assert store.search_many([], top_k=5) == []
+
+
+def test_writers_sharing_a_directory_get_distinct_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr(candidate_store, "get_embeddings", fake_embeddings(8))
+    first = CandidateStore(str(tmp_path))
+    second = CandidateStore(str(tmp_path))     # e.g. another worker process
+
+    first.add_many([("a", "h0", TEXTS[0])])
+    counts = second.add_many([("b", "h1", TEXTS[1]), ("a", "h0", TEXTS[0])])
+
+    assert counts == {"added": 1, "duplicates": 1, "near_duplicates": 0}
+    assert len(second) == 2
+    results = second.search(TEXTS[1], top_k=5, min_skill_overlap=0)
+    assert sorted(r["candidate_name"] for r in results) == ["a", "b"]
+    assert sorted(r["candidate_id"] for r in results) == [0, 1]
+
+
+def test_embeddings_are_computed_outside_the_lock(tmp_path, monkeypatch):
+    store = CandidateStore(str(tmp_path))
+    embed = fake_embeddings(4)
+
+    def unlocked(texts):
+        assert not store._lock.locked()
+        return embed(texts)
+
+    monkeypatch.setattr(candidate_store, "get_embeddings", unlocked)
+    store.add_many([("a", "h0", TEXTS[0]), ("b", "h1", TEXTS[1])])
+    assert store.search(TEXTS[0], top_k=1, min_skill_overlap=0)
@@ -0,0 +1,81 @@
+import asyncio
+import io
+
+from starlette.datastructures import UploadFile
+
+from app.services.dedup import BatchDeduplicator, hamming, simhash
+from app.services.pipeline import analyze_batch, shutdown_executors
+
+JD = "Backend developer: Python, FastAPI, Docker. 2+ years experience."
+
+RESUME = "\n".join([
+    "Jane Doe",
+    "Experience",
+    "Acme Corp  Jan 2019 - Dec 2023",
+    "Built FastAPI services in Python, deployed with Docker on AWS.",
+    "Led the migration of billing jobs to a queue based design.",
+    "Cut report generation time from hours to minutes with caching.",
+    "Mentored two junior engineers and ran the weekly design review.",
+    "Globex Ltd  Jun 2016 - Dec 2018",
+    "Maintained internal REST APIs and the deployment pipeline.",
+    "Introduced integration tests and container based local setups.",
+    "Worked with product owners on quarterly planning and estimates.",
+    "Projects",
+    "Open source contributor to a task queue library for Python.",
+    "Built a personal budgeting app with a small web dashboard.",
+    "Education",
+    "BSc Computer Science, University of Leeds",
+])
+OTHER = "\n".join([
+    "John Roe",
+    "Experience",
+    "Globex  2015 - 2018",
+    "Java developer maintaining payroll software on Oracle.",
+    "Wrote reporting tools and supported finance users.",
+])
+
+
+def upload(name: str, text: str) -> UploadFile:
+    data = text.encode("utf-8")
+    return UploadFile(io.BytesIO(data), size=len(data), filename=name)
+
+
+# re-export: same words, different bytes (line wrapping, case)
+REEXPORT = RESUME.replace("\n", "  \n").replace("Jane Doe", "JANE DOE")
+
+
+def test_simhash_separates_reexports_from_different_resumes():
+    assert hamming(simhash(RESUME), simhash(REEXPORT)) == 0
+    assert hamming(simhash(RESUME), simhash(OTHER)) > 3
+
+
+def test_copies_reuse_the_leader_result():
+    uploads = [
+        upload("jane.txt", RESUME),
+        upload("other.txt", OTHER),
+        upload("jane-copy.txt", RESUME),
+        upload("jane-reexport.txt", REEXPORT),
+    ]
+    dedup = BatchDeduplicator(max_distance=3)
+
+    try:
+        results, features = asyncio.run(
+            analyze_batch(JD, uploads, dedup=dedup)
+        )
+    finally:
+        shutdown_executors()
+
+    jane, other, copy, reexport = results
+    assert jane.duplicate_of is None and other.duplicate_of is None
+    assert copy.duplicate_of == "jane.txt"
+    assert reexport.duplicate_of == "jane.txt"
+    assert copy.final_score == reexport.final_score == jane.final_score
+    assert features[2] is features[0]
+
+    assert dedup.groups() == [{
+        "candidate_name": "jane.txt",
+        "duplicates": [
+            {"candidate_name": "jane-copy.txt", "match": "exact"},
+            {"candidate_name": "jane-reexport.txt", "match": "near"},
+        ],
+    }]
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from app.services import embedding_service
+from app.services.embedding_backends import (
+    EmbeddingBackend,
+    LocalHashingBackend,
+    _import_hashing_vectorizer,
+)
+from app.services.embedding_service import (
+    EmbeddingCache,
+    get_embeddings,
+    resume_jd_similarity_score,
+)
+
+JD = "Backend developer with Python, FastAPI and Docker experience"
+
+
+class CountingBackend(EmbeddingBackend):
+    name = "counting"
+
+    def __init__(self):
+        self.calls = []
+
+    def embed(self, texts):
+        self.calls.append(list(texts))
+        return np.asarray(
+            [[len(text), 1.0, 0.0] for text in texts], dtype=np.float32
+        )
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    backend = CountingBackend()
+    monkeypatch.setattr(embedding_service, "_cache", EmbeddingCache(100))
+    monkeypatch.setattr(
+        embedding_service, "get_embedding_backend", lambda: backend
+    )
+    return backend
+
+
+def test_batch_embeds_misses_once_and_zero_fills_empty_texts(backend):
+    matrix = get_embeddings(["a", "", "bb", "a"])
+
+    assert matrix.shape == (4, 3)
+    assert matrix.dtype == np.float32
+    assert backend.calls == [["a", "bb"]]
+    assert not matrix[1].any()
+    assert (matrix[0] == matrix[3]).all()
+
+
+def test_job_description_is_embedded_once_across_resumes(backend):
+    for resume in ("python dev", "java dev", "go dev"):
+        resume_jd_similarity_score(resume, JD)
+
+    embedded = [text for call in backend.calls for text in call]
+    assert embedded.count(JD) == 1
+    assert embedding_service.embedding_cache_stats()["hits"] == 2
+
+
+def test_cache_evicts_least_recently_used():
+    cache = EmbeddingCache(2)
+    cache.put(("b", "x"), np.ones(1))
+    cache.put(("b", "y"), np.ones(1))
+    cache.get(("b", "x"))
+    cache.put(("b", "z"), np.ones(1))
+
+    assert cache.get(("b", "y")) is None
+    assert cache.get(("b", "x")) is not None
+    assert cache.stats() == {"entries": 2, "hits": 2, "misses": 1}
+
+
+def test_local_backend_ranks_related_text_higher(monkeypatch):
+    local = LocalHashingBackend(_import_hashing_vectorizer())
+    monkeypatch.setattr(embedding_service, "_cache", EmbeddingCache(100))
+    monkeypatch.setattr(
+        embedding_service, "get_embedding_backend", lambda: local
+    )
+
+    related = resume_jd_similarity_score(
+        "Python developer, built FastAPI services shipped in Docker", JD
+    )
+    unrelated = resume_jd_similarity_score(
+        "Pastry chef, croissants and sourdough bread", JD
+    )
+
+    assert 0 < related <= 100
+    assert unrelated < related
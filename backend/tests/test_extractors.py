@@ -0,0 +1,97 @@
+import io
+import time
+import zipfile
+
+import pytest
+from fastapi import UploadFile
+
+from benchmarks.corpus import FORMAT_WRITERS
+from app.services import resume_parser
+from app.services.extractors import HEAD_BYTES, extract_document, sniff_format
+from app.services.text_cache import hash_bytes
+from app.utils import file_handler
+from app.utils.file_handler import is_supported_document
+
+LINES = [["Jane Doe", "Experience", "Built FastAPI services in Python"]]
+
+
+@pytest.mark.parametrize("fmt", sorted(FORMAT_WRITERS))
+def test_every_format_is_sniffed_and_extracted(fmt):
+    _, write = FORMAT_WRITERS[fmt]
+    data = write(LINES)
+
+    assert sniff_format(data[:HEAD_BYTES]).name == fmt
+    text = extract_document(data).text
+    assert "Built FastAPI services in Python" in text
+
+
+def test_zip_that_is_not_a_word_document_is_refused():
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("notes/readme.md", "not a resume")
+
+    assert not is_supported_document(buffer.getvalue()[:HEAD_BYTES])
+
+
+def test_html_hidden_elements_and_comments_are_dropped():
+    markup = (
+        b"<html><head><title>CV</title><style>p { color: red }</style></head>"
+        b"<body><h1>Jane</h1><!-- internal note -->"
+        b"<script>var s = '<p>secret</p>';</script>"
+        b"<p>Python &amp; Docker</p></body></html>"
+    )
+
+    assert extract_document(markup).text == "Jane\nPython & Docker"
+
+
+@pytest.mark.parametrize("payload", [
+    b"<script>x " * 50_000,         # unclosed elements
+    b"</script" * 50_000,
+    b"<p " * 100_000,               # unterminated tags
+    b"<!--" * 100_000,
+])
+def test_html_stripping_is_linear_on_hostile_markup(payload):
+    started = time.perf_counter()
+    extract_document(b"<html><body>" + payload)
+
+    # the previous backtracking regexes took minutes on these
+    assert time.perf_counter() - started < 2
+
+
+def test_disk_ingest_checks_size_and_type_before_the_cache(monkeypatch):
+    cached = {hash_bytes(data): "cached text" for data in (b"x" * 64, b"\0\1\2")}
+    monkeypatch.setattr(resume_parser, "get_text_cache", lambda: cached)
+    monkeypatch.setattr(resume_parser, "should_spool_to_disk", lambda _: True)
+    monkeypatch.setattr(file_handler, "max_upload_bytes", lambda: 32)
+
+    def ingest(data):
+        upload = UploadFile(io.BytesIO(data), filename="cv.txt")
+        return resume_parser.ingest_upload(upload)
+
+    assert ingest(b"x" * 64) == resume_parser.IngestedUpload()     # too large
+    assert ingest(b"\0\1\2") == resume_parser.IngestedUpload()     # not a resume
+
+    cached[hash_bytes(b"x" * 16)] = "cached text"
+    assert ingest(b"x" * 16).cached_text == "cached text"
+
+
+def test_every_ingest_path_sniffs_only_the_head(tmp_path):
+    # clean text head, binary noise further into the first chunk
+    data = b"Jane Doe, Python developer\n" * 200 + b"\0" * 64
+    assert len(data) > HEAD_BYTES and b"\0" not in data[:HEAD_BYTES]
+
+    def upload():
+        return UploadFile(io.BytesIO(data), filename="cv.txt")
+
+    assert file_handler.check_upload(upload())
+
+    buffer = file_handler.read_upload_bytes(upload())
+    assert isinstance(buffer, bytearray) and buffer == data
+
+    path = file_handler.save_upload_file(upload(), directory=str(tmp_path))
+    assert path is not None
+    with open(path, "rb") as f:
+        assert f.read() == data
+
+    text = extract_document(buffer).text
+    assert text.startswith("Jane Doe, Python developer")
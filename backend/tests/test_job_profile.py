@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+from app.services import job_profile
+from app.services.job_profile import compile_job_profile, jd_hash
+from app.services.llm_explainer import TERM_MATCHER
+
+JD = "Backend developer: Python, FastAPI, Docker, AWS. 2+ years experience."
+
+
+def test_profile_holds_the_resume_independent_parts_of_the_jd():
+    profile = compile_job_profile(JD)
+
+    assert profile.jd_hash == jd_hash(JD)
+    assert profile.skills == {"python", "fastapi", "docker", "aws"}
+    assert profile.requires_experience
+    assert set(TERM_MATCHER.decode(profile.skill_bits)) == profile.skills
+    assert profile.total_weight == 4.0
+
+    resume_bits = TERM_MATCHER.encode(["python", "docker", "java"])
+    assert profile.matched_weight(resume_bits) == 2.0
+
+    assert not compile_job_profile("Sales lead, no tooling").requires_experience
+
+
+def test_profiles_are_memoized_by_job_description():
+    profile = compile_job_profile(JD)
+
+    assert compile_job_profile(JD) is profile
+    assert compile_job_profile(JD + " ") is not profile
+
+    with_embedding = compile_job_profile(JD, with_embedding=True)
+    assert with_embedding.embedding is not None
+    assert with_embedding == profile
+    # the embedding is kept for later callers that do not ask for it
+    assert compile_job_profile(JD) is with_embedding
+
+
+def test_profile_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(
+        job_profile, "get_settings",
+        lambda: SimpleNamespace(JOB_PROFILE_CACHE_SIZE=2)
+    )
+    monkeypatch.setattr(job_profile, "_profiles", type(job_profile._profiles)())
+
+    first = compile_job_profile("first python role")
+    compile_job_profile("second java role")
+    compile_job_profile("first python role")      # most recent again
+    compile_job_profile("third sql role")
+
+    assert list(job_profile._profiles) == [
+        jd_hash("first python role"), jd_hash("third sql role")
+    ]
+    assert compile_job_profile("first python role") is first
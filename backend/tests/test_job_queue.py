@@ -0,0 +1,77 @@
+import io
+import time
+
+from fastapi import UploadFile
+
+from app.services.job_queue import JobQueue
+
+JD = "Backend engineer: Python, FastAPI and Docker"
+RESUME = b"Jane Doe\nSkills: Python, FastAPI, Docker\n3 years at Acme"
+
+
+def upload(name):
+    return UploadFile(file=io.BytesIO(RESUME), filename=name)
+
+
+def counting(queue, processed):
+    process = queue._process
+
+    def wrapper(filename, path, job_description):
+        processed.append(filename)
+        return process(filename, path, job_description)
+
+    queue._process = wrapper
+    return queue
+
+
+def wait_until_completed(queue, job_id, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = queue.status(job_id)
+        if status["status"] == "completed":
+            return status
+        time.sleep(0.05)
+    raise AssertionError(f"job not completed: {queue.status(job_id)}")
+
+
+def test_running_row_left_by_a_crash_is_processed_exactly_once(tmp_path):
+    directory = str(tmp_path)
+
+    crashed = JobQueue(directory, workers=0, lease_seconds=0.3)
+    job_id = crashed.submit(JD, [upload("a.txt"), upload("b.txt")])
+    claimed = crashed._claim()             # then the worker "dies"
+    assert claimed[2] == "a.txt"
+
+    processed = []
+    reopened = counting(
+        JobQueue(directory, workers=1, lease_seconds=0.3), processed
+    )
+
+    # still claimed by the crashed queue until its lease runs out
+    assert reopened.status(job_id)["running"] == 1
+    reopened.start()
+    try:
+        status = wait_until_completed(reopened, job_id)
+    finally:
+        reopened.stop()
+
+    assert sorted(processed) == ["a.txt", "b.txt"]
+    assert status["done"] == 2 and status["failed"] == 0
+    names = [r["candidate_name"] for r in reopened.results(job_id)["results"]]
+    assert sorted(names) == ["a.txt", "b.txt"]
+
+    # the crashed worker's late answer does not overwrite the result
+    assert not crashed._complete(job_id, claimed[1], None, "late")
+    assert reopened.status(job_id)["done"] == 2
+
+
+def test_unexpired_claims_of_another_queue_are_left_alone(tmp_path):
+    directory = str(tmp_path)
+
+    first = JobQueue(directory, workers=0, lease_seconds=60)
+    job_id = first.submit(JD, [upload("a.txt")])
+    assert first._claim() is not None
+
+    second = JobQueue(directory, workers=0, lease_seconds=60)
+    assert second._claim() is None
+    assert second.status(job_id)["running"] == 1
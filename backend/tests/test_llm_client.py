@@ -0,0 +1,143 @@
+import asyncio
+
+from app.services import llm_client
+from app.services.batch_runner import JobDescription, screen_file
+from app.services.job_profile import compile_job_profile
+from app.services.job_queue import JobQueue
+from app.services.llm_client import (
+    FakeLLMBackend,
+    LLMEvaluator,
+    LLMResponseCache,
+    parse_response,
+)
+from app.services.pipeline import analyze_resume
+from app.services.scoring_engine import default_weights
+
+JD = "Backend developer: Python, FastAPI, Docker, AWS. 2+ years experience."
+RESUMES = [
+    f"Experience\nAcme  2019 - 2023\nBuilt {skills} services"
+    for skills in ("Python", "Python and Docker", "FastAPI on AWS", "Java", "SQL")
+]
+
+
+def evaluator(backend, **options) -> LLMEvaluator:
+    options.setdefault("batch_size", 5)
+    options.setdefault("batch_wait", 0.01)
+    return LLMEvaluator(backend, cache=LLMResponseCache(100), **options)
+
+
+def test_fake_backend_batches_caches_and_joins_in_flight_calls():
+    backend = FakeLLMBackend(latency_seconds=0.01)
+    profile = compile_job_profile(JD)
+
+    async def scenario():
+        llm = evaluator(backend)
+
+        # the same resume twice in one batch is evaluated once
+        first = await asyncio.gather(
+            *(
+                llm.evaluate(profile, f"h{i}", text)
+                for i, text in enumerate(RESUMES)
+            ),
+            llm.evaluate(profile, "h0", RESUMES[0])
+        )
+        calls_after_first = backend.calls
+
+        again = await asyncio.gather(*(
+            llm.evaluate(profile, f"h{i}", text)
+            for i, text in enumerate(RESUMES)
+        ))
+        return first, calls_after_first, again
+
+    first, calls_after_first, again = asyncio.run(scenario())
+
+    assert calls_after_first == 1
+    assert backend.calls == 1                       # second round: cache
+    assert first[:5] == again
+    assert first[5] == first[0]
+    assert all(e["summary"].startswith("[fake-llm] ") for e in first)
+
+
+def test_partial_batch_is_flushed_after_the_wait():
+    backend = FakeLLMBackend(latency_seconds=0)
+    profile = compile_job_profile(JD)
+
+    async def scenario():
+        llm = evaluator(backend, batch_size=50, batch_wait=0.02)
+        return await asyncio.gather(*(
+            llm.evaluate(profile, f"h{i}", text)
+            for i, text in enumerate(RESUMES[:2])
+        ))
+
+    results = asyncio.run(scenario())
+
+    assert backend.calls == 1
+    assert all(r is not None for r in results)
+
+
+def test_timeout_falls_back_and_is_not_cached():
+    backend = FakeLLMBackend(latency_seconds=1.0)
+    profile = compile_job_profile(JD)
+    cache = LLMResponseCache(100)
+
+    async def scenario():
+        llm = LLMEvaluator(
+            backend, batch_size=1, timeout=0.05, cache=cache
+        )
+        return await llm.evaluate(profile, "h0", RESUMES[0])
+
+    assert asyncio.run(scenario()) is None
+    assert len(cache) == 0
+
+
+def test_fake_verdict_replaces_the_deterministic_base_score():
+    backend = FakeLLMBackend(latency_seconds=0)
+    profile = compile_job_profile(JD)
+    text = RESUMES[1]
+
+    answer = asyncio.run(backend.evaluate(JD, [("0", text)]))["0"]
+    answer["match_score"] = 12
+
+    result, features = analyze_resume(
+        "a.txt", text, JD, profile, llm_result=answer
+    )
+
+    assert features.llm.match_score == 12
+    assert result.breakdown.llm
+    assert result.breakdown.base_score == 12
+    assert result.explain().startswith("[fake-llm] ")
+
+
+def test_job_queue_and_batch_runner_use_the_llm_evaluator(
+    tmp_path, monkeypatch
+):
+    monkeypatch.setattr(
+        llm_client, "get_llm_backend", lambda: FakeLLMBackend(0)
+    )
+    path = tmp_path / "a.txt"
+    path.write_text(RESUMES[2])
+
+    queued = JobQueue(str(tmp_path / "jobs"), workers=0)._process(
+        "a.txt", str(path), JD
+    )
+    [row] = screen_file(
+        str(path), "a.txt", [JobDescription("role", JD)], default_weights()
+    )
+
+    assert queued["breakdown"]["llm"]
+    assert queued["explanation"].startswith("[fake-llm] ")
+    assert row["explanation"] == queued["explanation"]
+    assert row["final_score"] == queued["final_score"]
+
+
+def test_parse_response_drops_malformed_entries():
+    text = (
+        '```json\n[{"id": "0", "match_score": "140", "strengths": ["python"]},'
+        ' {"id": "1", "match_score": "n/a"}, {"match_score": 5}]\n```'
+    )
+
+    parsed = parse_response(text)
+
+    assert list(parsed) == ["0"]
+    assert parsed["0"]["match_score"] == 100
+    assert parsed["0"]["strengths"] == ["python"]
@@ -0,0 +1,29 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+JD = "Backend engineer: Python, FastAPI, PostgreSQL and Docker"
+RESUME = "Jane Doe\nSkills: Python, FastAPI, Docker\n3 years at Acme"
+
+
+def sample(text, name):
+    for line in text.splitlines():
+        if line.startswith(f"resume_screener_{name} "):
+            return float(line.split()[-1])
+    return 0.0
+
+
+def test_analyze_records_the_scoring_stage_in_the_api_process():
+    with TestClient(app) as client:
+        before = client.get("/metrics").text
+        client.post(
+            "/analyze",
+            data={"job_description": JD},
+            files=[("resumes", ("a.txt", RESUME.encode(), "text/plain"))],
+        ).raise_for_status()
+        after = client.get("/metrics").text
+
+    count = "analyze_resume_seconds_count"
+    assert sample(after, count) == sample(before, count) + 1
+    assert sample(after, "analyze_resume_in_flight") == 0
+    assert "evaluate_candidate_seconds" not in after
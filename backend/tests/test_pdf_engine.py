@@ -0,0 +1,71 @@
+import pytest
+
+from app.services.pdf_engine import (
+    ExtractionOptions,
+    count_pages,
+    merge_parsed,
+    parse_pdf_range,
+    plan_page_ranges,
+)
+from benchmarks.corpus import make_pdf
+
+# page 2 has no text layer (stands in for a scanned page)
+PAGES = [["page one"], [], ["page three"], ["page four"], ["page five"]]
+PDF = make_pdf(PAGES)
+
+
+@pytest.mark.parametrize("mode", ["layout", "fast"])
+def test_pages_without_text_are_skipped(mode):
+    parsed = parse_pdf_range(PDF, options=ExtractionOptions(mode=mode))
+
+    assert parsed.text == "page one\npage three\npage four\npage five"
+    assert parsed.pages == 4
+    assert parsed.total_pages == 5
+    assert parsed.skipped_pages == (2,)
+    assert not parsed.truncated
+
+
+def test_page_budget_truncates_and_reports_the_unread_pages():
+    parsed = parse_pdf_range(PDF, options=ExtractionOptions(max_pages=3))
+
+    assert parsed.text == "page one\npage three"
+    assert parsed.skipped_pages == (2, 4, 5)
+    assert parsed.truncated
+
+
+def test_char_budget_stops_reading_further_pages():
+    parsed = parse_pdf_range(PDF, options=ExtractionOptions(max_chars=5))
+
+    assert parsed.text == "page"
+    assert parsed.pages == 1
+    assert parsed.skipped_pages == (2, 3, 4, 5)
+    assert parsed.truncated
+
+
+def test_plan_covers_the_budgeted_span_in_contiguous_ranges():
+    assert plan_page_ranges(5, 2, ExtractionOptions()) == [(0, 3), (3, 5)]
+    assert plan_page_ranges(5, 8, ExtractionOptions(max_pages=2)) == [
+        (0, 1), (1, 2)
+    ]
+    assert plan_page_ranges(0, 4, ExtractionOptions()) == []
+
+
+@pytest.mark.parametrize("options", [
+    ExtractionOptions(),
+    ExtractionOptions(max_pages=4),
+    ExtractionOptions(max_chars=20),
+])
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_merged_ranges_match_a_sequential_parse(options, workers):
+    ranges = plan_page_ranges(count_pages(PDF), workers, options)
+    parts = [parse_pdf_range(PDF, start, stop, options) for start, stop in ranges]
+
+    merged = merge_parsed(parts, options)
+    sequential = parse_pdf_range(PDF, options=options)
+
+    assert merged.text == sequential.text
+    assert merged.total_pages == sequential.total_pages
+    assert merged.truncated == sequential.truncated
+    if not options.max_chars:
+        assert merged.pages == sequential.pages
+        assert merged.skipped_pages == sequential.skipped_pages
@@ -0,0 +1,181 @@
+import random
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import llm_explainer
+from app.services.job_profile import compile_job_profile
+from app.services.llm_explainer import TERM_MATCHER
+from app.services.pipeline import analyze_resume
+from app.services.ranking import TopKRanking, top_k_indices
+from app.services.scoring_engine import (
+    CandidateFeatures,
+    CandidateResult,
+    ScoringWeights,
+    features_final_score,
+    final_score_bound,
+)
+
+
+def reference(scores, top_k=None, min_score=None):
+    rows = [
+        i for i, score in enumerate(scores)
+        if min_score is None or score >= min_score
+    ]
+    rows.sort(key=lambda i: (-scores[i], i))
+    return rows[:top_k] if top_k is not None else rows
+
+
+def test_streaming_ranking_matches_a_full_sort():
+    rng = random.Random(3)
+
+    for _ in range(50):
+        scores = [rng.randint(0, 20) for _ in range(rng.randint(1, 60))]
+        top_k = rng.choice([None, 1, 5, 10])
+        min_score = rng.choice([None, 5, 15])
+        if top_k is None and min_score is None:
+            top_k = 3
+
+        ranking = TopKRanking(top_k, min_score)
+        cutoffs = []
+
+        # completion order differs from upload order
+        order = list(range(len(scores)))
+        rng.shuffle(order)
+        for index in order:
+            ranking.offer(index, CandidateResult(f"r{index}", scores[index]))
+            cutoffs.append(ranking.cutoff() or 0)
+
+        expected = reference(scores, top_k, min_score)
+        assert [r.candidate_name for r in ranking.ranked()] == [
+            f"r{i}" for i in expected
+        ]
+        assert ranking.pruned == len(scores) - len(expected)
+        assert cutoffs == sorted(cutoffs)           # the cutoff only rises
+
+
+def test_top_k_indices_matches_the_streaming_order():
+    rng = np.random.default_rng(5)
+
+    for top_k, min_score in [(10, None), (None, 50), (7, 40), (500, None)]:
+        scores = rng.integers(0, 100, size=300)
+        assert top_k_indices(scores, top_k, min_score).tolist() == reference(
+            scores.tolist(), top_k, min_score
+        )
+
+
+def test_pruned_and_duplicate_results_are_not_ranked():
+    ranking = TopKRanking(top_k=5)
+
+    assert not ranking.offer(0, CandidateResult("a", 90, pruned=True))
+    assert not ranking.offer(1, CandidateResult("b", 95, duplicate_of="c"))
+    assert ranking.offer(2, CandidateResult("c", 95))
+    assert [r.candidate_name for r in ranking.ranked()] == ["c"]
+
+
+# -------------------------------------------------
+# Skill-overlap bound (pruning before feature extraction)
+# -------------------------------------------------
+JD = (
+    "Senior backend engineer, 5+ years of experience.\n"
+    "Python, Django, SQL, Docker, AWS and machine learning."
+)
+STRONG = (
+    "Experience\n"
+    "Backend engineer, Acme, Jan 2015 - present\n"
+    "Built Django services in Python on AWS with Docker and SQL.\n"
+)
+WEAK = "Skills\nExcel, Word\n"
+
+
+@pytest.mark.parametrize("weights", [
+    ScoringWeights(),
+    ScoringWeights(experience_gate=False, listed_skill_weight=1.5),
+    ScoringWeights(similarity_points=15, skill_weight=0.7, gap_penalty=0),
+])
+def test_overlap_bound_is_never_below_the_final_score(weights):
+    rng = random.Random(7)
+    n_terms = len(TERM_MATCHER.vocabulary)
+
+    for _ in range(500):
+        jd = rng.getrandbits(n_terms)
+        resume = rng.getrandbits(n_terms) if rng.random() < 0.9 else 0
+        matched = jd & resume
+        matched_weight = float(matched.bit_count()) * rng.choice([1, 1.5])
+        features = CandidateFeatures(
+            matched_bits=matched,
+            missing_bits=jd & ~resume,
+            matched_weight=matched_weight,
+            total_weight=float(jd.bit_count()) * 1.5,
+            has_terms=bool(resume),
+            years=rng.choice([0, 1, 3, 10]),
+            has_experience=rng.random() < 0.7,
+            requires_experience=rng.random() < 0.5,
+            similarity=rng.choice([None, rng.random()]),
+            evidenced_weight=rng.choice([None, matched_weight * rng.random()]),
+        )
+        overlap = features._replace(
+            years=0, has_experience=False, similarity=None,
+            evidenced_weight=None,
+        )
+
+        assert final_score_bound(overlap, weights) >= features_final_score(
+            features, weights
+        )
+
+
+def test_candidates_below_the_bound_are_not_segmented(monkeypatch):
+    profile = compile_job_profile(JD)
+    weights = ScoringWeights()
+    segmented = []
+
+    original = llm_explainer.segment_resume
+    monkeypatch.setattr(
+        llm_explainer, "segment_resume",
+        lambda text, *args, **kwargs: (
+            segmented.append(text) or original(text, *args, **kwargs)
+        )
+    )
+
+    result, features = analyze_resume("weak", WEAK, JD, profile, weights, cutoff=60)
+    assert result.pruned and result.final_score < 60
+    assert features is None         # nothing partial to store
+    assert segmented == []
+
+    # a candidate that can still make it is scored exactly as without a cutoff
+    kept, kept_features = analyze_resume(
+        "strong", STRONG, JD, profile, weights, cutoff=60
+    )
+    full, full_features = analyze_resume("strong", STRONG, JD, profile, weights)
+    assert segmented == [STRONG, STRONG]
+    assert not kept.pruned and kept.final_score == full.final_score >= 60
+    assert kept_features == full_features
+
+
+def test_bound_pruned_candidates_are_not_stored_for_rescoring():
+    files = [
+        ("resumes", ("strong.txt", STRONG.encode(), "text/plain")),
+        ("resumes", ("weak.txt", WEAK.encode(), "text/plain")),
+    ]
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/analyze",
+            data={"job_description": JD, "min_score": "60"},
+            files=files,
+        ).json()
+
+        assert [r["candidate_name"] for r in response["results"]] == [
+            "strong.txt"
+        ]
+        assert response["pruned"] == 1 and response["unstored"] == 1
+
+        rescored = client.post(
+            f"/results/{response['result_set_id']}/rescore",
+            json={"experience_gate": False},
+        ).json()
+
+    assert rescored["total_candidates"] == 1
+    assert [r["candidate_name"] for r in rescored["results"]] == ["strong.txt"]
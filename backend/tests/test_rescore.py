@@ -0,0 +1,140 @@
+import random
+
+import numpy as np
+import pytest
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.llm_explainer import TERM_MATCHER
+from app.services.pipeline import rescore_results
+from app.services.result_store import ResultStore, get_result_store
+from app.services.scoring_engine import (
+    CandidateFeatures,
+    LLMEvaluation,
+    ScoringWeights,
+    base_match_score,
+    feature_matrix,
+    features_final_score,
+    render_explanation,
+    score_breakdown,
+    score_candidate,
+    score_features_batch,
+)
+
+N_TERMS = len(TERM_MATCHER.vocabulary)
+
+
+def random_features(rng: random.Random) -> CandidateFeatures:
+    jd = rng.getrandbits(N_TERMS)
+    resume = rng.getrandbits(N_TERMS)
+    matched = jd & resume
+    total = float(jd.bit_count())
+    matched_weight = float(matched.bit_count())
+
+    return CandidateFeatures(
+        matched_bits=matched,
+        missing_bits=jd & ~resume,
+        matched_weight=matched_weight,
+        total_weight=total,
+        has_terms=bool(resume),
+        years=rng.choice([0, 1, 2, 3, 8]),
+        has_experience=rng.random() < 0.7,
+        requires_experience=rng.random() < 0.5,
+        similarity=rng.choice([None, rng.random()]),
+        llm=(
+            LLMEvaluation(rng.randint(0, 100), ("python",), (), "llm")
+            if rng.random() < 0.2 else None
+        ),
+        evidenced_weight=rng.choice(
+            [None, matched_weight * rng.random()]
+        ),
+    )
+
+
+WEIGHTS = [
+    ScoringWeights(),
+    ScoringWeights(experience_gate=False, listed_skill_weight=0.3),
+    ScoringWeights(similarity_points=15, skill_weight=0.7, max_bonus=4),
+    ScoringWeights(strong_threshold=90, moderate_threshold=50, weak_threshold=10),
+]
+
+
+@pytest.mark.parametrize("weights", WEIGHTS)
+def test_vectorized_rescore_matches_the_scalar_path(weights):
+    rng = random.Random(11)
+    features = [random_features(rng) for _ in range(400)] + [None]
+
+    base, final, verdicts = score_features_batch(
+        feature_matrix(features), weights
+    )
+
+    for i, f in enumerate(features):
+        if f is None:
+            assert final[i] == 0
+            continue
+
+        result = score_candidate("c", f, weights)
+        assert final[i] == result.final_score
+        assert verdicts[i] == result.verdict
+        assert features_final_score(f, weights) == result.final_score
+        if f.llm is None:
+            assert base[i] == base_match_score(f, weights)
+
+
+def test_stored_features_rescore_like_the_originals(tmp_path):
+    rng = random.Random(2)
+    features = [random_features(rng) for _ in range(50)] + [None]
+    names = [f"r{i}" for i in range(len(features))]
+    weights = ScoringWeights(skill_weight=0.6)
+
+    store = ResultStore(str(tmp_path))
+    set_id = store.save("jd", weights.to_dict(), list(zip(names, features)))
+    loaded = store.load(set_id)
+
+    original = rescore_results(names, features, weights)
+    reloaded = rescore_results(loaded.names, loaded.features, weights)
+    assert [r.to_dict() for r in reloaded] == [r.to_dict() for r in original]
+
+    top = rescore_results(loaded.names, loaded.features, weights, top_k=5)
+    best = sorted(
+        range(len(original)), key=lambda i: (-original[i].final_score, i)
+    )[:5]
+    assert [r.candidate_name for r in top] == [names[i] for i in best]
+    assert np.all(np.diff([r.final_score for r in top]) <= 0)
+
+
+def test_explanation_grades_with_the_scoring_thresholds():
+    features = random_features(random.Random(3))._replace(llm=None)
+    breakdown = score_breakdown(features, ScoringWeights())._replace(
+        base_score=70, gated=False
+    )
+
+    def grade(weights):
+        return render_explanation(breakdown, (), (), weights).split(".")[0]
+
+    assert grade(ScoringWeights()).startswith("Partially suitable")
+    assert grade(ScoringWeights(strong_threshold=70)).startswith("Suitable")
+    assert grade(
+        ScoringWeights(moderate_threshold=75, weak_threshold=10)
+    ).startswith("Currently not suitable")
+
+    # lazily rendered explanations keep the weights they were scored with
+    lenient = ScoringWeights(strong_threshold=0, moderate_threshold=0,
+                             weak_threshold=0, experience_gate=False)
+    result = score_candidate("c", features, lenient)
+    assert result.explain().startswith("Suitable")
+
+
+def test_rescore_ignores_stored_weight_fields_it_does_not_know():
+    features = random_features(random.Random(5))
+    stored = {**ScoringWeights(max_bonus=4).to_dict(), "retired_knob": 1.5}
+    set_id = get_result_store().save("jd", stored, [("a.txt", features)])
+
+    with TestClient(app) as client:
+        response = client.post(f"/results/{set_id}/rescore")
+
+    assert response.status_code == 200
+    [result] = response.json()["results"]
+    expected = score_candidate("a.txt", features, ScoringWeights(max_bonus=4))
+    assert result["final_score"] == expected.final_score
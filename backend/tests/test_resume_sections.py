@@ -0,0 +1,104 @@
+from datetime import date
+
+from app.services.llm_explainer import (
+    TERM_MATCHER,
+    extract_years,
+    resume_has_experience,
+)
+from app.services.pipeline import analyze_resume
+from app.services.resume_sections import segment_resume
+
+JD = "Senior Python developer with 3+ years experience in Docker, AWS and SQL"
+TODAY = date(2026, 6, 1)
+
+
+# ---------- resumes without section headings ----------
+def test_headerless_years_claim_counts_anywhere():
+    text = (
+        "Worked at Acme Corp as a Python developer for 2 years "
+        "using Docker and AWS."
+    )
+
+    assert extract_years(text) == 2
+    assert resume_has_experience(text)
+    assert analyze_resume("acme.txt", text, JD)[0].final_score == 75
+
+
+def test_headerless_experience_words_pass_the_gate():
+    text = (
+        "Internship at Google: built machine learning models "
+        "with Python and TensorFlow."
+    )
+
+    assert resume_has_experience(text)
+    assert extract_years(text) == 0
+    assert analyze_resume("google.txt", text, JD)[0].final_score == 30
+
+
+def test_headerless_without_experience_is_gated():
+    text = "Python developer. Docker, AWS."
+
+    assert not resume_has_experience(text)
+    assert analyze_resume("plain.txt", text, JD)[0].final_score == 0
+
+
+# ---------- sectioned resumes ----------
+def test_loose_claim_outside_experience_ignored_when_sectioned():
+    text = (
+        "Education\n"
+        "BSc Computer Science, 4 years programme\n"
+        "Skills\n"
+        "Python, Docker\n"
+    )
+
+    sections = segment_resume(text, TERM_MATCHER, TODAY)
+
+    assert sections.sections == ("education", "skills")
+    assert sections.stated_years == 0
+    assert not sections.has_experience
+
+
+def test_dated_experience_merges_overlaps():
+    text = (
+        "Experience\n"
+        "Acme  Jan 2020 - Dec 2021\n"
+        "Globex  Jan 2021 - Dec 2022\n"
+        "Skills\n"
+        "Python\n"
+    )
+
+    sections = segment_resume(text, TERM_MATCHER, TODAY)
+
+    assert sections.experience_months == 36
+    assert sections.years == 3
+
+
+def test_listed_only_skills_are_not_evidenced():
+    text = (
+        "Skills\n"
+        "Python, Docker\n"
+        "Experience\n"
+        "Acme  2020 - 2023\n"
+        "Built services in Python\n"
+    )
+
+    sections = segment_resume(text, TERM_MATCHER, TODAY)
+
+    assert TERM_MATCHER.decode(sections.skill_bits) == ("docker", "python")
+    assert TERM_MATCHER.decode(sections.evidenced_bits) == ("python",)
+
+
+def test_sections_line_up_with_spans_after_expanding_lowercase():
+    # "İ".lower() is two characters: heading offsets must not drift
+    text = (
+        "İ" * 40 + " İstanbul\n"
+        "Skills\n"
+        "Docker\n"
+        "Experience\n"
+        "Python services at Acme\n"
+    )
+
+    sections = segment_resume(text, TERM_MATCHER, TODAY)
+
+    assert sections.sections == ("skills", "experience")
+    assert TERM_MATCHER.decode(sections.evidenced_bits) == ("python",)
@@ -0,0 +1,121 @@
+import dataclasses
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.job_profile import compile_job_profile
+from app.services.llm_explainer import extract_features, extract_terms
+from app.services.scoring_engine import (
+    CandidateResult,
+    ScoringWeights,
+    calculate_final_score,
+    default_weights,
+    evaluate_features,
+    score_breakdown,
+    score_candidate,
+)
+
+JD = "Backend developer: Python, FastAPI, Docker, AWS. 2+ years experience."
+RESUME = (
+    "Experience\nAcme  2019 - 2023\n"
+    "Built Python services shipped with Docker, some Java"
+)
+
+
+def test_feature_skills_are_the_jd_and_resume_set_operations():
+    features = extract_features(RESUME, compile_job_profile(JD))
+    jd, resume = extract_terms(JD), extract_terms(RESUME)
+
+    assert set(features.matched) == jd & resume == {"python", "docker"}
+    assert set(features.missing) == jd - resume == {"aws", "fastapi"}
+    assert features.matched_weight == 2.0
+    assert features.total_weight == 4.0
+
+
+def test_score_candidate_matches_the_dict_pipeline():
+    weights = default_weights()
+    features = extract_features(RESUME, compile_job_profile(JD))
+
+    result = score_candidate("a.txt", features, weights)
+    expected = calculate_final_score(
+        evaluate_features(features, weights), RESUME, JD, weights
+    )
+
+    payload = result.to_dict()
+    for key in ("final_score", "verdict", "strengths", "gaps", "explanation"):
+        assert payload[key] == expected[key]
+    assert payload["candidate_name"] == "a.txt"
+    assert set(payload) == {
+        "candidate_name", "final_score", "verdict", "strengths", "gaps",
+        "explanation", "experience_match", "project_relevance", "breakdown",
+    }
+
+
+def test_candidate_result_is_frozen_and_slotted():
+    result = CandidateResult("a.txt", 50)
+
+    assert not hasattr(result, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        result.final_score = 60
+
+    assert result.to_dict(explain=False) == {
+        "candidate_name": "a.txt",
+        "final_score": 50,
+        "verdict": "Poor Match",
+        "strengths": [],
+        "gaps": [],
+    }
+
+
+@pytest.mark.parametrize("resume", [
+    RESUME,
+    "Python FastAPI Docker AWS expert",          # no dated experience
+    "Pastry chef",
+])
+@pytest.mark.parametrize("gate", [True, False])
+def test_breakdown_components_add_up_to_the_scores(resume, gate):
+    weights = ScoringWeights(experience_gate=gate)
+    features = extract_features(resume, compile_job_profile(JD))
+    breakdown = score_breakdown(features, weights)
+
+    points = (
+        breakdown.skill_points + breakdown.project_points
+        + breakdown.experience_points + breakdown.similarity_points
+    )
+    if breakdown.gated:
+        assert gate and breakdown.base_score == 0
+    else:
+        assert breakdown.base_score == int(min(points, 100))
+
+    assert breakdown.final_score == max(0, min(100, int(
+        breakdown.base_score + breakdown.bonus - breakdown.penalty
+    )))
+    assert score_candidate("a", features, weights).final_score == (
+        breakdown.final_score
+    )
+
+
+def test_analyze_reports_positions_and_can_skip_explanations():
+    resume = "Summary\nBackend work.\n\n" + RESUME
+    files = [("resumes", ("a.txt", resume.encode(), "text/plain"))]
+
+    with TestClient(app) as client:
+        explained = client.post(
+            "/analyze", data={"job_description": JD}, files=files
+        ).json()["results"][0]
+        terse = client.post(
+            "/analyze",
+            data={"job_description": JD, "explain": "false"},
+            files=files,
+        ).json()["results"][0]
+
+    assert explained["explanation"]
+    assert "explanation" not in terse
+    assert terse["final_score"] == explained["final_score"]
+
+    positions = terse["breakdown"]["matched_positions"]
+    assert set(positions) == {"python", "docker"}
+    for term, spans in positions.items():
+        for start, end in spans:
+            assert resume[start:end].lower() == term
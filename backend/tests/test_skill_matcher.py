@@ -0,0 +1,56 @@
+from app.services.llm_explainer import MODELS, SKILLS, TERM_MATCHER, extract_terms
+from app.services.skill_matcher import get_matcher
+
+
+def test_matches_on_word_boundaries_only():
+    assert extract_terms("Maintained digital platforms") == set()
+    assert extract_terms("Used Git and scikit learn for ML") == {
+        "git", "scikit-learn", "ml"
+    }
+
+
+def test_overlapping_phrases_are_all_reported():
+    matches = list(TERM_MATCHER.finditer("Deep Learning and Machine Learning"))
+
+    assert ("deep learning", 0, 13) in matches
+    assert ("machine learning", 18, 34) in matches
+
+
+def test_offsets_point_into_the_original_text():
+    # "İ".lower() is two characters; offsets must not drift after it
+    text = "İstanbul office: Python, Docker; İzmir: AWS"
+
+    for term, start, end in TERM_MATCHER.finditer(text):
+        assert text[start:end].lower() == term
+
+
+def test_custom_dictionary():
+    dictionary = {"c++", "c#", "node js"}
+
+    assert extract_terms("C++ and C# on Node.js", dictionary) == {
+        "c++", "c#", "node js"
+    }
+    # compiled once per dictionary, not per call
+    assert get_matcher(frozenset(dictionary)) is get_matcher(
+        frozenset(set(dictionary))
+    )
+
+
+def test_default_dictionary_is_skills_and_models():
+    text = "Python and BERT with Docker"
+
+    assert extract_terms(text) == extract_terms(text, SKILLS | MODELS) == {
+        "python", "bert", "docker"
+    }
+
+
+def test_bitsets_round_trip_through_the_vocabulary():
+    text = "Python services on AWS with Docker; some Rust"
+    bits = TERM_MATCHER.find_bits(text)
+
+    assert bits == TERM_MATCHER.encode(TERM_MATCHER.find(text))
+    assert TERM_MATCHER.decode(bits) == ("aws", "docker", "python")
+    assert TERM_MATCHER.encode(["python", "not-a-skill"]) == (
+        TERM_MATCHER.encode(["python"])
+    )
+    assert TERM_MATCHER.decode(0) == ()
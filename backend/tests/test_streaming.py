@@ -0,0 +1,63 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+JD = "Backend developer: Python, FastAPI, Docker, AWS. 2+ years experience."
+RESUMES = {
+    "python.txt": "Experience\nAcme  2019 - 2023\nBuilt Python and Docker services",
+    "java.txt": "Experience\nInitech  2020 - 2022\nMaintained Java applications",
+}
+
+
+def upload(resumes):
+    return [
+        ("resumes", (name, text.encode(), "text/plain"))
+        for name, text in resumes
+    ]
+
+
+def test_stream_emits_one_frame_per_resume_then_a_summary():
+    resumes = [*RESUMES.items(), ("copy.txt", RESUMES["python.txt"])]
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/analyze/stream",
+            data={"job_description": JD},
+            files=upload(resumes),
+        )
+        batch = client.post(
+            "/analyze",
+            data={"job_description": JD},
+            files=upload(RESUMES.items()),
+        ).json()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    frames = [json.loads(line) for line in response.text.splitlines()]
+    *per_resume, summary = frames
+
+    assert sorted(frame["index"] for frame in per_resume) == [0, 1, 2]
+    [duplicate] = [f for f in per_resume if f["type"] == "duplicate"]
+    assert duplicate == {
+        "type": "duplicate",
+        "index": 2,
+        "candidate_name": "copy.txt",
+        "duplicate_of": "python.txt",
+    }
+
+    streamed = {
+        f["result"]["candidate_name"]: f["result"]["final_score"]
+        for f in per_resume if f["type"] == "result"
+    }
+    assert streamed == {
+        r["candidate_name"]: r["final_score"] for r in batch["results"]
+    }
+
+    assert summary["type"] == "summary"
+    assert summary["total_candidates"] == 3
+    assert summary["processed"] == 3
+    assert summary["unreadable"] == 0
+    assert summary["result_set_id"]
@@ -0,0 +1,86 @@
+from app.services.text_cache import TextCache
+
+
+def disk_cache(tmp_path, max_disk_bytes=100):
+    # memory tier too small to hold anything: every hit is a disk hit
+    return TextCache(1, str(tmp_path), max_disk_bytes)
+
+
+def test_disk_hits_do_not_write_until_a_batch_is_full(tmp_path):
+    cache = disk_cache(tmp_path, 10_000)
+    for i in range(cache.TOUCH_BATCH):
+        cache.put(f"k{i}", "text")
+
+    writes = cache._db.total_changes
+    for i in range(cache.TOUCH_BATCH - 1):
+        assert cache.get(f"k{i}") == "text"
+    assert cache._db.total_changes == writes
+
+    cache.get(f"k{cache.TOUCH_BATCH - 1}")
+    assert cache._db.total_changes == writes + cache.TOUCH_BATCH
+
+
+def test_eviction_uses_queued_access_times_and_a_running_total(tmp_path):
+    cache = disk_cache(tmp_path)
+    for key in "abcd":
+        cache.put(key, key * 25)
+    assert cache._disk_bytes == 100
+
+    cache.get("a")                  # queued, not yet written
+    cache.put("b", "b" * 25)        # replacing a row keeps the total
+    assert cache._disk_bytes == 100
+
+    cache.put("e", "e" * 25)
+    assert cache.get("c") is None   # least recently used
+    assert cache.get("a") == "a" * 25
+    assert cache._disk_bytes == cache._disk_total() == 100
+
+    reopened = disk_cache(tmp_path)
+    assert reopened._disk_bytes == 100
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = TextCache(30)
+    for key in "abc":
+        cache.put(key, key * 10)
+
+    assert cache.get("a") == "a" * 10   # a is now most recent
+    cache.put("d", "d" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 10
+    assert cache.get("c") == "c" * 10
+    assert cache.get("d") == "d" * 10
+
+    stats = cache.stats()
+    assert stats["memory_entries"] == 3
+    assert stats["memory_bytes"] == 30
+    assert stats["evictions"] == 1
+
+
+def test_text_larger_than_the_memory_tier_is_not_kept():
+    cache = TextCache(5)
+    cache.put("k", "too long for memory")
+
+    assert cache.get("k") is None
+    assert cache.stats()["memory_entries"] == 0
+
+
+def test_hit_and_miss_counters(tmp_path):
+    cache = TextCache(1000, str(tmp_path), 10_000)
+    cache.put("k", "text")
+
+    assert cache.get("k") == "text"
+    assert cache.get("missing") is None
+
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) \
+        == (1, 0, 1)
+
+    reopened = TextCache(1000, str(tmp_path), 10_000)
+    assert reopened.get("k") == "text"  # from disk, promoted to memory
+    assert reopened.get("k") == "text"  # now from memory
+
+    stats = reopened.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) \
+        == (1, 1, 0)
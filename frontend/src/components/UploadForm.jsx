@@ -22,7 +22,7 @@ export default function UploadForm({ onAnalyze }) {
     }
 
     if (files.length === 0) {
-      setError("Please upload at least one resume (PDF).");
+      setError("Please upload at least one resume.");
       return;
     }
 
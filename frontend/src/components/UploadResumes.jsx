@@ -4,6 +4,7 @@ export default function UploadResumes({ onFilesChange }) {
   const [files, setFiles] = useState([]);
   const [error, setError] = useState("");
   const MAX_SIZE_MB = 5;
+  const ACCEPTED_EXTENSIONS = [".pdf", ".docx", ".html", ".htm", ".txt"];
 
   const handleChange = (e) => {
     setError("");
@@ -13,8 +14,9 @@ export default function UploadResumes({ onFilesChange }) {
     const rejectedFiles = [];
 
     selectedFiles.forEach((file) => {
-      if (file.type !== "application/pdf") {
-        rejectedFiles.push(`${file.name} (Not a PDF)`);
+      const name = file.name.toLowerCase();
+      if (!ACCEPTED_EXTENSIONS.some((ext) => name.endsWith(ext))) {
+        rejectedFiles.push(`${file.name} (Unsupported format)`);
       } else if (file.size > MAX_SIZE_MB * 1024 * 1024) {
         rejectedFiles.push(`${file.name} (Exceeds ${MAX_SIZE_MB}MB)`);
       } else {
@@ -38,7 +40,7 @@ export default function UploadResumes({ onFilesChange }) {
       <label className="upload-label">
         Upload Resumes
         <span className="hint">
-          PDF only · Max {MAX_SIZE_MB}MB per file
+          PDF, DOCX, HTML or TXT · Max {MAX_SIZE_MB}MB per file
         </span>
       </label>
 
@@ -46,7 +48,7 @@ export default function UploadResumes({ onFilesChange }) {
       <label className="file-drop">
         <input
           type="file"
-          accept=".pdf"
+          accept={ACCEPTED_EXTENSIONS.join(",")}
           multiple
           onChange={handleChange}
           aria-label="Upload resumes"
@@ -57,7 +59,7 @@ export default function UploadResumes({ onFilesChange }) {
             Click to upload or drag & drop
           </span>
           <span className="file-sub-text">
-            Upload one or more PDF resumes
+            Upload one or more resumes
           </span>
         </div>
       </label>
@@ -31,7 +31,7 @@ export default function Dashboard() {
     }
 
     if (files.length === 0) {
-      setError("Please upload at least one resume (PDF).");
+      setError("Please upload at least one resume.");
       return;
     }
 
@@ -88,10 +88,10 @@ export default function Dashboard() {
 
           <div className="upload-row">
             <label className="file-upload">
-              Upload Resumes (PDF)
+              Upload Resumes (PDF, DOCX, HTML, TXT)
               <input
                 type="file"
-                accept=".pdf"
+                accept=".pdf,.docx,.html,.htm,.txt"
                 multiple
                 onChange={(e) =>
                   setFiles(Array.from(e.target.files))